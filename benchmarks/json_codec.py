@@ -0,0 +1,114 @@
+"""
+Load and save throughput of the JSON codecs, on a synthetic tournament archive.
+
+The archive is made of copies of a finished 8-player, 4-round tournament.
+Each configuration saves it to a file, then loads it back:
+
+- json (indent=2): the previous write path, indented by the standard module.
+- json: the standard module, compact output.
+- orjson: orjson, compact output (when installed).
+
+Usage:
+    python -m benchmarks.json_codec [--tournaments 10000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from infra.utils.json_codec import JSONCodec, OrjsonCodec, orjson
+
+PLAYER_IDS = ["AB12345", "AB67890", "CD12345", "CD67890", "EF12345", "EF67890", "GH12345", "GH67890"]
+
+
+def make_tournament(index: int) -> dict:
+    """Return the dictionary of a finished tournament, as stored in tournaments.json."""
+    tournament_id = f"T{index + 1:05d}"
+    rounds = []
+    for round_number in range(1, 5):
+        matches = []
+        for table in range(4):
+            player1 = PLAYER_IDS[(table * 2 + round_number) % 8]
+            player2 = PLAYER_IDS[(table * 2 + round_number + 1) % 8]
+            score1 = (0.0, 0.5, 1.0)[(index + table + round_number) % 3]
+            matches.append({
+                "player1_id": player1,
+                "player2_id": player2,
+                "player1_score": score1,
+                "player2_score": 1.0 - score1
+            })
+        rounds.append({
+            "name": f"Round{round_number}",
+            "matches": matches,
+            "start_datetime": "2025-07-09T15:26:18.801562",
+            "end_datetime": "2025-07-09T15:26:36.945143",
+            "round_id": f"{tournament_id}Round{round_number}"
+        })
+
+    return {
+        "name": f"Tournoi d'échecs n°{index + 1}",
+        "location": "Paris",
+        "start_date": "09-07-2025",
+        "end_date": "20-07-2025",
+        "number_of_rounds": 4,
+        "current_round_number": 4,
+        "status": "Terminé",
+        "rounds": rounds,
+        "players": list(PLAYER_IDS),
+        "scores": {player_id: 2.0 for player_id in PLAYER_IDS},
+        "description": "Tournoi généré pour la mesure des performances.",
+        "tournament_id": tournament_id,
+        "version": 4
+    }
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Return the best duration of function(), in seconds, over repeat runs."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tournaments", type=int, default=10_000, help="Tournaments in the archive.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measure (the best one is kept).")
+    args = parser.parse_args()
+
+    archive: List[dict] = [make_tournament(index) for index in range(args.tournaments)]
+
+    def dumps_indented(value):
+        return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+
+    configurations = [("json (indent=2)", dumps_indented, JSONCodec()), ("json", None, JSONCodec())]
+    if orjson is not None:
+        configurations.append(("orjson", None, OrjsonCodec()))
+
+    print(f"{args.tournaments} tournois")
+    print(f"{'Codec':<16} {'size (MB)':>10} {'save (ms)':>10} {'load (ms)':>10} {'saves/s':>8} {'loads/s':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, dumps, codec in configurations:
+            dumps = dumps or codec.dumps
+            path = os.path.join(directory, "tournaments.json")
+
+            def save():
+                with open(path, "wb") as file:
+                    file.write(dumps(archive))
+
+            save_time = best_time(save, args.repeat)
+            load_time = best_time(lambda: codec.load_file(path), args.repeat)
+            assert codec.load_file(path) == archive
+
+            size = os.path.getsize(path) / 1_000_000
+            print(f"{name:<16} {size:>10.1f} {save_time * 1000:>10.0f} {load_time * 1000:>10.0f} "
+                  f"{1 / save_time:>8.1f} {1 / load_time:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
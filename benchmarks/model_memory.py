@@ -0,0 +1,76 @@
+"""
+Memory benchmark of the domain models: bytes per match and per player.
+
+The slotted models are compared with replicas of their previous layout
+(per-instance __dict__, and a tuple of two lists for the match state).
+
+Usage:
+    python -m benchmarks.model_memory [--count 200000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List
+
+from domain.models.match import Match
+from domain.models.player import Player
+
+
+class DictPlayer:
+    """Previous layout of Player: attributes stored in a per-instance __dict__."""
+
+    def __init__(self, last_name, first_name, birth_date, national_chess_id):
+        self.last_name = last_name
+        self.first_name = first_name
+        self.birth_date = birth_date
+        self.national_chess_id = national_chess_id
+
+
+class DictMatch:
+    """Previous layout of Match: a __dict__ holding a tuple of two [player, score] lists."""
+
+    def __init__(self, player1, player2, player1_score=0.0, player2_score=0.0):
+        self.data = ([player1, player1_score], [player2, player2_score])
+
+
+def measure_bytes_per_object(factory: Callable[[int], object], count: int) -> float:
+    """Return the average number of bytes allocated by factory(i), over count objects."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects: List[object] = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The list holding the objects is not part of their cost.
+    list_size = objects.__sizeof__()
+    del objects
+    return (after - before - list_size) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000, help="Objects created per measure.")
+    count = parser.parse_args().count
+
+    # Strings are shared between objects, so that only the objects themselves are measured.
+    player_ids = [f"AB{i:05d}" for i in range(1000)]
+    last_name, first_name, birth_date = "Carlsen", "Magnus", "30-11-1990"
+
+    results = [
+        ("Player", DictPlayer, Player,
+         lambda cls: lambda i: cls(last_name, first_name, birth_date, player_ids[i % 1000])),
+        ("Match", DictMatch, Match,
+         lambda cls: lambda i: cls(player_ids[i % 1000], player_ids[(i + 1) % 1000], 1.0, 0.0)),
+    ]
+
+    print(f"{'Model':<8} {'before (B)':>12} {'after (B)':>12} {'saved':>8}")
+    for name, before_cls, after_cls, make_factory in results:
+        before = measure_bytes_per_object(make_factory(before_cls), count)
+        after = measure_bytes_per_object(make_factory(after_cls), count)
+        print(f"{name:<8} {before:>12.1f} {after:>12.1f} {1 - after / before:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Decoding time of tournaments.json into the domain models, on a synthetic archive.
+
+- from_dict: the file parsed by the JSON codec, then Tournament.from_dict.
+- schema: infra.utils.schema.decode_tournaments, which also validates every
+  field (with msgspec in a single pass when it is installed).
+- lazy: the same, as LazyTournament instances whose rounds are left
+  undecoded, as when a flow only reads the status or the players.
+- lazy + save: the lazy tournaments encoded back for saving, untouched
+  rounds being written as they were read.
+
+Usage:
+    python -m benchmarks.schema_decoding [--tournaments 10000] [--repeat 3]
+"""
+
+import argparse
+
+from benchmarks.json_codec import best_time, make_tournament
+from domain.models.tournament import Tournament
+from infra.utils.json_codec import get_default_codec
+from infra.utils.schema import decode_tournaments, msgspec
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tournaments", type=int, default=10_000, help="Tournaments in the archive.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measure (the best one is kept).")
+    args = parser.parse_args()
+
+    codec = get_default_codec()
+    data = codec.dumps([make_tournament(index) for index in range(args.tournaments)])
+
+    def from_dict():
+        return [Tournament.from_dict(tournament) for tournament in codec.loads(data)]
+
+    def schema():
+        return decode_tournaments(data, codec)
+
+    def lazy():
+        return decode_tournaments(data, codec, lazy=True)
+
+    def lazy_and_save():
+        return codec.dumps([tournament.to_dict() for tournament in lazy()])
+
+    assert [t.to_dict() for t in from_dict()] == [t.to_dict() for t in schema()]
+    assert codec.loads(lazy_and_save()) == codec.loads(data)
+
+    print(f"{args.tournaments} tournois, codec {codec.name}, msgspec {'oui' if msgspec else 'non'}")
+    for name, function in (
+            ("from_dict", from_dict), ("schema", schema), ("lazy", lazy), ("lazy + save", lazy_and_save)
+    ):
+        print(f"{name:<12} {best_time(function, args.repeat) * 1000:>8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
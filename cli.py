@@ -0,0 +1,54 @@
+"""
+Non-interactive entry point, for scripts and load tests.
+
+Usage (from the project root):
+    python cli.py [--backend json|sharded|journal|sqlite] COMMAND ...
+    python cli.py --help
+"""
+import argparse
+import sys
+from typing import List, Optional, Tuple
+
+from domain.ports.player_repository import IPlayerRepository
+from domain.ports.tournament_repository import ITournamentRepository
+from domain.views.command_line_view import CommandLineView
+from infra.repositories.journal_player_repository import JournalPlayerRepository
+from infra.repositories.journal_tournament_repository import JournalTournamentRepository
+from infra.repositories.json_player_repository import JSONPlayerRepository
+from infra.repositories.json_tournament_repository import JSONTournamentRepository
+from infra.repositories.sharded_json_tournament_repository import ShardedJSONTournamentRepository
+from infra.repositories.sqlite_player_repository import SQLitePlayerRepository
+from infra.repositories.sqlite_tournament_repository import SQLiteTournamentRepository
+from infra.repositories.unit_of_work import UnitOfWork
+from infra.utils.schema import SchemaError
+
+BACKENDS = ("json", "sharded", "journal", "sqlite")
+
+
+def create_repositories(backend: str) -> Tuple[IPlayerRepository, ITournamentRepository]:
+    """Return the player and tournament repositories of a persistence backend."""
+    if backend == "sqlite":
+        return SQLitePlayerRepository(), SQLiteTournamentRepository()
+    if backend == "journal":
+        return JournalPlayerRepository(), JournalTournamentRepository()
+    if backend == "sharded":
+        return JSONPlayerRepository(cached=True), ShardedJSONTournamentRepository()
+    return JSONPlayerRepository(cached=True), JSONTournamentRepository()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # The storage is chosen before the command is parsed, as the view is built on it.
+    backend_parser = argparse.ArgumentParser(add_help=False)
+    backend_parser.add_argument("--backend", choices=BACKENDS, default="json")
+    options, argv = backend_parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+
+    player_repository, tournament_repository = create_repositories(options.backend)
+    try:
+        unit_of_work = UnitOfWork(player_repository, tournament_repository)
+        return CommandLineView(player_repository, tournament_repository, unit_of_work).run(argv)
+    except SchemaError as error:
+        sys.exit(f"Fichier de données invalide : {error}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
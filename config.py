@@ -13,7 +13,18 @@ GENERATED_REPORTS_DIR = os.path.join(BASE_DIR, "generated_reports")
 PLAYERS_TEMPLATE_NAME = "players_report_template.html"
 TOURNAMENTS_TEMPLATE_NAME = "tournaments_report_template.html"
 TOURNAMENT_DETAILS_TEMPLATE_NAME = "tournament_details_report_template.html"
+TOURNAMENT_DETAILS_INDEX_TEMPLATE_NAME = "tournament_details_index_template.html"
+
+# Compiled templates, reused between runs
+JINJA_BYTECODE_CACHE_DIR = os.path.join(GENERATED_REPORTS_DIR, ".jinja_cache")
+
+# Fingerprints of the generated reports, for incremental builds
+REPORTS_MANIFEST_PATH = os.path.join(GENERATED_REPORTS_DIR, "reports_manifest.json")
 
 # Output files
 PLAYERS_REPORT_PATH = os.path.join(GENERATED_REPORTS_DIR, "players_report.html")
 TOURNAMENTS_REPORT_PATH = os.path.join(GENERATED_REPORTS_DIR, "tournaments_report.html")
+TOURNAMENT_DETAILS_INDEX_PATH = os.path.join(GENERATED_REPORTS_DIR, "tournament_details_index.html")
+
+# SQLite database (alternative persistence backend)
+SQLITE_DATABASE_PATH = os.path.join(BASE_DIR, "data", "chess_tournaments.db")
@@ -1,9 +1,21 @@
 """Handle player management operations."""
 
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, List, Optional, TextIO, Tuple
 
 from domain.models.player import Player
 from domain.ports.player_repository import IPlayerRepository
+from infra.utils.player_files import PlayerRow, write_players
+from infra.utils.validators import validate_player_rows
+
+
+class PlayerImportResult:
+    def __init__(self):
+        """Initialize the counters of a player import."""
+        self.imported_count = 0
+        self.existing_count = 0
+        self.duplicate_count = 0
+        self.rejected: List[Tuple[int, str]] = []
 
 
 class PlayerController:
@@ -21,7 +33,8 @@ class PlayerController:
             national_chess_id: str
     ) -> Player:
         """
-        Create and save a new player.
+        Create and save a new player. It is not saved if a player with the
+        same national_chess_id is already stored.
 
         Args:
             last_name (str): Player's last name.
@@ -38,11 +51,66 @@ class PlayerController:
             birth_date,
             national_chess_id
         )
-        players = self.repository.load_players()
-        players.append(player)
-        self.repository.save_players(players)
+        self.repository.add_players([player])
         return player
 
+    def import_players(self, rows: Iterable[PlayerRow], batch_size: int = 1000) -> "PlayerImportResult":
+        """
+        Import players from the records of a file, in a single write.
+
+        Records are consumed as a stream and checked by batches of
+        batch_size. Invalid records are rejected with their reason, and
+        only the first record of an ID, in the file or already stored, is
+        kept. The new players are then added at once.
+
+        Args:
+            rows (Iterable[PlayerRow]): Records with their line number, e.g.
+                from iter_player_rows().
+            batch_size (int): Number of records checked together.
+
+        Returns:
+            PlayerImportResult: Counts of imported and skipped players, and
+                the rejected lines.
+        """
+        result = PlayerImportResult()
+        new_players: List[Player] = []
+        seen_ids = set()
+
+        rows = iter(rows)
+        while batch := list(islice(rows, batch_size)):
+            errors = validate_player_rows([record for _, record in batch])
+            valid = []
+            for (line_number, record), error in zip(batch, errors):
+                if error is not None:
+                    result.rejected.append((line_number, error))
+                elif record["national_chess_id"] in seen_ids:
+                    result.duplicate_count += 1
+                else:
+                    seen_ids.add(record["national_chess_id"])
+                    valid.append(Player.from_dict(record))
+
+            existing = self.repository.get_many(player.national_chess_id for player in valid)
+            result.existing_count += len(existing)
+            new_players.extend(player for player in valid if player.national_chess_id not in existing)
+
+        if new_players:
+            result.imported_count = self.repository.add_players(new_players)
+        return result
+
+    def export_players(self, file: TextIO, file_format: str) -> int:
+        """
+        Write all players to a file, sorted by last name, as they are read
+        from the repository.
+
+        Args:
+            file (TextIO): File opened in text mode (with newline="" for CSV).
+            file_format (str): "csv" or "jsonl".
+
+        Returns:
+            int: The number of players written.
+        """
+        return write_players(self.repository.iter_players(), file, file_format)
+
     def list_players(self) -> List[Player]:
         """Return all players from the repository."""
         return self.repository.load_players()
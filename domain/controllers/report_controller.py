@@ -1,13 +1,30 @@
 """Handle player and tournament report generation operations."""
 
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
+from typing import Dict, Iterable, List, Optional, Set
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+from config import (
+    JINJA_BYTECODE_CACHE_DIR,
+    PLAYERS_TEMPLATE_NAME,
+    TEMPLATE_DIR,
+    TOURNAMENT_DETAILS_TEMPLATE_NAME,
+    TOURNAMENTS_TEMPLATE_NAME
+)
+from domain.models.player import Player
+from domain.models.tournament import Tournament
 from domain.ports.player_repository import IPlayerRepository
 from domain.ports.tournament_repository import ITournamentRepository
-from infra.utils.tournament_utils import tournament_with_loaded_players
+from infra.utils.report_manifest import ReportManifest, compute_report_fingerprint
+from infra.utils.standings import Standings, StandingsCache
+from infra.utils.tournament_utils import get_tournament_player_ids, tournament_with_loaded_players
+
+# Number of template chunks joined before each write of a streamed report.
+STREAM_BUFFER_SIZE = 256
 
 
 def format_french_datetime(value: datetime) -> str:
@@ -17,21 +34,239 @@ def format_french_datetime(value: datetime) -> str:
     return value.strftime("%d/%m/%Y à %Hh%M")
 
 
+def create_environment(template_dir: str, bytecode_cache_dir: Optional[str] = None) -> Environment:
+    """Create a Jinja2 environment for the report templates, with the format_fr filter."""
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html']),
+        bytecode_cache=bytecode_cache
+    )
+    env.filters["format_fr"] = format_french_datetime
+    return env
+
+
+def write_report(output_path: str, rendered_html: str) -> None:
+    """Write a rendered report, creating its directory if needed."""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as file:
+        file.write(rendered_html)
+
+
+def stream_report(output_path: str, template: Template, **context) -> None:
+    """
+    Render a report directly to its file, a few template chunks at a time.
+
+    Iterators passed in the context are consumed while the page is written,
+    so memory use does not depend on the number of rows of the report.
+    """
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    template_stream = template.stream(**context)
+    template_stream.enable_buffering(STREAM_BUFFER_SIZE)
+    template_stream.dump(output_path, encoding="utf-8")
+
+
+def get_report_player_ids(tournament: Tournament) -> Set[str]:
+    """Return the IDs of the players shown in the details report of a tournament."""
+    return get_tournament_player_ids(tournament) | set(tournament.scores)
+
+
+def get_details_report_path(output_dir: str, tournament_id: str) -> str:
+    """Return the path of the details report of a tournament."""
+    return os.path.normpath(os.path.join(output_dir, f"tournament_{tournament_id}_report.html"))
+
+
+def compute_details_report_fingerprint(
+        template: Template,
+        tournament: Tournament,
+        players_by_id: Dict[str, Player]
+) -> str:
+    """Return the fingerprint of the tournament, its players and the template of its details report."""
+    players_data = [
+        players_by_id[player_id].to_dict()
+        for player_id in sorted(get_report_player_ids(tournament))
+        if player_id in players_by_id
+    ]
+    return compute_report_fingerprint(template, tournament.to_dict(), players_data)
+
+
+def render_tournament_details_report(
+        template: Template,
+        tournament: Tournament,
+        players_by_id: Dict[str, Player],
+        output_dir: str,
+        standings: Optional[Standings] = None
+) -> str:
+    """
+    Render and write the details report of a tournament.
+
+    Args:
+        template (Template): Compiled details report template.
+        tournament (Tournament): Tournament with players as IDs.
+        players_by_id (Dict[str, Player]): Players of the tournament, by ID.
+        output_dir (str): Output directory for the report.
+        standings (Standings, optional): Standings of the tournament, built
+            from its rounds when not provided.
+
+    Returns:
+        str: Path to the generated HTML report.
+    """
+    tournament = tournament_with_loaded_players(
+        tournament=tournament,
+        player_repository=None,
+        players_by_id=players_by_id
+    )
+
+    tournament.players = sorted(
+        tournament.players,
+        key=lambda p: p.last_name.lower()
+    )
+
+    if standings is None:
+        standings = Standings.from_tournament(tournament)
+    ranking = [
+        standing for standing in standings.ranking(players_by_id)
+        if standing.player is not None
+    ]
+
+    rendered_html = template.render(tournament=tournament, ranking=ranking)
+
+    output_path = get_details_report_path(output_dir, tournament.tournament_id)
+    write_report(output_path, rendered_html)
+    return output_path
+
+
+# State of a report worker process, set once by _init_report_worker.
+_worker_state: dict = {}
+
+
+def _init_report_worker(
+        template_dir: str,
+        template_name: str,
+        bytecode_cache_dir: Optional[str],
+        output_dir: str,
+        players_by_id: Dict[str, Player]
+) -> None:
+    env = create_environment(template_dir, bytecode_cache_dir)
+    _worker_state["template"] = env.get_template(template_name)
+    _worker_state["output_dir"] = output_dir
+    _worker_state["players_by_id"] = players_by_id
+
+
+def _render_report_in_worker(tournament: Tournament) -> str:
+    return render_tournament_details_report(
+        _worker_state["template"],
+        tournament,
+        _worker_state["players_by_id"],
+        _worker_state["output_dir"]
+    )
+
+
+class BatchReportResult:
+    def __init__(
+            self,
+            report_paths: List[str],
+            index_path: str,
+            elapsed_seconds: float,
+            skipped_count: int = 0
+    ):
+        """
+        Initialize the result of a batch report generation.
+
+        Args:
+            report_paths (List[str]): Paths of all the reports, rendered or skipped.
+            index_path (str): Path of the index page.
+            elapsed_seconds (float): Duration of the whole batch.
+            skipped_count (int): Number of reports left untouched because
+                their inputs did not change.
+        """
+        self.report_paths = report_paths
+        self.index_path = index_path
+        self.elapsed_seconds = elapsed_seconds
+        self.skipped_count = skipped_count
+
+    @property
+    def reports_per_second(self) -> float:
+        """Return the number of reports generated per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return len(self.report_paths) / self.elapsed_seconds
+
+
 class ReportController:
     def __init__(
             self,
             player_repository: IPlayerRepository,
-            tournament_repository: ITournamentRepository
+            tournament_repository: ITournamentRepository,
+            template_dir: str = TEMPLATE_DIR,
+            bytecode_cache_dir: Optional[str] = JINJA_BYTECODE_CACHE_DIR,
+            precompile: bool = False,
+            report_manifest_path: Optional[str] = None
     ):
-        """Initialize the report controller with player and tournament repositories."""
+        """
+        Initialize the report controller with player and tournament repositories.
+
+        The Jinja2 environment of template_dir is created once and shared by
+        all reports, so each template is compiled once per process. Compiled
+        templates are also kept in bytecode_cache_dir between runs.
+
+        Args:
+            player_repository (IPlayerRepository): Source of the players.
+            tournament_repository (ITournamentRepository): Source of the tournaments.
+            template_dir (str): Directory containing the Jinja2 templates.
+            bytecode_cache_dir (str, optional): Directory of the bytecode cache,
+                or None to disable it.
+            precompile (bool): Compile the three report templates right away.
+            report_manifest_path (str, optional): Manifest of the fingerprints
+                of the generated details reports. When given, a details report
+                is only rendered again if its tournament, its players or its
+                template changed since it was last written.
+        """
         self.player_repository = player_repository
         self.tournament_repository = tournament_repository
+        self.bytecode_cache_dir = bytecode_cache_dir
+        self.report_manifest = ReportManifest(report_manifest_path) if report_manifest_path else None
+        self._environments: Dict[str, Environment] = {}
+        # Standings of the tournaments reported in this process, brought up
+        # to date with the rounds ended since the previous report.
+        self.standings_cache = StandingsCache()
+
+        self._get_environment(template_dir)
+        if precompile:
+            self.precompile_templates(template_dir)
+
+    def _get_environment(self, template_dir: str) -> Environment:
+        """Return the shared environment of a template directory, creating it on first use."""
+        template_dir = os.path.normpath(template_dir)
+        env = self._environments.get(template_dir)
+        if env is None:
+            env = create_environment(template_dir, self.bytecode_cache_dir)
+            self._environments[template_dir] = env
+        return env
+
+    def get_template(self, template_dir: str, template_name: str) -> Template:
+        """Return a compiled template from the shared environment of template_dir."""
+        return self._get_environment(template_dir).get_template(template_name)
+
+    def precompile_templates(self, template_dir: str = TEMPLATE_DIR) -> None:
+        """Compile the player, tournaments and tournament details templates."""
+        for template_name in (
+                PLAYERS_TEMPLATE_NAME,
+                TOURNAMENTS_TEMPLATE_NAME,
+                TOURNAMENT_DETAILS_TEMPLATE_NAME
+        ):
+            self.get_template(template_dir, template_name)
 
     def generate_player_report(
             self,
             template_dir: str,
             template_name: str,
-            output_path: str
+            output_path: str,
+            stream: bool = False
     ) -> str:
         """
         Generate an HTML report of all players and open it in the default web browser.
@@ -40,23 +275,21 @@ class ReportController:
             template_dir (str): Directory containing the Jinja2 template.
             template_name (str): Name of the template file.
             output_path (str): Output file path for the report.
+            stream (bool): Write the report while players are read from the
+                repository, instead of rendering the whole page in memory.
+                Memory then stays flat whatever the number of players with
+                the SQLite repository only (see IPlayerRepository.iter_players).
 
         Returns:
             str: Path to the generated HTML report.
         """
+        template = self.get_template(template_dir, template_name)
 
-        players = self.player_repository.load_players()
-
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html'])
-        )
-        template = env.get_template(template_name)
-        rendered_html = template.render(players=players)
-
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as file:
-            file.write(rendered_html)
+        if stream:
+            stream_report(output_path, template, players=self.player_repository.iter_players())
+        else:
+            players = self.player_repository.load_players()
+            write_report(output_path, template.render(players=players))
 
         return output_path
 
@@ -64,32 +297,33 @@ class ReportController:
             self,
             template_dir: str,
             template_name: str,
-            output_path: str
+            output_path: str,
+            stream: bool = False
     ) -> str:
         """
         Generate an HTML report of all tournaments and open it in the default web browser.
 
+        Only tournament summaries are read, as the report shows no rounds.
+
         Args:
             template_dir (str): Directory containing the Jinja2 template.
             template_name (str): Name of the template file.
             output_path (str): Output file path for the report.
+            stream (bool): Write the report while tournaments are read from
+                the repository, instead of rendering the whole page in memory.
 
         Returns:
             str: Path to the generated HTML report.
         """
+        template = self.get_template(template_dir, template_name)
 
-        tournaments = self.tournament_repository.load_tournaments()
-
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html'])
-        )
-        template = env.get_template(template_name)
-        rendered_html = template.render(tournaments=tournaments)
-
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as file:
-            file.write(rendered_html)
+        if stream:
+            stream_report(
+                output_path, template, tournaments=self.tournament_repository.iter_tournament_summaries()
+            )
+        else:
+            tournaments = self.tournament_repository.list_tournament_summaries()
+            write_report(output_path, template.render(tournaments=tournaments))
 
         return output_path
 
@@ -118,41 +352,117 @@ class ReportController:
         if not tournament:
             return None
 
-        tournament = tournament_with_loaded_players(
-            tournament=tournament,
-            player_repository=self.player_repository
-        )
-
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html'])
-        )
-        env.filters["format_fr"] = format_french_datetime
-        template = env.get_template(template_name)
-
-        tournament.players = sorted(
-            tournament.players,
-            key=lambda p: p.last_name.lower()
-        )
+        players_by_id = self.player_repository.get_many(get_report_player_ids(tournament))
+        template = self.get_template(template_dir, template_name)
+        if self.report_manifest is None:
+            return render_tournament_details_report(
+                template, tournament, players_by_id, output_dir, self.standings_cache.get(tournament)
+            )
+
+        output_path = get_details_report_path(output_dir, tournament_id)
+        fingerprint = compute_details_report_fingerprint(template, tournament, players_by_id)
+        if not self.report_manifest.is_up_to_date(output_path, fingerprint):
+            render_tournament_details_report(
+                template, tournament, players_by_id, output_dir, self.standings_cache.get(tournament)
+            )
+            self.report_manifest.record(output_path, fingerprint)
+            self.report_manifest.save()
+        return output_path
 
-        sorted_scores = sorted(
-            tournament.scores.items(),
-            key=lambda item: item[1],
-            reverse=True
-        )
+    def generate_all_tournament_details_reports(
+            self,
+            template_dir: str,
+            template_name: str,
+            index_template_name: str,
+            output_dir: str,
+            index_path: str,
+            tournament_ids: Optional[Iterable[str]] = None,
+            max_workers: Optional[int] = None
+    ) -> BatchReportResult:
+        """
+        Generate the details report of every tournament (or of the given ones)
+        across a process pool, plus an index page linking to every report.
 
-        ranking = []
-        for player_id, score in sorted_scores:
-            player = self.player_repository.get_by_id(player_id)
-            if player:
-                ranking.append((player, score))
+        Tournaments and players are loaded once, in this process, and handed
+        to each worker process once when it starts. Workers then only render
+        and write the reports. With a report manifest, unchanged reports are
+        skipped before any work is handed to the pool.
 
-        rendered_html = template.render(tournament=tournament, ranking=ranking)
+        Args:
+            template_dir (str): Directory containing the Jinja2 templates.
+            template_name (str): Template file name of a details report.
+            index_template_name (str): Template file name of the index page.
+            output_dir (str): Output directory for the reports.
+            index_path (str): Output file path for the index page.
+            tournament_ids (Iterable[str], optional): IDs of the tournaments to
+                render. All tournaments are rendered when omitted.
+            max_workers (int, optional): Number of worker processes. Defaults
+                to the number of CPUs. With a single worker, reports are
+                rendered in this process.
 
-        filename = f"tournament_{tournament_id}_report.html"
-        output_path = os.path.normpath(os.path.join(output_dir, filename))
-        os.makedirs(output_dir, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as file:
-            file.write(rendered_html)
+        Returns:
+            BatchReportResult: Paths of the generated reports and throughput.
+        """
+        started = time.perf_counter()
 
-        return output_path
+        tournaments = self.tournament_repository.load_tournaments()
+        if tournament_ids is not None:
+            selected_ids = set(tournament_ids)
+            tournaments = [t for t in tournaments if t.tournament_id in selected_ids]
+
+        players_by_id = {
+            player.national_chess_id: player for player in self.player_repository.load_players()
+        }
+
+        template = self.get_template(template_dir, template_name)
+        to_render = tournaments
+        fingerprints = {}
+        if self.report_manifest is not None:
+            to_render = []
+            for tournament in tournaments:
+                output_path = get_details_report_path(output_dir, tournament.tournament_id)
+                fingerprint = compute_details_report_fingerprint(template, tournament, players_by_id)
+                if not self.report_manifest.is_up_to_date(output_path, fingerprint):
+                    fingerprints[output_path] = fingerprint
+                    to_render.append(tournament)
+
+        max_workers = max_workers or os.cpu_count() or 1
+        max_workers = min(max_workers, len(to_render)) or 1
+        if max_workers == 1:
+            rendered_paths = [
+                render_tournament_details_report(template, tournament, players_by_id, output_dir)
+                for tournament in to_render
+            ]
+        else:
+            with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_report_worker,
+                    initargs=(template_dir, template_name, self.bytecode_cache_dir,
+                              output_dir, players_by_id)
+            ) as executor:
+                chunksize = max(1, len(to_render) // (max_workers * 4))
+                rendered_paths = list(executor.map(
+                    _render_report_in_worker, to_render, chunksize=chunksize
+                ))
+
+        if self.report_manifest is not None:
+            for output_path in rendered_paths:
+                self.report_manifest.record(output_path, fingerprints[output_path])
+            self.report_manifest.save()
+
+        report_paths = [
+            get_details_report_path(output_dir, tournament.tournament_id) for tournament in tournaments
+        ]
+
+        index_template = self.get_template(template_dir, index_template_name)
+        write_report(index_path, index_template.render(reports=[
+            (tournament, os.path.relpath(path, os.path.dirname(index_path)))
+            for tournament, path in zip(tournaments, report_paths)
+        ]))
+
+        return BatchReportResult(
+            report_paths,
+            index_path,
+            time.perf_counter() - started,
+            skipped_count=len(tournaments) - len(to_render)
+        )
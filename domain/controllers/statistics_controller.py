@@ -0,0 +1,43 @@
+"""Handle statistics computed across every tournament of the archive."""
+
+from typing import List, Tuple
+
+from domain.ports.tournament_repository import ITournamentRepository
+from infra.utils.match_table import MatchTable, PlayerRecord
+
+
+class StatisticsController:
+    def __init__(self, tournament_repository: ITournamentRepository):
+        """
+        Initialize the controller with a tournament repository.
+
+        Statistics only read, so the repository is used directly, not
+        through a session: the matches are streamed from the storage into a
+        MatchTable without building the tournaments.
+        """
+        self.tournament_repository = tournament_repository
+
+    def get_match_table(self) -> MatchTable:
+        """Return the table of every match played, read from the repository."""
+        return MatchTable.from_repository(self.tournament_repository)
+
+    def head_to_head(self, player_a: str, player_b: str) -> Tuple[int, int, int]:
+        """
+        Return the record of player_a against player_b over every tournament.
+
+        Returns:
+            Tuple[int, int, int]: (wins of player_a, draws, wins of player_b).
+        """
+        return self.get_match_table().head_to_head(player_a, player_b)
+
+    def player_records(self, min_games: int = 1) -> List[PlayerRecord]:
+        """
+        Return the record of every player with at least min_games games,
+        best win rate first, then most games, then by ID.
+        """
+        records = [
+            record for record in self.get_match_table().player_records().values()
+            if record.games >= min_games
+        ]
+        records.sort(key=lambda record: (-record.win_rate, -record.games, record.player_id))
+        return records
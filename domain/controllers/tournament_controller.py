@@ -1,13 +1,21 @@
 """Handle tournament management operations."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
+from domain.controllers.round_controller import RoundController
+from domain.models.match import Match
 from domain.models.player import Player
 from domain.models.round import Round
 from domain.models.tournament import Tournament
+from domain.models.tournament_summary import TournamentSummary
 from domain.ports.player_repository import IPlayerRepository
 from domain.ports.tournament_repository import ITournamentRepository
-from infra.utils.tournament_utils import tournament_with_loaded_players
+from infra.utils.standings import Standings, StandingsCache
+from infra.utils.tournament_utils import create_pairs_for_next_round, tournament_with_loaded_players
+
+
+class TournamentStateError(Exception):
+    """Raised when an operation is not allowed in the current state of a tournament."""
 
 
 class TournamentController:
@@ -16,9 +24,16 @@ class TournamentController:
             tournament_repository: ITournamentRepository,
             player_repository: IPlayerRepository
     ):
-        """Initialize the controller with tournament and player repositories."""
+        """
+        Initialize the controller with tournament and player repositories.
+
+        The standings of the tournaments are kept between calls, so that
+        each call only applies the rounds ended since the previous one.
+        """
         self.tournament_repository = tournament_repository
         self.player_repository = player_repository
+        self.round_controller = RoundController(tournament_repository)
+        self.standings_cache = StandingsCache()
 
     def create_tournament(
             self,
@@ -30,7 +45,7 @@ class TournamentController:
             description: str = ""
     ) -> Tournament:
         """
-        Create and save a new tournament.
+        Create and save a new tournament, with the next free ID.
 
         Args:
             name (str): Tournament name.
@@ -43,11 +58,6 @@ class TournamentController:
         Returns:
             Tournament: The created tournament instance.
         """
-        tournaments = self.tournament_repository.load_tournaments()
-
-        new_id_number = len(tournaments) + 1
-        new_id = f"T{new_id_number:03d}"
-
         tournament = Tournament(
             name=name,
             location=location,
@@ -55,10 +65,8 @@ class TournamentController:
             end_date=end_date,
             number_of_rounds=number_of_rounds,
             description=description,
-            tournament_id=new_id,
         )
-        tournaments.append(tournament)
-        self.tournament_repository.save_tournaments(tournaments)
+        self.tournament_repository.add_tournament(tournament)
         return tournament
 
     def list_tournaments(self) -> List[Tournament]:
@@ -72,6 +80,10 @@ class TournamentController:
             for tournament in tournaments
         ]
 
+    def list_tournament_summaries(self) -> List[TournamentSummary]:
+        """Return the summaries of all tournaments, for list views."""
+        return self.tournament_repository.list_tournament_summaries()
+
     def update_tournament(self,
                           tournament_id: str,
                           name: Optional[str] = None,
@@ -85,8 +97,15 @@ class TournamentController:
                           scores: Optional[Dict[str, float]] = None,
                           description: Optional[str] = None,
                           status: Optional[str] = None,
+                          expected_version: Optional[int] = None,
                           ) -> bool:
-        """Update a tournament identified by its ID."""
+        """
+        Update a tournament identified by its ID.
+
+        If expected_version is given, the update only succeeds if nobody else
+        modified the tournament since that version was loaded; otherwise
+        ConcurrentModificationError is raised.
+        """
         return self.tournament_repository.update_tournament_by_id(
             tournament_id=tournament_id,
             name=name,
@@ -99,9 +118,186 @@ class TournamentController:
             players=players,
             scores=scores,
             description=description,
-            status=status
+            status=status,
+            expected_version=expected_version
         )
 
+    def _get_existing(self, tournament_id: str) -> Tournament:
+        tournament = self.tournament_repository.get_by_id(tournament_id)
+        if tournament is None:
+            raise TournamentStateError("Tournoi introuvable.")
+        return tournament
+
+    def add_player_to_tournament(self, tournament_id: str, player: Player) -> bool:
+        """
+        Register a player in a tournament that is not over, with a score of 0.
+
+        Args:
+            tournament_id (str): ID of the tournament.
+            player (Player): Player to register.
+
+        Returns:
+            bool: False if the player was already registered.
+
+        Raises:
+            TournamentStateError: If the tournament does not exist or is over.
+            ConcurrentModificationError: If the tournament is modified meanwhile.
+        """
+        tournament = self._get_existing(tournament_id)
+        if tournament.status == "Terminé":
+            raise TournamentStateError("Ce tournoi est terminé. Impossible d'y ajouter un joueur.")
+
+        players = tournament.players
+        if player in players or player.national_chess_id in players:
+            return False
+
+        players.append(player)
+        scores = tournament.scores.copy()
+        scores.setdefault(player.national_chess_id, 0.0)
+        self.update_tournament(
+            tournament_id,
+            players=players,
+            scores=scores,
+            expected_version=tournament.version
+        )
+        return True
+
+    def start_tournament(self, tournament_id: str) -> Round:
+        """
+        Start a tournament: pair its players and create the first round.
+
+        Args:
+            tournament_id (str): ID of the tournament.
+
+        Returns:
+            Round: The first round, whose matches hold Player instances.
+
+        Raises:
+            TournamentStateError: If the tournament does not exist, is already
+                started, or has no players or an odd number of players.
+            ConcurrentModificationError: If the tournament is modified meanwhile.
+        """
+        tournament = self._get_existing(tournament_id)
+        if tournament.status != "Non démarré":
+            raise TournamentStateError("Ce tournoi est déjà commencé ou terminé")
+        if len(tournament.players) == 0:
+            raise TournamentStateError("Veuillez ajouter des joueurs au tournoi.")
+        if len(tournament.players) % 2 != 0:
+            raise TournamentStateError("Le nombre de jours est impair. "
+                                       "Veuillez ajouter un joueur au tournoi.")
+
+        pairs = create_pairs_for_next_round(
+            tournament=tournament,
+            player_repository=self.player_repository
+        )
+        first_round = self.round_controller.create_round(
+            tournament_id=tournament_id,
+            matches=[Match(p1, p2) for p1, p2 in pairs]
+        )
+
+        rounds = tournament.rounds
+        rounds.append(first_round)
+        self.update_tournament(
+            tournament_id=tournament_id,
+            rounds=rounds,
+            status="En cours",
+            expected_version=tournament.version
+        )
+        return first_round
+
+    def get_current_round(self, tournament_id: str) -> Round:
+        """
+        Return the round of a started tournament whose results are expected.
+
+        Raises:
+            TournamentStateError: If the tournament does not exist or is not in progress.
+        """
+        return self._get_current_round(self._get_existing(tournament_id))
+
+    @staticmethod
+    def _get_current_round(tournament: Tournament) -> Round:
+        current_round_index = tournament.current_round_number - 1
+        if tournament.status != "En cours" or current_round_index >= len(tournament.rounds):
+            raise TournamentStateError("Ce tournoi est non démarré ou déjà terminé.")
+        return tournament.rounds[current_round_index]
+
+    def submit_round_results(
+            self,
+            tournament_id: str,
+            results: List[Tuple[float, float]]
+    ) -> Optional[Round]:
+        """
+        Record the results of the current round, end it, then either pair the
+        next round or end the tournament after its last round.
+
+        Args:
+            tournament_id (str): ID of the tournament.
+            results (List[Tuple[float, float]]): Scores of both players of
+                each match of the round, in match order.
+
+        Returns:
+            Optional[Round]: The next round, whose matches hold Player
+            instances, or None if the tournament is over.
+
+        Raises:
+            TournamentStateError: If the tournament does not exist, is not in
+                progress, or if the number of results does not match the round.
+            ConcurrentModificationError: If the tournament is modified meanwhile.
+        """
+        tournament = self._get_existing(tournament_id)
+        current_round = self._get_current_round(tournament)
+        if len(results) != len(current_round.matches):
+            raise TournamentStateError(
+                f"Le {current_round.name} compte {len(current_round.matches)} matchs, "
+                f"{len(results)} résultats reçus."
+            )
+
+        for match, (player1_score, player2_score) in zip(current_round.matches, results):
+            match.set_scores(player1_score, player2_score)
+        current_round.end()
+        standings = self.get_standings(tournament)
+        tournament.scores = standings.scores()
+
+        if tournament.current_round_number >= tournament.number_of_rounds:
+            self.update_tournament(
+                tournament_id=tournament_id,
+                scores=tournament.scores,
+                rounds=tournament.rounds,
+                status="Terminé",
+                expected_version=tournament.version
+            )
+            return None
+
+        tournament.current_round_number += 1
+        pairs = create_pairs_for_next_round(
+            tournament=tournament,
+            player_repository=self.player_repository,
+            standings=standings
+        )
+        new_round = self.round_controller.create_round(
+            tournament_id=tournament_id,
+            matches=[Match(p1, p2) for p1, p2 in pairs]
+        )
+        tournament.rounds.append(new_round)
+        self.update_tournament(
+            tournament_id=tournament_id,
+            current_round_number=tournament.current_round_number,
+            rounds=tournament.rounds,
+            scores=tournament.scores,
+            expected_version=tournament.version
+        )
+        return new_round
+
+    def get_standings(self, tournament: Tournament) -> Standings:
+        """
+        Return the standings of a tournament, up to its last ended round.
+
+        Only the rounds ended since the standings of this tournament were
+        last returned are applied; the round history is replayed the first
+        time only.
+        """
+        return self.standings_cache.get(tournament)
+
     def get_by_id(self, tournament_id: str) -> Optional[Tournament]:
         """Return a tournament by its ID, or None if not found."""
         return self.tournament_repository.get_by_id(tournament_id)
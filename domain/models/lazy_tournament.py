@@ -0,0 +1,105 @@
+"""Define the lazily decoded tournaments, whose rounds are decoded on first access."""
+
+from __future__ import annotations
+
+from collections.abc import MutableSequence
+from typing import Callable, Iterator, List, Optional
+
+from domain.models.round import Round
+from domain.models.tournament import Tournament
+
+RoundDecoder = Callable[[dict, int], Round]
+
+
+def decode_round_from_dict(round_data: dict, index: int) -> Round:
+    """Decode a round dictionary with Round.from_dict (index is its position in the tournament)."""
+    return Round.from_dict(round_data)
+
+
+class DeferredRounds(MutableSequence):
+    __slots__ = ("_items", "_decode_round")
+
+    def __init__(self, rounds_data: List[dict], decode_round: Optional[RoundDecoder] = None):
+        """
+        Initialize a sequence of rounds kept as raw dictionaries until accessed.
+
+        Each round is decoded the first time it is read, then memoized: its
+        Round instance replaces the dictionary, so it is decoded only once
+        and later changes to it are kept.
+
+        Args:
+            rounds_data (List[dict]): Round dictionaries, as stored in tournaments.json.
+            decode_round (RoundDecoder, optional): Function decoding a round
+                dictionary, given with its index. Defaults to Round.from_dict.
+        """
+        self._items: List[Round | dict] = list(rounds_data)
+        self._decode_round = decode_round or decode_round_from_dict
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self._items)))]
+
+        item = self._items[index]
+        if isinstance(item, dict):
+            position = index if index >= 0 else index + len(self._items)
+            item = self._items[position] = self._decode_round(item, position)
+        return item
+
+    def __setitem__(self, index, value) -> None:
+        self._items[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._items[index]
+
+    def __iter__(self) -> Iterator[Round]:
+        for position in range(len(self._items)):
+            yield self[position]
+
+    def insert(self, index: int, value: Round) -> None:
+        self._items.insert(index, value)
+
+    @property
+    def decoded_count(self) -> int:
+        """Return the number of rounds decoded so far."""
+        return sum(1 for item in self._items if not isinstance(item, dict))
+
+    def to_dicts(self) -> List[dict]:
+        """
+        Return the rounds as dictionaries. Rounds never accessed are returned
+        as they were read, without being decoded.
+        """
+        return [item if isinstance(item, dict) else item.to_dict() for item in self._items]
+
+
+class LazyTournament(Tournament):
+    __slots__ = ()
+
+    def _rounds_to_dicts(self) -> List[dict]:
+        if isinstance(self.rounds, DeferredRounds):
+            return self.rounds.to_dicts()
+        return super()._rounds_to_dicts()
+
+    @classmethod
+    def from_dict(
+            cls,
+            tournament_data: dict,
+            decode_round: Optional[RoundDecoder] = None
+    ) -> LazyTournament:
+        """
+        Create a tournament from a dictionary, leaving its rounds undecoded.
+
+        The rounds are a DeferredRounds sequence: a caller only reading the
+        status, the players or the scores never decodes them, and saving the
+        tournament writes the untouched rounds back as they were read.
+
+        Args:
+            tournament_data (dict): Dictionary containing tournament data.
+            decode_round (RoundDecoder, optional): Function decoding a round
+                dictionary on first access. Defaults to Round.from_dict.
+        """
+        tournament = super().from_dict({**tournament_data, "rounds": []})
+        tournament.rounds = DeferredRounds(tournament_data.get("rounds", []), decode_round)
+        return tournament
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import List, Tuple
 
 from domain.models.player import Player
 
 
 class Match:
+    __slots__ = ("player1", "player2", "player1_score", "player2_score")
+
+    player1: Player | str
+    player2: Player | str
+    player1_score: float
+    player2_score: float
+
     def __init__(
             self,
             player1: Player | str,  # Player instance or player ID string
@@ -19,37 +26,50 @@ class Match:
         Initialize a Match with player references and their scores.
 
         Note:
-            The match is stored as a tuple of two lists:
-            one per player, each containing [player_ref, score].
+            By convention, player1 plays white.
+        """
+        self.player1 = player1
+        self.player2 = player2
+        self.player1_score = player1_score
+        self.player2_score = player2_score
+
+    @property
+    def data(self) -> Tuple[List, List]:
+        """
+        Return the match as a tuple of two lists, one per player, each
+        containing [player_ref, score].
+
+        The lists are built on each access: modifying them does not change
+        the match. Use set_scores() instead.
         """
-        self.data = ([player1, player1_score], [player2, player2_score])
+        return [self.player1, self.player1_score], [self.player2, self.player2_score]
 
     def __str__(self) -> str:
         """Returns a readable string representation of the match with player names and scores."""
-        return f"{self.data[0][0]}({self.data[0][1]}) - {self.data[1][0]}({self.data[1][1]})"
+        return f"{self.player1}({self.player1_score}) - {self.player2}({self.player2_score})"
 
     def get_players(self) -> Tuple[Player, Player]:
         """Return the two players of a match."""
-        return self.data[0][0], self.data[1][0]
+        return self.player1, self.player2
 
     def get_scores(self) -> Tuple[float, float]:
         """Return the score of both players."""
-        return self.data[0][1], self.data[1][1]
+        return self.player1_score, self.player2_score
 
     def set_scores(self, player1_score: float, player2_score: float):
         """Update the scores for both players."""
-        self.data[0][1] = player1_score
-        self.data[1][1] = player2_score
+        self.player1_score = player1_score
+        self.player2_score = player2_score
 
     def to_dict(self) -> dict:
         """Convert the match instance into a dictionary format using player IDs."""
         return {
-            "player1_id": self.data[0][0].national_chess_id
-            if isinstance(self.data[0][0], Player) else self.data[0][0],
-            "player2_id": self.data[1][0].national_chess_id
-            if isinstance(self.data[1][0], Player) else self.data[1][0],
-            "player1_score": self.data[0][1],
-            "player2_score": self.data[1][1],
+            "player1_id": self.player1.national_chess_id
+            if isinstance(self.player1, Player) else self.player1,
+            "player2_id": self.player2.national_chess_id
+            if isinstance(self.player2, Player) else self.player2,
+            "player1_score": self.player1_score,
+            "player2_score": self.player2_score,
         }
 
     @classmethod
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 
 class Player:
+    __slots__ = ("last_name", "first_name", "birth_date", "national_chess_id")
+
     def __init__(
             self,
             last_name: str,
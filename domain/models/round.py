@@ -9,6 +9,8 @@ from domain.models.match import Match
 
 
 class Round:
+    __slots__ = ("name", "matches", "start_datetime", "end_datetime", "round_id")
+
     def __init__(
         self,
         name: str,
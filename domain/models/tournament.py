@@ -9,6 +9,12 @@ from domain.models.round import Round
 
 
 class Tournament:
+    __slots__ = (
+        "name", "location", "start_date", "end_date", "number_of_rounds",
+        "current_round_number", "status", "rounds", "players", "scores",
+        "description", "tournament_id", "version"
+    )
+
     def __init__(
             self,
             name: str,
@@ -23,9 +29,13 @@ class Tournament:
             scores: Optional[Dict[str, float]] = None,
             description: Optional[str] = None,
             tournament_id: Optional[str] = None,
+            version: int = 0,
     ):
         """
         Initialize a Tournament instance with metadata, list of players, rounds, and scores.
+
+        The version is incremented by the repository on each update, and is
+        used to detect concurrent modifications.
         """
         self.name = name
         self.location = location
@@ -42,6 +52,7 @@ class Tournament:
         }
         self.description = description
         self.tournament_id = tournament_id
+        self.version = version
 
     def to_dict(self) -> dict:
         """
@@ -58,16 +69,20 @@ class Tournament:
             "number_of_rounds": self.number_of_rounds,
             "current_round_number": self.current_round_number,
             "status": self.status,
-            "rounds": [round_.to_dict() for round_ in self.rounds],
+            "rounds": self._rounds_to_dicts(),
             "players": [
                 p.national_chess_id if isinstance(p, Player) else p
                 for p in self.players
             ],
             "scores": self.scores,
             "description": self.description,
-            "tournament_id": self.tournament_id
+            "tournament_id": self.tournament_id,
+            "version": self.version
         }
 
+    def _rounds_to_dicts(self) -> List[dict]:
+        return [round_.to_dict() for round_ in self.rounds]
+
     @classmethod
     def from_dict(cls, tournament_data: dict) -> Tournament:
         """
@@ -91,5 +106,6 @@ class Tournament:
             players=tournament_data.get("players", []),
             scores=tournament_data.get("scores"),
             description=tournament_data.get("description"),
-            tournament_id=tournament_data.get("tournament_id")
+            tournament_id=tournament_data.get("tournament_id"),
+            version=tournament_data.get("version", 0)
         )
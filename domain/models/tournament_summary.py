@@ -0,0 +1,110 @@
+"""Define the tournament summaries used by list views."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from domain.models.tournament import Tournament
+
+
+class TournamentSummary:
+    __slots__ = (
+        "tournament_id", "name", "location", "start_date", "end_date", "description",
+        "status", "current_round_number", "number_of_rounds", "player_count", "version"
+    )
+
+    def __init__(
+            self,
+            tournament_id: Optional[str],
+            name: str,
+            location: str,
+            start_date: str,
+            end_date: str,
+            description: Optional[str] = None,
+            status: str = "Non démarré",
+            current_round_number: int = 1,
+            number_of_rounds: int = 4,
+            player_count: int = 0,
+            version: int = 0,
+    ):
+        """
+        Initialize the summary of a tournament.
+
+        A summary holds the fields displayed in the list of tournaments only,
+        without any round, match or player object.
+        """
+        self.tournament_id = tournament_id
+        self.name = name
+        self.location = location
+        self.start_date = start_date
+        self.end_date = end_date
+        self.description = description
+        self.status = status
+        self.current_round_number = current_round_number
+        self.number_of_rounds = number_of_rounds
+        self.player_count = player_count
+        self.version = version
+
+    @property
+    def progress(self) -> str:
+        """Return the progress of the tournament, e.g. '2/4'."""
+        return f"{self.current_round_number}/{self.number_of_rounds}"
+
+    def to_dict(self) -> dict:
+        """Convert the summary into a dictionary."""
+        return {
+            "tournament_id": self.tournament_id,
+            "name": self.name,
+            "location": self.location,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "description": self.description,
+            "status": self.status,
+            "current_round_number": self.current_round_number,
+            "number_of_rounds": self.number_of_rounds,
+            "player_count": self.player_count,
+            "version": self.version
+        }
+
+    @classmethod
+    def from_dict(cls, summary_data: dict) -> TournamentSummary:
+        """
+        Create a summary from a summary or a full tournament dictionary.
+
+        Rounds are never parsed. For a full tournament dictionary, the player
+        count is taken from the length of its player list.
+        """
+        player_count = summary_data.get("player_count")
+        if player_count is None:
+            player_count = len(summary_data.get("players", []))
+
+        return cls(
+            tournament_id=summary_data.get("tournament_id"),
+            name=summary_data["name"],
+            location=summary_data["location"],
+            start_date=summary_data["start_date"],
+            end_date=summary_data["end_date"],
+            description=summary_data.get("description"),
+            status=summary_data.get("status", "Non démarré"),
+            current_round_number=summary_data.get("current_round_number", 1),
+            number_of_rounds=summary_data.get("number_of_rounds", 4),
+            player_count=player_count,
+            version=summary_data.get("version", 0)
+        )
+
+    @classmethod
+    def from_tournament(cls, tournament: Tournament) -> TournamentSummary:
+        """Create the summary of a loaded tournament, without accessing its rounds."""
+        return cls(
+            tournament_id=tournament.tournament_id,
+            name=tournament.name,
+            location=tournament.location,
+            start_date=tournament.start_date,
+            end_date=tournament.end_date,
+            description=tournament.description,
+            status=tournament.status,
+            current_round_number=tournament.current_round_number,
+            number_of_rounds=tournament.number_of_rounds,
+            player_count=len(tournament.players),
+            version=tournament.version
+        )
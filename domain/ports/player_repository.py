@@ -1,22 +1,61 @@
 """Port interface for player repository."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from domain.models.player import Player
 
 
+def new_players_only(stored_ids: Iterable[str], players: Iterable[Player]) -> List[Player]:
+    """Return the players whose ID is neither in stored_ids nor repeated earlier in `players`."""
+    known_ids = set(stored_ids)
+    new_players = []
+    for player in players:
+        if player.national_chess_id not in known_ids:
+            known_ids.add(player.national_chess_id)
+            new_players.append(player)
+    return new_players
+
+
 class IPlayerRepository(ABC):
     @abstractmethod
     def load_players(self) -> List[Player]:
         """Load all players from the data source."""
         pass
 
+    def iter_players(self) -> Iterator[Player]:
+        """
+        Yield all players, in the same order as load_players().
+
+        Implementations able to read players one at a time should override
+        this method, so that the whole list is never held in memory. Only the
+        SQLite repository does so: the sorted order requires every player of
+        a JSON file to be read first, and the journal keeps its whole state in
+        memory. These backends still avoid building a second list of players.
+        """
+        yield from self.load_players()
+
     @abstractmethod
     def save_players(self, players: List[Player]) -> None:
         """Save the full list of players to the data source."""
         pass
 
+    def add_players(self, players: List[Player]) -> int:
+        """
+        Add players in a single write, leaving those already stored unchanged.
+
+        The default implementation rewrites the full list once. Implementations
+        able to append players should override this method.
+
+        Returns:
+            int: The number of players added.
+        """
+        stored = self.load_players()
+        new_players = new_players_only((player.national_chess_id for player in stored), players)
+        if new_players:
+            self.save_players(stored + new_players)
+        return len(new_players)
+
     @abstractmethod
     def update_player_by_id(
             self,
@@ -37,3 +76,8 @@ class IPlayerRepository(ABC):
     def get_by_id(self, player_id: str) -> Optional[Player]:
         """Return a player by ID or None if not found."""
         pass
+
+    @abstractmethod
+    def get_many(self, player_ids: Iterable[str]) -> Dict[str, Player]:
+        """Return the players matching the given IDs, keyed by ID. Unknown IDs are omitted."""
+        pass
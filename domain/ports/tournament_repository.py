@@ -1,24 +1,163 @@
 """Port interface for tournament repository."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from domain.models.player import Player
 from domain.models.round import Round
 from domain.models.tournament import Tournament
+from domain.models.tournament_summary import TournamentSummary
+
+# (tournament ID, round number starting at 1, player1 ID, player2 ID, player1 score, player2 score,
+#  played: True once the round of the match has ended, i.e. its result was entered)
+MatchRecord = Tuple[str, int, str, str, float, float, bool]
+
+
+class ConcurrentModificationError(Exception):
+    """Raised when a tournament was modified by someone else since it was loaded."""
+
+    def __init__(
+            self,
+            tournament_id: str,
+            expected_version: Optional[int],
+            actual_version: Optional[int]
+    ):
+        """
+        Args:
+            tournament_id (str): ID of the tournament.
+            expected_version (int, optional): Version read by the caller, or
+                None if the tournament was created since.
+            actual_version (int, optional): Stored version, or None if the
+                tournament no longer exists.
+        """
+        if actual_version is None:
+            message = f"Tournament {tournament_id} no longer exists."
+        elif expected_version is None:
+            message = f"Tournament {tournament_id} was created meanwhile."
+        else:
+            message = (
+                f"Tournament {tournament_id} is at version {actual_version}, "
+                f"expected version {expected_version}."
+            )
+        super().__init__(message)
+        self.tournament_id = tournament_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+
+def check_expected_versions(expected_versions: Dict[str, int], stored_versions: Dict[str, int]) -> None:
+    """
+    Check that the stored tournaments are exactly those expected, at the expected versions.
+
+    Args:
+        expected_versions (Dict[str, int]): Version of each tournament, as read by the caller.
+        stored_versions (Dict[str, int]): Version of each tournament currently stored.
+
+    Raises:
+        ConcurrentModificationError: For the first tournament updated, created
+            or deleted since it was read.
+    """
+    for tournament_id, version in stored_versions.items():
+        if expected_versions.get(tournament_id) != version:
+            raise ConcurrentModificationError(tournament_id, expected_versions.get(tournament_id), version)
+    for tournament_id in expected_versions.keys() - stored_versions.keys():
+        raise ConcurrentModificationError(tournament_id, expected_versions[tournament_id], None)
+
+
+def next_tournament_id(tournament_ids: Iterable[str]) -> str:
+    """Return the ID following the highest one of tournament_ids: T001, T002, ..."""
+    numbers = [
+        int(tournament_id[1:]) for tournament_id in tournament_ids
+        if tournament_id[:1] == "T" and tournament_id[1:].isdigit()
+    ]
+    return f"T{max(numbers, default=0) + 1:03d}"
 
 
 class ITournamentRepository(ABC):
+    # True when every read decodes the whole data set (e.g. a single JSON
+    # file): a session then loads all tournaments once and serves every
+    # later read, summaries included, from them.
+    reads_all_tournaments = False
+
     @abstractmethod
     def load_tournaments(self) -> List[Tournament]:
         """Load all tournaments from the data source."""
         pass
 
     @abstractmethod
-    def save_tournaments(self, tournaments: List[Tournament]) -> None:
-        """Save the full list of tournaments to the data source."""
+    def list_tournament_summaries(self) -> List[TournamentSummary]:
+        """
+        Return the summaries of all tournaments, in creation order.
+
+        Implementations must not build any Round, Match or Player object.
+        """
         pass
 
+    def iter_tournament_summaries(self) -> Iterator[TournamentSummary]:
+        """
+        Yield the summaries of all tournaments, in creation order.
+
+        Implementations able to read tournaments one at a time should
+        override this method, so that the whole list is never held in memory.
+        """
+        yield from self.list_tournament_summaries()
+
+    def iter_match_records(self) -> Iterator[MatchRecord]:
+        """
+        Yield one record per match of every tournament, in round order.
+
+        Implementations able to read matches from their raw storage should
+        override this method, so that no Tournament, Round or Match object
+        is built.
+        """
+        for tournament in self.load_tournaments():
+            for round_number, chess_round in enumerate(tournament.rounds, 1):
+                for match in chess_round.matches:
+                    match_data = match.to_dict()
+                    yield (
+                        tournament.tournament_id, round_number,
+                        match_data["player1_id"], match_data["player2_id"],
+                        match_data["player1_score"], match_data["player2_score"],
+                        chess_round.end_datetime is not None
+                    )
+
+    @abstractmethod
+    def save_tournaments(
+            self,
+            tournaments: List[Tournament],
+            expected_versions: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Save the full list of tournaments to the data source.
+
+        If expected_versions is given, it must hold the version of every
+        stored tournament, as read by the caller. It is checked with
+        check_expected_versions() under the same lock as the write, and
+        nothing is written on a mismatch.
+
+        Raises:
+            ConcurrentModificationError: If expected_versions is given and a
+                tournament was updated, created or deleted since it was read.
+        """
+        pass
+
+    def add_tournament(self, tournament: Tournament) -> str:
+        """
+        Give a new tournament the next free ID (see next_tournament_id) and store it.
+
+        The default implementation loads and saves the full list, without
+        any lock. Implementations should override this method so that the
+        ID is allocated and the tournament appended atomically, without
+        rewriting the other tournaments.
+
+        Returns:
+            str: The ID given to the tournament.
+        """
+        tournaments = self.load_tournaments()
+        tournament.tournament_id = next_tournament_id(t.tournament_id for t in tournaments)
+        self.save_tournaments(tournaments + [tournament])
+        return tournament.tournament_id
+
     @abstractmethod
     def update_tournament_by_id(
             self,
@@ -33,9 +172,38 @@ class ITournamentRepository(ABC):
             players: Optional[List[Player]] = None,
             scores: Optional[Dict[str, float]] = None,
             description: Optional[str] = None,
-            status: Optional[str] = None
+            status: Optional[str] = None,
+            expected_version: Optional[int] = None
     ):
-        """Update a tournament with the given ID."""
+        """
+        Update a tournament with the given ID and increment its version.
+
+        If expected_version is given and does not match the stored version,
+        nothing is written and ConcurrentModificationError is raised.
+        """
+        pass
+
+    @abstractmethod
+    def patch_tournament(
+            self,
+            tournament_id: str,
+            patch: List[dict],
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Apply a JSON Patch to the tournament with the given ID and increment its version.
+
+        The patch is made of "add", "remove" and "replace" operations on the
+        dictionary of the tournament (see Tournament.to_dict). Implementations
+        should write only the patched values.
+
+        Returns:
+            bool: False if no tournament has this ID.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+        """
         pass
 
     @abstractmethod
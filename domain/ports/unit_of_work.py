@@ -0,0 +1,45 @@
+"""Port interface for the unit of work shared by the controllers of a user action."""
+
+from abc import ABC, abstractmethod
+
+from domain.ports.player_repository import IPlayerRepository
+from domain.ports.tournament_repository import ITournamentRepository
+
+
+class IUnitOfWork(ABC):
+    """
+    Session over the player and tournament repositories.
+
+    Controllers are given `players` and `tournaments` instead of the
+    repositories themselves. A user action is run inside `with unit_of_work:`:
+    every controller then shares the same loaded objects, and the changes are
+    written on commit, or when the block exits without an exception.
+    """
+
+    players: IPlayerRepository
+    tournaments: ITournamentRepository
+
+    @abstractmethod
+    def __enter__(self) -> "IUnitOfWork":
+        """Start a session, or join the one already started."""
+        pass
+
+    @abstractmethod
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """End the session: commit if no exception was raised, then forget the loaded objects."""
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Write every pending change.
+
+        Raises:
+            ConcurrentModificationError: If a tournament was modified since it was read.
+        """
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard the loaded objects and the pending changes."""
+        pass
@@ -0,0 +1,467 @@
+"""
+Non-interactive command-line view, for scripts and load tests.
+
+Each command calls the controllers directly, in its own unit of work, and
+prints plain text instead of Rich menus: one line per item, with fields
+separated by tabs. The batch command runs one command per line of a file in
+the same process, so that the interpreter start-up and the opening of the
+repositories are paid once for the whole batch.
+"""
+
+import argparse
+import shlex
+import sys
+import time
+from contextlib import nullcontext
+from typing import ContextManager, List, Optional, TextIO, Tuple
+
+from config import (
+    GENERATED_REPORTS_DIR,
+    PLAYERS_REPORT_PATH,
+    PLAYERS_TEMPLATE_NAME,
+    REPORTS_MANIFEST_PATH,
+    TEMPLATE_DIR,
+    TOURNAMENT_DETAILS_INDEX_PATH,
+    TOURNAMENT_DETAILS_INDEX_TEMPLATE_NAME,
+    TOURNAMENT_DETAILS_TEMPLATE_NAME,
+    TOURNAMENTS_REPORT_PATH,
+    TOURNAMENTS_TEMPLATE_NAME
+)
+from domain.controllers.player_controller import PlayerController
+from domain.controllers.report_controller import ReportController
+from domain.controllers.statistics_controller import StatisticsController
+from domain.controllers.tournament_controller import TournamentController, TournamentStateError
+from domain.models.round import Round
+from domain.ports.player_repository import IPlayerRepository
+from domain.ports.tournament_repository import ConcurrentModificationError, ITournamentRepository
+from domain.ports.unit_of_work import IUnitOfWork
+from infra.utils.match_utils import get_match_player_ids
+from infra.utils.player_files import PLAYER_FILE_FORMATS, guess_player_file_format, iter_player_rows
+from infra.utils.validators import (
+    is_valid_date,
+    is_valid_name,
+    is_valid_national_chess_id,
+    is_valid_number,
+    is_valid_tournament_id
+)
+
+# Scores of both players for each accepted notation of a match result.
+RESULT_NOTATIONS = {
+    "1-0": (1.0, 0.0),
+    "0-1": (0.0, 1.0),
+    "1/2-1/2": (0.5, 0.5),
+    "0.5-0.5": (0.5, 0.5),
+}
+
+
+class CommandError(Exception):
+    """Raised when a command cannot be run. Its message is printed on stderr."""
+
+
+def parse_result(notation: str) -> Tuple[float, float]:
+    """
+    Return the scores of both players of a match result written as 1-0, 0-1 or 1/2-1/2.
+
+    Raises:
+        CommandError: If the notation is not recognized.
+    """
+    try:
+        return RESULT_NOTATIONS[notation.strip()]
+    except KeyError:
+        raise CommandError(
+            f"Résultat invalide : {notation!r} (attendu : {', '.join(RESULT_NOTATIONS)})."
+        ) from None
+
+
+def read_lines(path: str) -> List[Tuple[int, str]]:
+    """Return the non-empty lines of a file ("-" for stdin) with their number, comments (#) excluded."""
+    try:
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(path, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+    except OSError as error:
+        raise CommandError(f"Lecture impossible de {path} : {error.strerror}.") from None
+    return [
+        (line_number, line.strip())
+        for line_number, line in enumerate(lines, 1)
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
+def open_text_file(path: str, mode: str, standard_stream: TextIO) -> ContextManager[TextIO]:
+    """Open a file for the csv module, or return standard_stream, left open, if path is "-"."""
+    if path == "-":
+        return nullcontext(standard_stream)
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the parser of the commands, with one handler name per subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Gestionnaire de tournois d'échecs, en ligne de commande.",
+        epilog="Placée avant la commande, l'option --backend json|sharded|journal|sqlite "
+               "choisit le stockage (json par défaut)."
+    )
+    groups = parser.add_subparsers(dest="group", required=True)
+
+    players = groups.add_parser("players", help="Joueurs.").add_subparsers(dest="command", required=True)
+    players.add_parser("list", help="Lister les joueurs.").set_defaults(handler="players_list")
+    add = players.add_parser("add", help="Ajouter un joueur.")
+    add.add_argument("national_chess_id", help="Identifiant national d'échecs (ex: AB12345).")
+    add.add_argument("--last-name", required=True, help="Nom de famille.")
+    add.add_argument("--first-name", required=True, help="Prénom.")
+    add.add_argument("--birth-date", required=True, help="Date de naissance (JJ-MM-AAAA).")
+    add.set_defaults(handler="players_add")
+    import_ = players.add_parser("import", help="Importer des joueurs depuis un fichier CSV, JSON Lines ou JSON.")
+    import_.add_argument("file", help="Fichier de joueurs (- : entrée standard).")
+    import_.add_argument("--format", choices=PLAYER_FILE_FORMATS,
+                         help="Format du fichier (déduit de son extension, csv par défaut).")
+    import_.add_argument("--batch-size", type=int, default=1000,
+                         help="Nombre de lignes vérifiées ensemble (1000 par défaut).")
+    import_.set_defaults(handler="players_import")
+    export = players.add_parser("export", help="Exporter les joueurs en CSV ou JSON Lines.")
+    export.add_argument("file", help="Fichier à écrire (- : sortie standard).")
+    export.add_argument("--format", choices=("csv", "jsonl"),
+                        help="Format du fichier (déduit de son extension, csv par défaut).")
+    export.set_defaults(handler="players_export")
+
+    tournament = groups.add_parser("tournament", help="Tournois.").add_subparsers(
+        dest="command", required=True
+    )
+    tournament.add_parser("list", help="Lister les tournois.").set_defaults(handler="tournament_list")
+    create = tournament.add_parser("create", help="Créer un tournoi.")
+    create.add_argument("--name", required=True, help="Nom du tournoi.")
+    create.add_argument("--location", required=True, help="Lieu.")
+    create.add_argument("--start-date", required=True, help="Date de début (JJ-MM-AAAA).")
+    create.add_argument("--end-date", required=True, help="Date de fin (JJ-MM-AAAA).")
+    create.add_argument("--rounds", default="4", help="Nombre de rounds, de 1 à 10 (4 par défaut).")
+    create.add_argument("--description", default="", help="Description.")
+    create.set_defaults(handler="tournament_create")
+    add_players = tournament.add_parser("add-players", help="Inscrire des joueurs existants.")
+    add_players.add_argument("tournament_id", help="ID du tournoi (ex: T001).")
+    add_players.add_argument("player_ids", nargs="+", help="Identifiants des joueurs.")
+    add_players.set_defaults(handler="tournament_add_players")
+    start = tournament.add_parser("start", help="Débuter un tournoi (appariement du premier round).")
+    start.add_argument("tournament_id", help="ID du tournoi (ex: T001).")
+    start.set_defaults(handler="tournament_start")
+
+    results = groups.add_parser("results", help="Résultats.").add_subparsers(dest="command", required=True)
+    submit = results.add_parser("submit", help="Saisir les résultats du round en cours.")
+    submit.add_argument("tournament_id", help="ID du tournoi (ex: T001).")
+    source = submit.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help="Un résultat par ligne, dans l'ordre des matchs (- : entrée standard).")
+    source.add_argument("--results", nargs="+", help="Résultats dans l'ordre des matchs.")
+    submit.set_defaults(handler="results_submit")
+
+    report = groups.add_parser("report", help="Rapports HTML.").add_subparsers(dest="command", required=True)
+    build = report.add_parser("build", help="Générer des rapports dans generated_reports/.")
+    build.add_argument("kind", choices=("players", "tournaments", "details", "all"), help="Rapport à générer.")
+    build.add_argument("--tournament", nargs="+", dest="tournament_ids",
+                       help="Tournois des rapports détaillés (tous par défaut).")
+    build.add_argument("--workers", type=int, help="Nombre de processus pour les rapports détaillés.")
+    build.set_defaults(handler="report_build")
+
+    stats = groups.add_parser("stats", help="Statistiques sur l'ensemble des tournois.").add_subparsers(
+        dest="command", required=True
+    )
+    head_to_head = stats.add_parser("head-to-head", help="Bilan des matchs joués entre deux joueurs.")
+    head_to_head.add_argument("player_a", help="Identifiant du premier joueur.")
+    head_to_head.add_argument("player_b", help="Identifiant du second joueur.")
+    head_to_head.set_defaults(handler="stats_head_to_head")
+    win_rates = stats.add_parser("win-rates", help="Bilan et taux de victoire de chaque joueur.")
+    win_rates.add_argument("--min-games", type=int, default=1,
+                           help="Nombre minimal de matchs joués (1 par défaut).")
+    win_rates.set_defaults(handler="stats_win_rates")
+
+    batch = groups.add_parser("batch", help="Exécuter une commande par ligne d'un fichier.")
+    batch.add_argument("file", help="Fichier de commandes (- : entrée standard).")
+    batch.add_argument("--keep-going", action="store_true", help="Continuer après une commande en échec.")
+    batch.set_defaults(handler="batch")
+
+    return parser
+
+
+class CommandLineView:
+    def __init__(
+            self,
+            player_repository: IPlayerRepository,
+            tournament_repository: ITournamentRepository,
+            unit_of_work: IUnitOfWork,
+            output: Optional[TextIO] = None
+    ):
+        """
+        Initialize the view with controllers sharing a unit of work.
+
+        Args:
+            player_repository (IPlayerRepository): Repository of the players.
+            tournament_repository (ITournamentRepository): Repository of the tournaments.
+            unit_of_work (IUnitOfWork): Session over the same repositories,
+                in which each command runs.
+            output (TextIO, optional): Stream the results are printed to.
+                Defaults to stdout.
+        """
+        self.player_repository = player_repository
+        self.tournament_repository = tournament_repository
+        self.session = unit_of_work
+        self.tournament_controller = TournamentController(
+            tournament_repository=self.session.tournaments,
+            player_repository=self.session.players
+        )
+        self.player_controller = PlayerController(
+            repository=self.session.players
+        )
+        self._report_controller: Optional[ReportController] = None
+        # Statistics only read: like reports, they use the repository directly.
+        self.statistics_controller = StatisticsController(tournament_repository)
+        self.output = output or sys.stdout
+        self.parser = build_parser()
+
+    @property
+    def report_controller(self) -> ReportController:
+        """
+        Return the report controller, created on first use (it compiles the templates).
+
+        Reports only read, so the controller uses the repositories directly
+        rather than the session: they stream players, summaries and matches
+        without loading the whole archive.
+        """
+        if self._report_controller is None:
+            self._report_controller = ReportController(
+                player_repository=self.player_repository,
+                tournament_repository=self.tournament_repository,
+                template_dir=TEMPLATE_DIR,
+                report_manifest_path=REPORTS_MANIFEST_PATH
+            )
+        return self._report_controller
+
+    def print(self, *fields) -> None:
+        """Print one line of tab-separated fields."""
+        print(*fields, sep="\t", file=self.output)
+
+    def run(self, argv: List[str]) -> int:
+        """
+        Parse and run a command.
+
+        Returns:
+            int: Exit status: 0 on success, 1 if the command failed, 2 if
+            the command line is invalid.
+        """
+        try:
+            args = self.parser.parse_args(argv)
+        except SystemExit as exit_:
+            return exit_.code or 0
+
+        if args.handler == "batch":
+            return self.batch(args)
+
+        try:
+            with self.session:
+                getattr(self, args.handler)(args)
+        except (CommandError, TournamentStateError) as error:
+            print(f"Erreur : {error}", file=sys.stderr)
+            return 1
+        except ConcurrentModificationError:
+            print("Erreur : le tournoi a été modifié par un autre processus pendant la commande, "
+                  "rien n'a été enregistré.", file=sys.stderr)
+            return 1
+        return 0
+
+    def batch(self, args: argparse.Namespace) -> int:
+        """
+        Run one command per line of a file, each in its own unit of work.
+
+        Stops at the first failed command unless --keep-going is given. A
+        summary (commands, failures, throughput) is printed on stderr.
+        """
+        try:
+            lines = read_lines(args.file)
+        except CommandError as error:
+            print(f"Erreur : {error}", file=sys.stderr)
+            return 1
+
+        started = time.perf_counter()
+        executed = failures = 0
+        for line_number, line in lines:
+            status = self._run_batch_line(line)
+            executed += 1
+            if status != 0:
+                failures += 1
+                print(f"Échec de la ligne {line_number} : {line}", file=sys.stderr)
+                if not args.keep_going:
+                    break
+
+        elapsed = time.perf_counter() - started
+        rate = executed / elapsed if elapsed > 0 else 0.0
+        print(f"{executed} commandes en {elapsed:.2f} s ({rate:.0f} commandes/s), "
+              f"{failures} en échec.", file=sys.stderr)
+        return 1 if failures else 0
+
+    def _run_batch_line(self, line: str) -> int:
+        """Run the command of one line of a batch file, and return its exit status."""
+        try:
+            argv = shlex.split(line)
+        except ValueError as error:
+            print(f"Erreur : ligne mal formée ({error}).", file=sys.stderr)
+            return 2
+        if argv[:1] == ["batch"]:
+            print("Erreur : une commande batch ne peut pas en contenir une autre.", file=sys.stderr)
+            return 2
+        return self.run(argv)
+
+    def players_list(self, args: argparse.Namespace) -> None:
+        for player in self.player_controller.list_players():
+            self.print(player.national_chess_id, player.last_name, player.first_name, player.birth_date)
+
+    def players_add(self, args: argparse.Namespace) -> None:
+        if not is_valid_national_chess_id(args.national_chess_id):
+            raise CommandError(f"Identifiant invalide : {args.national_chess_id} "
+                               "(format attendu : 2 lettres suivies de 5 chiffres, ex: AB12345).")
+        for label, name in (("Nom", args.last_name), ("Prénom", args.first_name)):
+            if not is_valid_name(name):
+                raise CommandError(f"{label} invalide : {name!r}.")
+        if not is_valid_date(args.birth_date):
+            raise CommandError(f"Date de naissance invalide : {args.birth_date} (format JJ-MM-AAAA).")
+        if self.player_controller.get_by_id(args.national_chess_id) is not None:
+            raise CommandError(f"Le joueur {args.national_chess_id} existe déjà.")
+
+        player = self.player_controller.create_player(
+            last_name=args.last_name,
+            first_name=args.first_name,
+            birth_date=args.birth_date,
+            national_chess_id=args.national_chess_id
+        )
+        self.print(player.national_chess_id)
+
+    def players_import(self, args: argparse.Namespace) -> None:
+        if args.batch_size < 1:
+            raise CommandError("La taille des lots doit être un entier positif.")
+        file_format = args.format or guess_player_file_format(args.file)
+        try:
+            with open_text_file(args.file, "r", sys.stdin) as file:
+                result = self.player_controller.import_players(
+                    iter_player_rows(file, file_format), batch_size=args.batch_size
+                )
+        except OSError as error:
+            raise CommandError(f"Lecture impossible de {args.file} : {error.strerror}.") from None
+        except ValueError as error:
+            raise CommandError(f"Fichier de joueurs invalide : {error}") from None
+
+        for line_number, error in result.rejected:
+            print(f"Ligne {line_number} rejetée : {error}", file=sys.stderr)
+        # Imported, already stored, repeated in the file, rejected.
+        self.print(result.imported_count, result.existing_count, result.duplicate_count, len(result.rejected))
+
+    def players_export(self, args: argparse.Namespace) -> None:
+        file_format = args.format or guess_player_file_format(args.file)
+        if file_format not in ("csv", "jsonl"):
+            raise CommandError(f"Format d'export non géré : {file_format} (csv ou jsonl).")
+        try:
+            with open_text_file(args.file, "w", self.output) as file:
+                count = self.player_controller.export_players(file, file_format)
+        except OSError as error:
+            raise CommandError(f"Écriture impossible de {args.file} : {error.strerror}.") from None
+        if args.file != "-":
+            self.print(count)
+
+    def tournament_list(self, args: argparse.Namespace) -> None:
+        for summary in self.tournament_controller.list_tournament_summaries():
+            self.print(summary.tournament_id, summary.status, summary.progress, summary.name)
+
+    def tournament_create(self, args: argparse.Namespace) -> None:
+        for label, name in (("Nom", args.name), ("Lieu", args.location)):
+            if not is_valid_name(name):
+                raise CommandError(f"{label} invalide : {name!r}.")
+        for date in (args.start_date, args.end_date):
+            if not is_valid_date(date):
+                raise CommandError(f"Date invalide : {date} (format JJ-MM-AAAA).")
+        if not is_valid_number(args.rounds):
+            raise CommandError("Nombre de rounds invalide : entrez un entier entre 1 et 10.")
+
+        tournament = self.tournament_controller.create_tournament(
+            name=args.name,
+            location=args.location,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            number_of_rounds=int(args.rounds),
+            description=args.description
+        )
+        self.print(tournament.tournament_id)
+
+    def _check_tournament_id(self, tournament_id: str) -> None:
+        if not is_valid_tournament_id(tournament_id):
+            raise CommandError(f"ID de tournoi invalide : {tournament_id} (ex: T001).")
+
+    def tournament_add_players(self, args: argparse.Namespace) -> None:
+        self._check_tournament_id(args.tournament_id)
+        players_by_id = self.player_controller.repository.get_many(args.player_ids)
+        unknown = [player_id for player_id in args.player_ids if player_id not in players_by_id]
+        if unknown:
+            raise CommandError(f"Joueurs introuvables : {', '.join(unknown)}.")
+
+        for player_id in args.player_ids:
+            added = self.tournament_controller.add_player_to_tournament(
+                args.tournament_id, players_by_id[player_id]
+            )
+            self.print(player_id, "ajouté" if added else "déjà inscrit")
+
+    def _print_round(self, chess_round: Round) -> None:
+        """Print the round name, then the IDs of both players of each match (white first)."""
+        self.print(chess_round.name)
+        for match in chess_round.matches:
+            self.print(*get_match_player_ids(match))
+
+    def tournament_start(self, args: argparse.Namespace) -> None:
+        self._check_tournament_id(args.tournament_id)
+        self._print_round(self.tournament_controller.start_tournament(args.tournament_id))
+
+    def results_submit(self, args: argparse.Namespace) -> None:
+        self._check_tournament_id(args.tournament_id)
+        notations = [line for _, line in read_lines(args.file)] if args.file else args.results
+        results = [parse_result(notation) for notation in notations]
+
+        new_round = self.tournament_controller.submit_round_results(args.tournament_id, results)
+        if new_round is None:
+            self.print("Terminé")
+        else:
+            self._print_round(new_round)
+
+    def report_build(self, args: argparse.Namespace) -> None:
+        controller = self.report_controller
+        if args.kind in ("players", "all"):
+            self.print(controller.generate_player_report(
+                TEMPLATE_DIR, PLAYERS_TEMPLATE_NAME, PLAYERS_REPORT_PATH, stream=True
+            ))
+        if args.kind in ("tournaments", "all"):
+            self.print(controller.generate_tournaments_report(
+                TEMPLATE_DIR, TOURNAMENTS_TEMPLATE_NAME, TOURNAMENTS_REPORT_PATH, stream=True
+            ))
+        if args.kind in ("details", "all"):
+            result = controller.generate_all_tournament_details_reports(
+                template_dir=TEMPLATE_DIR,
+                template_name=TOURNAMENT_DETAILS_TEMPLATE_NAME,
+                index_template_name=TOURNAMENT_DETAILS_INDEX_TEMPLATE_NAME,
+                output_dir=GENERATED_REPORTS_DIR,
+                index_path=TOURNAMENT_DETAILS_INDEX_PATH,
+                tournament_ids=args.tournament_ids,
+                max_workers=args.workers
+            )
+            for path in result.report_paths:
+                self.print(path)
+            self.print(result.index_path)
+
+    def stats_head_to_head(self, args: argparse.Namespace) -> None:
+        for player_id in (args.player_a, args.player_b):
+            if not is_valid_national_chess_id(player_id):
+                raise CommandError(f"Identifiant invalide : {player_id} (ex: AB12345).")
+        # Wins of the first player, draws, wins of the second player.
+        self.print(*self.statistics_controller.head_to_head(args.player_a, args.player_b))
+
+    def stats_win_rates(self, args: argparse.Namespace) -> None:
+        if args.min_games < 1:
+            raise CommandError("Le nombre minimal de matchs doit être un entier positif.")
+        for record in self.statistics_controller.player_records(min_games=args.min_games):
+            self.print(record.player_id, record.games, record.wins, record.draws, record.losses,
+                       record.points, f"{record.win_rate:.3f}")
@@ -6,6 +6,7 @@ from rich.table import Table
 
 from domain.ports.player_repository import IPlayerRepository
 from domain.ports.tournament_repository import ITournamentRepository
+from domain.ports.unit_of_work import IUnitOfWork
 from domain.views.player_view import PlayerView
 from domain.views.report_view import ReportView
 from domain.views.tournament_view import TournamentView
@@ -15,19 +16,25 @@ class MainMenuView:
     def __init__(
             self,
             player_repository: IPlayerRepository,
-            tournament_repository: ITournamentRepository
+            tournament_repository: ITournamentRepository,
+            unit_of_work: IUnitOfWork
     ):
-        """Initialize with subviews and Rich console."""
+        """
+        Initialize with subviews and Rich console.
+
+        The tournament views run their actions in the unit of work, which
+        wraps the same repositories.
+        """
         self.player_view = PlayerView(
             repository=player_repository
         )
         self.tournament_view = TournamentView(
-            player_repository=player_repository,
-            tournament_repository=tournament_repository
+            unit_of_work=unit_of_work
         )
         self.report_view = ReportView(
             player_repository=player_repository,
-            tournament_repository=tournament_repository
+            tournament_repository=tournament_repository,
+            unit_of_work=unit_of_work
         )
         self.console = Console(force_terminal=True)
 
@@ -92,6 +92,9 @@ class PlayerView:
         first_name = self.input_view.input_name(name_type="Prénom")
         birth_date = self.input_view.input_date(date_type="Date de naissance")
         national_chess_id = self.input_view.input_national_chess_id()
+        if self.controller.get_by_id(national_chess_id) is not None:
+            self.console.print(f"[bold red]Le joueur {national_chess_id} existe déjà.[/bold red]")
+            return
 
         player = self.controller.create_player(
             last_name, first_name, birth_date, national_chess_id
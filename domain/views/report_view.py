@@ -10,6 +10,7 @@ from rich.panel import Panel
 from domain.controllers.report_controller import ReportController
 from domain.ports.player_repository import IPlayerRepository
 from domain.ports.tournament_repository import ITournamentRepository
+from domain.ports.unit_of_work import IUnitOfWork
 from domain.views.components.input_view import InputView
 from domain.views.tournament_view import TournamentView
 from config import (
@@ -19,7 +20,10 @@ from config import (
     TOURNAMENTS_TEMPLATE_NAME,
     TOURNAMENTS_REPORT_PATH,
     TOURNAMENT_DETAILS_TEMPLATE_NAME,
-    GENERATED_REPORTS_DIR
+    TOURNAMENT_DETAILS_INDEX_TEMPLATE_NAME,
+    TOURNAMENT_DETAILS_INDEX_PATH,
+    GENERATED_REPORTS_DIR,
+    REPORTS_MANIFEST_PATH
 )
 
 
@@ -27,20 +31,23 @@ class ReportView:
     def __init__(
             self,
             player_repository: IPlayerRepository,
-            tournament_repository: ITournamentRepository
+            tournament_repository: ITournamentRepository,
+            unit_of_work: IUnitOfWork
     ):
         """
         Initialize the report view with controller, console, and sub-views.
         """
         self.controller = ReportController(
             player_repository=player_repository,
-            tournament_repository=tournament_repository
+            tournament_repository=tournament_repository,
+            template_dir=TEMPLATE_DIR,
+            precompile=True,
+            report_manifest_path=REPORTS_MANIFEST_PATH
         )
         self.console = Console(force_terminal=True)
         self.input_view = InputView(self.console)
         self.tournament_view = TournamentView(
-            player_repository=player_repository,
-            tournament_repository=tournament_repository
+            unit_of_work=unit_of_work
         )
 
     def display_menu(self):
@@ -60,7 +67,8 @@ class ReportView:
             table.add_row("1", "Afficher la liste des joueurs (ordre alphabétique)")
             table.add_row("2", "Afficher la liste de tous les tournois")
             table.add_row("3", "Afficher les informations d'un tournoi")
-            table.add_row("4", "Retourner au menu principal")
+            table.add_row("4", "Générer les rapports détaillés de tous les tournois")
+            table.add_row("5", "Retourner au menu principal")
 
             self.console.print(table)
 
@@ -73,6 +81,8 @@ class ReportView:
             elif choice == "3":
                 self.show_tournament_details_flow()
             elif choice == "4":
+                self.generate_all_tournament_details_flow()
+            elif choice == "5":
                 break
             else:
                 self.console.print("[bold red]Choix invalide. Veuillez réessayer.[/bold red]")
@@ -81,7 +91,8 @@ class ReportView:
         players_report_path = self.controller.generate_player_report(
             template_dir=TEMPLATE_DIR,
             template_name=PLAYERS_TEMPLATE_NAME,
-            output_path=PLAYERS_REPORT_PATH
+            output_path=PLAYERS_REPORT_PATH,
+            stream=True
         )
         report_name = Path(players_report_path).name
         webbrowser.open(f"file://{players_report_path}")
@@ -91,7 +102,8 @@ class ReportView:
         tournaments_report_path = self.controller.generate_tournaments_report(
             template_dir=TEMPLATE_DIR,
             template_name=TOURNAMENTS_TEMPLATE_NAME,
-            output_path=TOURNAMENTS_REPORT_PATH
+            output_path=TOURNAMENTS_REPORT_PATH,
+            stream=True
         )
         report_name = Path(tournaments_report_path).name
         webbrowser.open(f"file://{tournaments_report_path}")
@@ -118,3 +130,28 @@ class ReportView:
         report_name = Path(tournament_details_report_path).name
         webbrowser.open(f"file://{tournament_details_report_path}")
         self.console.print(f"\n[bold green] 📄Rapport {report_name} généré et ouvert dans le navigateur.[/bold green]")
+
+    def generate_all_tournament_details_flow(self):
+        self.console.print("\n[bold blue]IDs des tournois séparés par des virgules "
+                           "(laisser vide pour tous les tournois):[/bold blue]")
+        answer = input().strip()
+        tournament_ids = None
+        if answer:
+            tournament_ids = [
+                tournament_id.strip() for tournament_id in answer.split(",") if tournament_id.strip()
+            ]
+
+        result = self.controller.generate_all_tournament_details_reports(
+            template_dir=TEMPLATE_DIR,
+            template_name=TOURNAMENT_DETAILS_TEMPLATE_NAME,
+            index_template_name=TOURNAMENT_DETAILS_INDEX_TEMPLATE_NAME,
+            output_dir=GENERATED_REPORTS_DIR,
+            index_path=TOURNAMENT_DETAILS_INDEX_PATH,
+            tournament_ids=tournament_ids
+        )
+
+        webbrowser.open(f"file://{result.index_path}")
+        self.console.print(f"\n[bold green] 📄{len(result.report_paths)} rapports générés en "
+                           f"{result.elapsed_seconds:.2f} s "
+                           f"({result.reports_per_second:.1f} rapports/s, "
+                           f"{result.skipped_count} inchangés).[/bold green]")
@@ -8,33 +8,37 @@ from rich.panel import Panel
 
 from domain.controllers.player_controller import PlayerController
 from domain.controllers.round_controller import RoundController
-from domain.controllers.tournament_controller import TournamentController
-from domain.models.match import Match
-from domain.ports.player_repository import IPlayerRepository
-from domain.ports.tournament_repository import ITournamentRepository
+from domain.controllers.tournament_controller import TournamentController, TournamentStateError
+from domain.ports.tournament_repository import ConcurrentModificationError
+from domain.ports.unit_of_work import IUnitOfWork
 from domain.views.components.input_view import InputView
 from infra.utils.match_utils import match_with_loaded_players
-from infra.utils.tournament_utils import create_pairs_for_next_round
+from infra.utils.round_utils import get_round_player_ids
+from infra.utils.tournament_utils import get_tournament_player_ids
+
+# Scores of both players for each choice of the results menu.
+RESULT_CHOICES = {"1": (1.0, 0.0), "2": (0.0, 1.0), "3": (0.5, 0.5)}
 
 
 class TournamentView:
-    def __init__(
-            self,
-            player_repository: IPlayerRepository,
-            tournament_repository: ITournamentRepository
-    ):
+    def __init__(self, unit_of_work: IUnitOfWork):
         """
         Initialize the tournament view with controllers, console, and sub-views.
+
+        The controllers share the unit of work: each menu action runs in its
+        own session, so the data files are read once per action and the
+        changes are written on commit.
         """
+        self.session = unit_of_work
         self.tournament_controller = TournamentController(
-            tournament_repository=tournament_repository,
-            player_repository=player_repository
+            tournament_repository=self.session.tournaments,
+            player_repository=self.session.players
         )
         self.player_controller = PlayerController(
-            repository=player_repository
+            repository=self.session.players
         )
         self.round_controller = RoundController(
-            tournament_repository=tournament_repository
+            tournament_repository=self.session.tournaments
         )
         self.console = Console(force_terminal=True)
         self.input_view = InputView(self.console)
@@ -65,27 +69,29 @@ class TournamentView:
 
             choice = input("\nEntrez votre choix: ")
 
-            if choice == "1":
-                self.list_tournaments_flow()
-            elif choice == "2":
-                self.add_tournament_flow()
-            elif choice == "3":
-                self.add_player_to_tournament_flow()
-            elif choice == "4":
-                self.start_tournament_flow()
-            elif choice == "5":
-                self.input_results_flow()
-            elif choice == "6":
-                self.show_tournament_details_flow()
-            elif choice == "7":
+            if choice == "7":
                 break
-            else:
-                self.console.print("[bold red]Choix invalide. "
-                                   "Veuillez réessayer.[/bold red]")
+
+            with self.session:
+                if choice == "1":
+                    self.list_tournaments_flow()
+                elif choice == "2":
+                    self.add_tournament_flow()
+                elif choice == "3":
+                    self.add_player_to_tournament_flow()
+                elif choice == "4":
+                    self.start_tournament_flow()
+                elif choice == "5":
+                    self.input_results_flow()
+                elif choice == "6":
+                    self.show_tournament_details_flow()
+                else:
+                    self.console.print("[bold red]Choix invalide. "
+                                       "Veuillez réessayer.[/bold red]")
 
     def list_tournaments_flow(self):
         """Display a table listing all tournaments."""
-        tournaments = self.tournament_controller.list_tournaments()
+        tournaments = self.tournament_controller.list_tournament_summaries()
         if not tournaments:
             self.console.print("[bold yellow]Aucun tournoi trouvé.[/bold yellow]")
             return
@@ -100,7 +106,6 @@ class TournamentView:
         table.add_column("ID", justify="center", style="cyan")
         table.add_column("Progress", justify="center", style="cyan")
         for tournament in tournaments:
-            progress = f"{tournament.current_round_number}/{tournament.number_of_rounds}"
             table.add_row(
                 tournament.name,
                 tournament.location,
@@ -108,7 +113,7 @@ class TournamentView:
                 tournament.end_date,
                 tournament.description,
                 tournament.tournament_id,
-                f"{tournament.status}\n({progress})"
+                f"{tournament.status}\n({tournament.progress})"
             )
             table.add_row()
         self.console.print(table)
@@ -181,31 +186,21 @@ class TournamentView:
             self.console.print(f"\nConfirmez-vous l'ajout du joueur [cyan]{player}[/cyan] au tournoi ?")
             confirmation = input("O/n").strip().lower()
             if confirmation in ["", "o", "oui"]:
-                tournament = self.tournament_controller.tournament_repository.get_by_id(
-                    tournament_id)
-                players = tournament.players
-                if player in players:
-                    self.console.print("[yellow]Ce joueur est déjà inscrit à  ce tournoi.[/yellow]")
+                if self.tournament_controller.add_player_to_tournament(tournament_id, player):
+                    self.console.print(f"[green]Joueur {player} ajouté avec succès.[/green]")
                 else:
-                    players.append(player)
-
-                    scores = tournament.scores.copy()
-                    if player.national_chess_id not in scores:
-                        scores[player.national_chess_id] = 0.0
-
-                        self.tournament_controller.update_tournament(
-                            tournament_id,
-                            players=players,
-                            scores=scores
-                        )
-
-                self.console.print(f"[green]Joueur {player} ajouté avec succès.[/green]")
+                    self.console.print("[yellow]Ce joueur est déjà inscrit à  ce tournoi.[/yellow]")
 
             self.console.print("[bold yellow]Voulez-vous ajouter un autre joueur à ce tournoi? (O/n): [/bold yellow] ")
             answer = input().strip().lower()
             if answer not in ["", "o", "oui"]:
                 break
 
+        try:
+            self.session.commit()
+        except ConcurrentModificationError:
+            self.print_concurrent_modification()
+
     def start_tournament_flow(self):
         """Start a selected tournament and generate the first round."""
         self.console.print("\n[bold blue]Voici l'ensemble des tournois:[/bold blue]")
@@ -219,42 +214,20 @@ class TournamentView:
             self.console.print("[bold red]Tournoi introuvable.[/bold red]")
             return
 
-        if tournament.status != "Non démarré":
-            self.console.print("\n[bold yellow]Ce tournoi est déjà commencé ou terminé[/bold yellow]")
+        try:
+            first_round = self.tournament_controller.start_tournament(tournament_id)
+            self.session.commit()
+        except TournamentStateError as error:
+            self.console.print(f"\n[bold yellow]{error}[/bold yellow]")
             return
-
-        if len(tournament.players) == 0:
-            self.console.print("\n[bold yellow]Veuillez ajouter des joueurs au tournoi.[/bold yellow]")
+        except ConcurrentModificationError:
+            self.print_concurrent_modification()
             return
-        elif len(tournament.players) % 2 != 0:
-            self.console.print("\n[bold yellow]Le nombre de jours est impair. "
-                               "Veuillez ajouter un joueur au tournoi.[/bold yellow]")
-            return
-
-        pairs = create_pairs_for_next_round(
-            tournament=tournament,
-            player_repository=self.tournament_controller.player_repository
-        )
-
-        matches = [Match(p1, p2) for p1, p2 in pairs]
-
-        first_round = self.round_controller.create_round(
-            tournament_id=tournament_id,
-            matches=matches
-        )
-
-        rounds = tournament.rounds
-        rounds.append(first_round)
-        self.tournament_controller.update_tournament(
-            tournament_id=tournament_id,
-            rounds=rounds,
-            status="En cours"
-        )
         self.console.print(f"\n[bold green]Démarrage du tournoi {tournament.name}...[/bold green]")
         self.console.print(f"{first_round.name}\n")
         for match in first_round.matches:
-            player1 = match.data[0][0]
-            player2 = match.data[1][0]
+            player1 = match.player1
+            player2 = match.player2
             self.console.print(f"• {player1.first_name} {player1.last_name} contre "
                                f"{player2.first_name} {player2.last_name}")
 
@@ -265,29 +238,30 @@ class TournamentView:
 
         self.console.print("\n[bold blue]Entrez l'ID du tournoi:[/bold blue]")
         tournament_to_be_played_id = self.input_view.input_tournament_id()
-        tournament = self.tournament_controller.get_by_id(tournament_to_be_played_id)
-
-        if tournament.status != "En cours":
-            self.console.print("Ce tournoi est non démarré ou déjà terminé.")
-            return
 
-        current_round_index = tournament.current_round_number - 1
-        if current_round_index >= len(tournament.rounds):
+        try:
+            current_round = self.tournament_controller.get_current_round(tournament_to_be_played_id)
+        except TournamentStateError as error:
+            self.console.print(str(error))
             return
 
-        current_round = tournament.rounds[current_round_index]
         self.console.print(f"\n[bold]Saisie des résultats pour le round {current_round.name}[/bold]")
 
+        player_repository = self.tournament_controller.player_repository
+        round_players = player_repository.get_many(get_round_player_ids(current_round))
+
+        results = []
         for i, raw_match in enumerate(current_round.matches, 1):
             match = match_with_loaded_players(
                 match=raw_match,
-                player_repository=self.tournament_controller.player_repository
+                player_repository=player_repository,
+                players_by_id=round_players
             )
-            self.console.print(f"\nMatch {i} : {match.data[0][0]} contre {match.data[1][0]}")
+            self.console.print(f"\nMatch {i} : {match.player1} contre {match.player2}")
 
             while True:
-                self.console.print(f"1 → Le gagnant est {match.data[0][0]}")
-                self.console.print(f"2 → Le gagnant est {match.data[1][0]}")
+                self.console.print(f"1 → Le gagnant est {match.player1}")
+                self.console.print(f"2 → Le gagnant est {match.player2}")
                 self.console.print("3 → Match nul")
                 self.console.print("4 → Choix aléatoire")
 
@@ -296,69 +270,36 @@ class TournamentView:
                 if choice == "4":
                     choice = str(randint(1, 3))
 
-                if choice == "1":
-                    match.set_scores(1.0, 0.0)
-                    self.console.print(match)
-                    break
-                elif choice == "2":
-                    match.set_scores(0.0, 1.0)
-                    self.console.print(match)
-                    break
-                elif choice == "3":
-                    match.set_scores(0.5, 0.5)
+                if choice in RESULT_CHOICES:
+                    match.set_scores(*RESULT_CHOICES[choice])
                     self.console.print(match)
+                    results.append(RESULT_CHOICES[choice])
                     break
-                else:
-                    self.console.print("[bold red]Choix invalide. "
-                                       "Veuillez réessayer.[/bold red]")
-
-            current_round.matches[i - 1] = match
-
-            player1_id = match.data[0][0].national_chess_id
-            player2_id = match.data[1][0].national_chess_id
-            score1, score2 = match.get_scores()
+                self.console.print("[bold red]Choix invalide. "
+                                   "Veuillez réessayer.[/bold red]")
 
-            tournament.scores[player1_id] += score1
-            tournament.scores[player2_id] += score2
+        try:
+            new_round = self.tournament_controller.submit_round_results(tournament_to_be_played_id, results)
+            self.session.commit()
+        except ConcurrentModificationError:
+            self.print_concurrent_modification()
+            return
 
-        current_round.end()
         self.console.print(f"\n[bold green] Le {current_round.name} "
                            f"est maintenant terminé.[bold green]")
 
-        if tournament.current_round_number >= tournament.number_of_rounds:
-            self.tournament_controller.update_tournament(
-                tournament_id=tournament_to_be_played_id,
-                scores=tournament.scores,
-                rounds=tournament.rounds,
-                status="Terminé"
-            )
+        if new_round is None:
             self.console.print("\n[bold green]Le tournoi est terminé![/bold green]")
+            return
 
-        else:
-            tournament.current_round_number += 1
-
-            pairs = create_pairs_for_next_round(
-                tournament=tournament,
-                player_repository=self.tournament_controller.player_repository
-            )
-
-            new_matches = [Match(p1, p2) for p1, p2 in pairs]
-            new_round = self.round_controller.create_round(
-                tournament_id=tournament_to_be_played_id,
-                matches=new_matches
-            )
-            tournament.rounds.append(new_round)
-
-            self.tournament_controller.update_tournament(
-                tournament_id=tournament_to_be_played_id,
-                current_round_number=tournament.current_round_number,
-                rounds=tournament.rounds,
-                scores=tournament.scores,
-            )
+        self.console.print("\n[bold green]Nouveau round généré :[/bold green]")
+        for match in new_round.matches:
+            self.console.print(f"{match.player1} contre {match.player2}")
 
-            self.console.print("\n[bold green]Nouveau round généré :[/bold green]")
-            for match in new_round.matches:
-                self.console.print(f"{match.data[0][0]} contre {match.data[1][0]}")
+    def print_concurrent_modification(self):
+        """Warn that the tournament was modified from another terminal meanwhile."""
+        self.console.print("[bold red]Ce tournoi a été modifié depuis un autre poste pendant la saisie. "
+                           "Les modifications n'ont pas été enregistrées, veuillez recommencer.[/bold red]")
 
     def show_tournament_details_flow(self):
 
@@ -376,11 +317,16 @@ class TournamentView:
         self.console.print(f"\n[cyan]{tournament.name} à {tournament.location} - "
                            f"{tournament.status}\n")
 
-        self.console.print("\n[bold]Joueurs du tournoi:[/bold]")
-        for player_id in tournament.players:
-            player = self.tournament_controller.player_repository.get_by_id(player_id)
-            total_score = tournament.scores.get(player_id, 0)
-            self.console.print(f"- {str(player)} : {total_score} points")
+        players_by_id = self.tournament_controller.player_repository.get_many(
+            get_tournament_player_ids(tournament)
+        )
+
+        self.console.print("\n[bold]Classement du tournoi:[/bold]")
+        standings = self.tournament_controller.get_standings(tournament)
+        for position, standing in enumerate(standings.ranking(players_by_id), 1):
+            self.console.print(f"{position}. {str(standing.player)} : {standing.points} points "
+                               f"(Buchholz {standing.buchholz}, "
+                               f"Sonneborn-Berger {standing.sonneborn_berger})")
 
         self.console.print("\n[bold]Rounds du tournoi:[/bold]")
 
@@ -398,8 +344,8 @@ class TournamentView:
                 player1_score = match_data["player1_score"]
                 player2_score = match_data["player2_score"]
 
-                player1 = self.tournament_controller.player_repository.get_by_id(player1_id)
-                player2 = self.tournament_controller.player_repository.get_by_id(player2_id)
+                player1 = players_by_id.get(player1_id)
+                player2 = players_by_id.get(player2_id)
 
                 self.console.print(
                     f"{str(player1)} ({player1_score}) vs {str(player2)} ({player2_score})"
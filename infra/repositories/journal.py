@@ -0,0 +1,226 @@
+"""Append-only JSON Lines journal with snapshot compaction, shared by the journal repositories."""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from infra.utils.file_lock import FileLock
+from infra.utils.file_utils import atomic_write
+from infra.utils.json_codec import JSONCodec, get_default_codec
+from infra.utils.json_patch import apply_patch
+
+
+def apply_event(records: Dict[str, dict], event: dict) -> None:
+    """Apply a single journal event to the records, in place."""
+    operation = event["op"]
+    record_id = event["id"]
+
+    if operation == "put":
+        records[record_id] = event["record"]
+    elif operation == "delete":
+        records.pop(record_id, None)
+    elif operation == "patch":
+        records[record_id] = apply_patch(records[record_id], event["patch"])
+    else:
+        raise ValueError(f"Unknown journal operation: {operation}")
+
+
+class JSONLinesJournal:
+    def __init__(
+            self,
+            journal_path: str,
+            snapshot_path: str,
+            seed_path: Optional[str] = None,
+            compact_every: int = 500,
+            codec: Optional[JSONCodec] = None
+    ):
+        """
+        Initialize a journal of records keyed by ID.
+
+        Args:
+            journal_path (str): Append-only file holding one JSON event per line.
+            snapshot_path (str): File holding the compacted state of all records.
+            seed_path (str, optional): Legacy JSON array used as initial state
+                when neither the snapshot nor the journal exist yet.
+            compact_every (int): Number of journal events after which the
+                journal is folded into a new snapshot.
+            codec (JSONCodec, optional): Codec used for the events and the
+                snapshot. Defaults to the fastest one installed.
+        """
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.seed_path = seed_path
+        self.compact_every = compact_every
+        self.codec = codec or get_default_codec()
+
+        self._records: Dict[str, dict] = {}
+        self._id_field: Optional[str] = None
+        self._snapshot_signature: Optional[Tuple[int, int]] = None
+        # Each compaction starts a new generation: the snapshot records the
+        # generation it was written for, and the new journal starts with a
+        # header line holding the same number. Events of a journal from an
+        # older generation are already in the snapshot, and are skipped.
+        self._snapshot_generation = 0
+        self._journal_generation = 0
+        self._journal_inode: Optional[int] = None
+        self._journal_stale = False
+        self._journal_offset = 0
+        self._journal_events = 0
+        self._loaded = False
+
+    def lock(self) -> FileLock:
+        """
+        Return an exclusive lock on the journal.
+
+        Writers must hold it from the moment they read the records they
+        modify until their events are appended.
+        """
+        return FileLock(self.journal_path)
+
+    @staticmethod
+    def _get_signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def records(self, id_field: str) -> Dict[str, dict]:
+        """
+        Return the current records, keyed by ID.
+
+        The state is rebuilt from the snapshot and the journal on first use.
+        Afterwards, only journal lines appended since the last call (e.g. by
+        another process) are read.
+
+        Args:
+            id_field (str): Name of the ID field, used when seeding from a legacy file.
+        """
+        self._id_field = id_field
+        if not self._loaded or self._get_signature(self.snapshot_path) != self._snapshot_signature:
+            self._load_snapshot()
+        self._read_journal_tail()
+        return self._records
+
+    def _load_snapshot(self) -> None:
+        self._records = {}
+        self._snapshot_generation = 0
+        self._snapshot_signature = self._get_signature(self.snapshot_path)
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._journal_events = 0
+        self._loaded = True
+
+        if os.path.exists(self.snapshot_path):
+            snapshot = self.codec.load_file(self.snapshot_path)
+            self._records = snapshot["records"]
+            self._snapshot_generation = snapshot.get("generation", 0)
+        elif (self.seed_path and os.path.exists(self.seed_path)
+                and not os.path.exists(self.journal_path)):
+            self._records = {
+                record[self._id_field]: record for record in self.codec.load_file(self.seed_path)
+            }
+
+    def _read_journal_tail(self) -> None:
+        try:
+            file = open(self.journal_path, "rb")
+        except FileNotFoundError:
+            return
+
+        with file:
+            inode = os.fstat(file.fileno()).st_ino
+            if inode != self._journal_inode:
+                # A new journal file, rotated by a compaction: the snapshot
+                # written before the rotation holds the events read so far.
+                if self._journal_inode is not None:
+                    self._load_snapshot()
+                self._journal_inode = inode
+                self._journal_generation = 0
+                self._journal_offset = 0
+                self._journal_events = 0
+
+            file.seek(self._journal_offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    # Incomplete last line (interrupted write): ignore it.
+                    break
+                if not line.strip():
+                    self._journal_offset += len(line)
+                    continue
+
+                event = self.codec.loads(line)
+                if event["op"] == "generation":
+                    self._journal_generation = event["generation"]
+                elif self._journal_generation != self._snapshot_generation:
+                    # The journal was folded into the snapshot, but a crash
+                    # interrupted the compaction before its rotation.
+                    self._journal_stale = True
+                    self._journal_inode = None
+                    return
+                else:
+                    apply_event(self._records, event)
+                    self._journal_events += 1
+                self._journal_offset += len(line)
+            self._journal_stale = self._journal_generation != self._snapshot_generation
+
+    def append(self, events: List[dict]) -> None:
+        """
+        Append events to the journal and apply them to the in-memory state.
+
+        The state must have been loaded with records() beforehand, and the
+        caller must hold lock().
+
+        Each call is a single write of the new lines; the rest of the data
+        set is never rewritten, except when the journal is compacted.
+        """
+        if not events:
+            return
+
+        if not os.path.exists(self.snapshot_path):
+            # Persist the initial (possibly seeded) state before the first event.
+            self.compact()
+
+        data = b"".join(self.codec.dumps(event) + b"\n" for event in events)
+
+        self._read_journal_tail()
+        if self._journal_stale or not os.path.exists(self.journal_path):
+            self._rotate_journal()
+        os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+        with open(self.journal_path, "ab") as file:
+            if file.tell() > self._journal_offset:
+                # Drop an incomplete line left by an interrupted write.
+                file.truncate(self._journal_offset)
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+
+        # Replaying the tail also picks up lines appended meanwhile by other processes.
+        self._read_journal_tail()
+
+        if self._journal_events >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Write the current state as the snapshot of a new generation, then
+        replace the journal with an empty one of that generation.
+
+        The caller must hold lock(). Each step is an atomic file
+        replacement: after a crash between them, the old journal is
+        recognized as already folded into the snapshot, and never replayed.
+        """
+        self._read_journal_tail()
+        if not self._journal_stale:
+            self._snapshot_generation += 1
+            atomic_write(
+                self.snapshot_path,
+                self.codec.dumps({"generation": self._snapshot_generation, "records": self._records})
+            )
+            self._snapshot_signature = self._get_signature(self.snapshot_path)
+        self._rotate_journal()
+
+    def _rotate_journal(self) -> None:
+        """Replace the journal with one holding the header of the snapshot generation only."""
+        header = self.codec.dumps({"op": "generation", "generation": self._snapshot_generation})
+        atomic_write(self.journal_path, header + b"\n")
+        self._journal_inode = None
+        self._read_journal_tail()
@@ -0,0 +1,157 @@
+"""Implementation of IPlayerRepository using an append-only JSON Lines journal."""
+
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from domain.models.player import Player
+from domain.ports.player_repository import IPlayerRepository, new_players_only
+from infra.repositories.journal import JSONLinesJournal
+from infra.utils.json_codec import JSONCodec
+from infra.utils.json_patch import make_patch
+from infra.utils.schema import player_from_record
+
+
+class JournalPlayerRepository(IPlayerRepository):
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    PLAYERS_DATA_DIR = os.path.normpath(os.path.join(
+        BASE_DIR, "..", "..", "data", "players"
+    ))
+    JOURNAL_FILE = os.path.join(PLAYERS_DATA_DIR, "players.journal.jsonl")
+    SNAPSHOT_FILE = os.path.join(PLAYERS_DATA_DIR, "players.snapshot.json")
+    SEED_FILE = os.path.join(PLAYERS_DATA_DIR, "players.json")
+
+    def __init__(self, compact_every: int = 500, codec: Optional[JSONCodec] = None):
+        """
+        Initialize the repository.
+
+        Every mutation is appended to the journal as a small event, and the
+        journal is folded into a snapshot every `compact_every` events,
+        encoded with `codec` (the fastest one installed by default).
+        """
+        self.journal = JSONLinesJournal(
+            journal_path=self.JOURNAL_FILE,
+            snapshot_path=self.SNAPSHOT_FILE,
+            seed_path=self.SEED_FILE,
+            compact_every=compact_every,
+            codec=codec
+        )
+
+    def _records(self) -> Dict[str, dict]:
+        return self.journal.records(id_field="national_chess_id")
+
+    def load_players(self) -> List[Player]:
+        """Load all players from the journal state, sorted by last name."""
+        players = [player_from_record(record) for record in self._records().values()]
+        return sorted(players, key=lambda p: p.last_name.lower())
+
+    def iter_players(self) -> Iterator[Player]:
+        """Yield all players sorted by last name, building each Player only when consumed."""
+        records = sorted(self._records().values(), key=lambda record: record["last_name"].lower())
+        for record in records:
+            yield player_from_record(record)
+
+    def save_players(self, players: List[Player]) -> None:
+        """Save all players, journaling only those that changed."""
+        with self.journal.lock():
+            self._save_players(players)
+
+    def _save_players(self, players: List[Player]) -> None:
+        records = self._records()
+        events = []
+
+        kept_ids = set()
+        for player in players:
+            record = player.to_dict()
+            player_id = record["national_chess_id"]
+            kept_ids.add(player_id)
+            if player_id not in records:
+                events.append({"op": "put", "id": player_id, "record": record})
+                continue
+            patch = make_patch(records[player_id], record)
+            if patch:
+                events.append({"op": "patch", "id": player_id, "patch": patch})
+
+        events.extend(
+            {"op": "delete", "id": player_id}
+            for player_id in records if player_id not in kept_ids
+        )
+        self.journal.append(events)
+
+    def add_players(self, players: List[Player]) -> int:
+        """Add the players not stored yet, appending one event per player."""
+        with self.journal.lock():
+            events = [
+                {"op": "put", "id": player.national_chess_id, "record": player.to_dict()}
+                for player in new_players_only(self._records(), players)
+            ]
+            self.journal.append(events)
+        return len(events)
+
+    def update_player_by_id(
+            self,
+            national_chess_id: str,
+            last_name: Optional[str] = None,
+            first_name: Optional[str] = None,
+            birth_date: Optional[str] = None
+    ) -> bool:
+        """
+        Update a player identified by national_chess_id.
+
+        Args:
+            national_chess_id (str): ID of the player to update.
+            last_name (str, optional): New last name.
+            first_name (str, optional): New first name.
+            birth_date (str, optional): New date of birth.
+
+        Returns:
+            bool: True if the player was found and updated, False otherwise.
+        """
+        fields = {"last_name": last_name, "first_name": first_name, "birth_date": birth_date}
+        patch = [
+            {"op": "replace", "path": f"/{field}", "value": value}
+            for field, value in fields.items() if value
+        ]
+
+        with self.journal.lock():
+            if national_chess_id not in self._records():
+                return False
+            if patch:
+                self.journal.append([{"op": "patch", "id": national_chess_id, "patch": patch}])
+        return True
+
+    def delete_player_by_id(self, national_chess_id: str) -> bool:
+        """
+        Delete a player identified by national_chess_id.
+
+        Args:
+            national_chess_id (str): ID of the player to delete.
+
+        Returns:
+            bool: True if the player was found and deleted, False otherwise.
+        """
+        with self.journal.lock():
+            if national_chess_id not in self._records():
+                return False
+            self.journal.append([{"op": "delete", "id": national_chess_id}])
+        return True
+
+    def get_by_id(self, player_id: str) -> Optional[Player]:
+        """Return a player by ID or None if not found.
+
+        Args:
+            player_id (str): The ID of the player to return.
+
+        Returns:
+            Optional[Player]: The Player instance if found, None otherwise.
+        """
+        record = self._records().get(player_id)
+        return player_from_record(record) if record else None
+
+    def get_many(self, player_ids: Iterable[str]) -> Dict[str, Player]:
+        """Return the players matching the given IDs, keyed by ID. Unknown IDs are omitted."""
+        records = self._records()
+        return {
+            player_id: player_from_record(records[player_id])
+            for player_id in player_ids
+            if player_id in records
+        }
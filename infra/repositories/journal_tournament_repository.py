@@ -0,0 +1,230 @@
+"""Implementation of ITournamentRepository using an append-only JSON Lines journal."""
+
+import os
+from typing import Dict, Iterator, List, Optional
+
+from domain.models.player import Player
+from domain.models.round import Round
+from domain.models.tournament import Tournament
+from domain.models.tournament_summary import TournamentSummary
+from domain.ports.tournament_repository import (
+    ConcurrentModificationError,
+    ITournamentRepository,
+    MatchRecord,
+    check_expected_versions,
+    next_tournament_id
+)
+from infra.repositories.journal import JSONLinesJournal
+from infra.utils.json_codec import JSONCodec
+from infra.utils.json_patch import apply_patch, make_patch
+from infra.utils.schema import tournament_from_record
+from infra.utils.tournament_utils import apply_tournament_updates, iter_match_records_from_dicts
+
+
+class JournalTournamentRepository(ITournamentRepository):
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    TOURNAMENTS_DATA_DIR = os.path.normpath(os.path.join(
+        BASE_DIR, "..", "..", "data", "tournaments"
+    ))
+    JOURNAL_FILE = os.path.join(TOURNAMENTS_DATA_DIR, "tournaments.journal.jsonl")
+    SNAPSHOT_FILE = os.path.join(TOURNAMENTS_DATA_DIR, "tournaments.snapshot.json")
+    SEED_FILE = os.path.join(TOURNAMENTS_DATA_DIR, "tournaments.json")
+
+    def __init__(
+            self,
+            compact_every: int = 500,
+            codec: Optional[JSONCodec] = None,
+            lazy_rounds: bool = True
+    ):
+        """
+        Initialize the repository.
+
+        Every mutation is appended to the journal as a small event, and the
+        journal is folded into a snapshot every `compact_every` events,
+        encoded with `codec` (the fastest one installed by default). On
+        first use, the state is rebuilt from the snapshot plus the journal
+        tail, or seeded from the legacy tournaments.json file.
+
+        With lazy_rounds, tournaments are returned as LazyTournament
+        instances, whose rounds are only decoded when accessed.
+        """
+        self.lazy_rounds = lazy_rounds
+        self.journal = JSONLinesJournal(
+            journal_path=self.JOURNAL_FILE,
+            snapshot_path=self.SNAPSHOT_FILE,
+            seed_path=self.SEED_FILE,
+            compact_every=compact_every,
+            codec=codec
+        )
+
+    def _records(self) -> Dict[str, dict]:
+        return self.journal.records(id_field="tournament_id")
+
+    def load_tournaments(self) -> List[Tournament]:
+        """Load all tournaments from the journal state."""
+        return [
+            tournament_from_record(record, lazy=self.lazy_rounds)
+            for record in self._records().values()
+        ]
+
+    def list_tournament_summaries(self) -> List[TournamentSummary]:
+        """Return the summaries of all tournaments, without copying their records."""
+        return [TournamentSummary.from_dict(record) for record in self._records().values()]
+
+    def iter_match_records(self) -> Iterator[MatchRecord]:
+        """Yield the match records of all tournaments, from the in-memory records."""
+        yield from iter_match_records_from_dicts(list(self._records().values()))
+
+    def save_tournaments(
+            self,
+            tournaments: List[Tournament],
+            expected_versions: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Save all tournaments, journaling only those that changed.
+
+        Raises:
+            ConcurrentModificationError: If expected_versions is given and a
+                tournament was updated, created or deleted since it was read.
+        """
+        with self.journal.lock():
+            if expected_versions is not None:
+                check_expected_versions(expected_versions, {
+                    tournament_id: record.get("version", 0)
+                    for tournament_id, record in self._records().items()
+                })
+            self._save_tournaments(tournaments)
+
+    def _save_tournaments(self, tournaments: List[Tournament]) -> None:
+        records = self._records()
+        events = []
+
+        kept_ids = set()
+        for tournament in tournaments:
+            record = tournament.to_dict()
+            tournament_id = record["tournament_id"]
+            kept_ids.add(tournament_id)
+            if tournament_id not in records:
+                events.append({"op": "put", "id": tournament_id, "record": record})
+                continue
+            patch = make_patch(records[tournament_id], record)
+            if patch:
+                events.append({"op": "patch", "id": tournament_id, "patch": patch})
+
+        events.extend(
+            {"op": "delete", "id": tournament_id}
+            for tournament_id in records if tournament_id not in kept_ids
+        )
+        self.journal.append(events)
+
+    def add_tournament(self, tournament: Tournament) -> str:
+        """Give a new tournament the next free ID, and journal it as a single event."""
+        with self.journal.lock():
+            tournament.tournament_id = next_tournament_id(self._records())
+            self.journal.append([
+                {"op": "put", "id": tournament.tournament_id, "record": tournament.to_dict()}
+            ])
+        return tournament.tournament_id
+
+    def update_tournament_by_id(
+            self,
+            tournament_id: str,
+            name: Optional[str] = None,
+            location: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            number_of_rounds: Optional[int] = None,
+            current_round_number: Optional[int] = None,
+            rounds: Optional[List[Round]] = None,
+            players: Optional[List[Player]] = None,
+            scores: Optional[Dict[str, float]] = None,
+            description: Optional[str] = None,
+            status: Optional[str] = None,
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Update a tournament identified by its ID and increment its version.
+
+        Only the fields, rounds and scores that actually changed are appended
+        to the journal.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+        """
+        with self.journal.lock():
+            records = self._records()
+            if tournament_id not in records:
+                return False
+
+            tournament = tournament_from_record(records[tournament_id], lazy=self.lazy_rounds)
+            if expected_version is not None and tournament.version != expected_version:
+                raise ConcurrentModificationError(
+                    tournament_id, expected_version, tournament.version
+                )
+            apply_tournament_updates(
+                tournament,
+                name=name,
+                location=location,
+                start_date=start_date,
+                end_date=end_date,
+                number_of_rounds=number_of_rounds,
+                current_round_number=current_round_number,
+                rounds=rounds,
+                players=players,
+                scores=scores,
+                description=description,
+                status=status
+            )
+            tournament.version += 1
+
+            patch = make_patch(records[tournament_id], tournament.to_dict())
+            self.journal.append([{"op": "patch", "id": tournament_id, "patch": patch}])
+        return True
+
+    def patch_tournament(
+            self,
+            tournament_id: str,
+            patch: List[dict],
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Apply a JSON Patch to a tournament and increment its version.
+
+        The patch itself is appended to the journal, along with the new
+        version: entering a match result appends a single short line.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+            SchemaError: If the patched tournament does not match the schema.
+        """
+        with self.journal.lock():
+            record = self._records().get(tournament_id)
+            if record is None:
+                return False
+            version = record.get("version", 0)
+            if expected_version is not None and version != expected_version:
+                raise ConcurrentModificationError(tournament_id, expected_version, version)
+
+            patch = [
+                *(operation for operation in patch if operation["path"] != "/version"),
+                {"op": "add", "path": "/version", "value": version + 1}
+            ]
+            tournament_from_record(apply_patch(record, patch))
+            self.journal.append([{"op": "patch", "id": tournament_id, "patch": patch}])
+        return True
+
+    def get_by_id(self, tournament_id: str) -> Optional[Tournament]:
+        """Return a tournament by ID or None if not found.
+
+        Args:
+            tournament_id (str): The ID of the tournament to return.
+
+        Returns:
+            Optional[Tournament]: The Tournament instance if found, None otherwise.
+        """
+        record = self._records().get(tournament_id)
+        if record is None:
+            return None
+        return tournament_from_record(record, lazy=self.lazy_rounds)
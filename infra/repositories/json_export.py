@@ -0,0 +1,58 @@
+"""
+Export of the JSON data files in an indented, human-readable form.
+
+The repositories write compact JSON on every mutation; this command writes
+indented copies of players.json and tournaments.json for reading or diffing.
+
+Usage (from the project root):
+    python -m infra.repositories.json_export [--output DIR]
+"""
+
+import argparse
+import os
+
+from infra.repositories.json_player_repository import JSONPlayerRepository
+from infra.repositories.json_tournament_repository import JSONTournamentRepository
+from infra.utils.file_utils import atomic_write
+from infra.utils.json_codec import get_default_codec
+
+DEFAULT_EXPORT_DIR = "exports"
+
+
+def export_pretty_json(output_dir: str = DEFAULT_EXPORT_DIR) -> tuple[str, str]:
+    """
+    Write indented copies of the players and tournaments files to output_dir.
+
+    Returns:
+        tuple[str, str]: Paths of the exported players and tournaments files.
+    """
+    codec = get_default_codec()
+    players = JSONPlayerRepository(codec=codec).load_players()
+    tournaments = JSONTournamentRepository(codec=codec).load_tournaments()
+
+    players_path = os.path.join(output_dir, "players.json")
+    tournaments_path = os.path.join(output_dir, "tournaments.json")
+    atomic_write(players_path, codec.dumps([player.to_dict() for player in players], pretty=True))
+    atomic_write(
+        tournaments_path,
+        codec.dumps([tournament.to_dict() for tournament in tournaments], pretty=True)
+    )
+
+    return players_path, tournaments_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the JSON data files in indented form.")
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_EXPORT_DIR,
+        help="Directory where the indented files are written."
+    )
+    args = parser.parse_args()
+
+    players_path, tournaments_path = export_pretty_json(args.output)
+    print(f"Données exportées vers {players_path} et {tournaments_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,14 @@
 """Implementation of IPlayerRepository using JSON storage."""
 
-import json
 import os
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from domain.models.player import Player
-from domain.ports.player_repository import IPlayerRepository
+from domain.ports.player_repository import IPlayerRepository, new_players_only
+from infra.utils.file_lock import FileLock
+from infra.utils.file_utils import atomic_write
+from infra.utils.json_codec import JSONCodec, get_default_codec
+from infra.utils.schema import decode_players
 
 
 class JSONPlayerRepository(IPlayerRepository):
@@ -14,28 +17,128 @@ class JSONPlayerRepository(IPlayerRepository):
         BASE_DIR, "..", "..", "data", "players", "players.json"
     ))
 
-    def load_players(self) -> List[Player]:
-        """Load all players from the JSON file."""
+    def __init__(
+            self,
+            cached: bool = False,
+            backup_count: int = 0,
+            codec: Optional[JSONCodec] = None
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            cached (bool): If True, players are kept in memory, indexed by
+                national_chess_id, and the file is only read again when its
+                modification time or size changes. Callers are given copies
+                of the cached players, so the cache only changes when the
+                file is written.
+            backup_count (int): Number of previous versions of the players
+                file to keep as players.json.1, players.json.2, ...
+            codec (JSONCodec, optional): Codec used to read and write the
+                file. Defaults to the fastest one installed.
+        """
+        self.cached = cached
+        self.codec = codec or get_default_codec()
+        self.backup_count = backup_count
+        # Every player of the file, sorted as load_players() returns them,
+        # and the first one of each ID, as found by get_by_id().
+        self._players: List[Player] = []
+        self._players_by_id: Dict[str, Player] = {}
+        self._file_signature: Optional[Tuple[int, int]] = None
+
+    def _read_players(self) -> List[Player]:
+        """
+        Read and sort all players from the JSON file.
+
+        Raises:
+            SchemaError: If the file does not match the schema of the players.
+        """
         if not os.path.exists(self.PLAYERS_DATA_FILE):
             return []
 
-        with open(self.PLAYERS_DATA_FILE, "r", encoding="utf-8") as file:
-            players_data = json.load(file)
-            players = [Player.from_dict(player_data) for player_data in players_data]
+        with open(self.PLAYERS_DATA_FILE, "rb") as file:
+            players = decode_players(file.read(), self.codec)
 
-            players_sorted = sorted(players, key=lambda p: p.last_name.lower())
+        players_sorted = sorted(players, key=lambda p: p.last_name.lower())
 
-            return players_sorted
+        return players_sorted
 
-    def save_players(self, players: List[Player]) -> None:
-        """Save all players to the JSON file."""
-        os.makedirs(os.path.dirname(self.PLAYERS_DATA_FILE), exist_ok=True)
-        json_data = json.dumps(
-            [player.to_dict() for player in players], indent=2
-        )
+    def _get_file_signature(self) -> Optional[Tuple[int, int]]:
+        """Return the (mtime, size) of the players file, or None if it does not exist."""
+        try:
+            stat = os.stat(self.PLAYERS_DATA_FILE)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh_cache(self) -> None:
+        """Reload the in-memory index if the players file changed on disk."""
+        signature = self._get_file_signature()
+        if signature is not None and signature == self._file_signature:
+            return
+
+        self._set_cache(self._read_players())
+        self._file_signature = signature
+
+    def _set_cache(self, players: List[Player]) -> None:
+        self._players = players
+        self._players_by_id = {}
+        for player in players:
+            self._players_by_id.setdefault(player.national_chess_id, player)
+
+    def load_players(self) -> List[Player]:
+        """Load all players from the JSON file."""
+        if not self.cached:
+            return self._read_players()
 
-        with open(self.PLAYERS_DATA_FILE, "w", encoding="utf-8") as file:
-            file.write(json_data)
+        self._refresh_cache()
+        return [_copy_player(player) for player in self._players]
+
+    def iter_players(self) -> Iterator[Player]:
+        """
+        Yield all players sorted by last name.
+
+        This does not run in constant memory: the players are sorted, so the
+        whole JSON array is decoded before the first one is yielded. In
+        cached mode, the cache already holds every player, and each one is
+        copied only when consumed, so no second list is built.
+        """
+        if not self.cached:
+            yield from self._read_players()
+            return
+
+        self._refresh_cache()
+        for player in self._players:
+            yield _copy_player(player)
+
+    def save_players(self, players: List[Player]) -> None:
+        """Save all players to the JSON file, atomically."""
+        with FileLock(self.PLAYERS_DATA_FILE):
+            self._write_players(players)
+
+    def _write_players(self, players: List[Player]) -> None:
+        """Write all players to the JSON file, atomically. The caller holds the lock."""
+        records = [player.to_dict() for player in players]
+
+        atomic_write(self.PLAYERS_DATA_FILE, self.codec.dumps(records), backup_count=self.backup_count)
+
+        if self.cached:
+            # Rebuild the cache from what was just written, without re-reading
+            # the file, and without sharing any instance with the caller.
+            self._set_cache(sorted(
+                (Player.from_dict(record) for record in records),
+                key=lambda p: p.last_name.lower()
+            ))
+            self._file_signature = self._get_file_signature()
+
+    def add_players(self, players: List[Player]) -> int:
+        """Add the players not stored yet, rewriting the JSON file once."""
+        with FileLock(self.PLAYERS_DATA_FILE):
+            stored = self.load_players()
+            new_players = new_players_only((player.national_chess_id for player in stored), players)
+            if new_players:
+                self._write_players(stored + new_players)
+        return len(new_players)
 
     def update_player_by_id(
             self,
@@ -56,19 +159,20 @@ class JSONPlayerRepository(IPlayerRepository):
         Returns:
             bool: True if the player was found and updated, False otherwise.
         """
-        players = self.load_players()
-        for player in players:
-            if player.national_chess_id == national_chess_id:
-                if last_name:
-                    player.last_name = last_name
-                if first_name:
-                    player.first_name = first_name
-                if birth_date:
-                    player.birth_date = birth_date
-
-                self.save_players(players)
-                return True
-        return False
+        with FileLock(self.PLAYERS_DATA_FILE):
+            players = self.load_players()
+            for player in players:
+                if player.national_chess_id == national_chess_id:
+                    if last_name:
+                        player.last_name = last_name
+                    if first_name:
+                        player.first_name = first_name
+                    if birth_date:
+                        player.birth_date = birth_date
+
+                    self._write_players(players)
+                    return True
+            return False
 
     def delete_player_by_id(self, national_chess_id: str) -> bool:
         """
@@ -80,14 +184,15 @@ class JSONPlayerRepository(IPlayerRepository):
         Returns:
             bool: True if the player was found and deleted, False otherwise.
         """
-        players = self.load_players()
-        for player in players:
-            if player.national_chess_id == national_chess_id:
-                players.remove(player)
+        with FileLock(self.PLAYERS_DATA_FILE):
+            players = self.load_players()
+            for player in players:
+                if player.national_chess_id == national_chess_id:
+                    players.remove(player)
 
-                self.save_players(players)
-                return True
-        return False
+                    self._write_players(players)
+                    return True
+            return False
 
     def get_by_id(self, player_id: str) -> Optional[Player]:
         """Return a player by ID or None if not found.
@@ -98,8 +203,44 @@ class JSONPlayerRepository(IPlayerRepository):
         Returns:
             Optional[Player]: The Player instance if found, None otherwise.
         """
+        if self.cached:
+            self._refresh_cache()
+            player = self._players_by_id.get(player_id)
+            return _copy_player(player) if player else None
+
         players = self.load_players()
         for player in players:
             if player.national_chess_id == player_id:
                 return player
         return None
+
+    def get_many(self, player_ids: Iterable[str]) -> Dict[str, Player]:
+        """Return the players matching the given IDs, resolved in a single pass.
+
+        Args:
+            player_ids (Iterable[str]): The IDs of the players to return.
+
+        Returns:
+            Dict[str, Player]: The players found, keyed by ID. Unknown IDs are omitted.
+        """
+        if self.cached:
+            self._refresh_cache()
+            return {
+                player_id: _copy_player(self._players_by_id[player_id])
+                for player_id in player_ids
+                if player_id in self._players_by_id
+            }
+
+        players_by_id = {
+            player.national_chess_id: player for player in self.load_players()
+        }
+        return {
+            player_id: players_by_id[player_id]
+            for player_id in player_ids
+            if player_id in players_by_id
+        }
+
+
+def _copy_player(player: Player) -> Player:
+    """Return a copy of a cached player, that the caller may modify."""
+    return Player(player.last_name, player.first_name, player.birth_date, player.national_chess_id)
@@ -1,40 +1,134 @@
 """Implementation of ITournamentRepository using JSON storage."""
 
-import json
 import os
-from typing import List, Optional, Dict
+from typing import Dict, Iterator, List, Optional
 
 from domain.models.player import Player
 from domain.models.round import Round
 from domain.models.tournament import Tournament
-from domain.ports.tournament_repository import ITournamentRepository
+from domain.models.tournament_summary import TournamentSummary
+from domain.ports.tournament_repository import (
+    ConcurrentModificationError,
+    ITournamentRepository,
+    MatchRecord,
+    check_expected_versions,
+    next_tournament_id
+)
+from infra.utils.file_lock import FileLock
+from infra.utils.file_utils import atomic_write
+from infra.utils.json_codec import JSONCodec, get_default_codec
+from infra.utils.json_patch import apply_patch
+from infra.utils.schema import decode_tournaments, tournament_from_record
+from infra.utils.tournament_utils import apply_tournament_updates, iter_match_records_from_dicts
 
 
 class JSONTournamentRepository(ITournamentRepository):
     TOURNAMENTS_DATA_FILE = "data/tournaments/tournaments.json"
+    reads_all_tournaments = True
+
+    def __init__(
+            self,
+            backup_count: int = 0,
+            codec: Optional[JSONCodec] = None,
+            lazy_rounds: bool = True
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            backup_count (int): Number of previous versions of the tournaments
+                file to keep as tournaments.json.1, tournaments.json.2, ...
+            codec (JSONCodec, optional): Codec used to read and write the
+                file. Defaults to the fastest one installed.
+            lazy_rounds (bool): If True, tournaments are loaded as
+                LazyTournament instances, whose rounds are only decoded when
+                accessed and are written back as read when left untouched.
+        """
+        self.backup_count = backup_count
+        self.codec = codec or get_default_codec()
+        self.lazy_rounds = lazy_rounds
 
     def load_tournaments(self) -> List[Tournament]:
-        """Load all tournaments from the JSON file."""
+        """
+        Load all tournaments from the JSON file.
+
+        Raises:
+            SchemaError: If the file does not match the schema of the tournaments.
+        """
         if not os.path.exists(self.TOURNAMENTS_DATA_FILE):
             return []
 
-        with open(self.TOURNAMENTS_DATA_FILE, "r", encoding="utf-8") as file:
-            tournaments_data = json.load(file)
+        with open(self.TOURNAMENTS_DATA_FILE, "rb") as file:
+            return decode_tournaments(file.read(), self.codec, lazy=self.lazy_rounds)
 
-            return [
-                Tournament.from_dict(tournament_data) for tournament_data in tournaments_data
-            ]
+    def list_tournament_summaries(self) -> List[TournamentSummary]:
+        """Return the summaries of all tournaments, reading the raw JSON data only."""
+        if not os.path.exists(self.TOURNAMENTS_DATA_FILE):
+            return []
 
-    def save_tournaments(self, tournaments: List[Tournament]) -> None:
-        """Save all tournaments to the JSON file."""
-        os.makedirs(os.path.dirname(self.TOURNAMENTS_DATA_FILE), exist_ok=True)
-        json_data = json.dumps(
-            [tournament.to_dict() for tournament in tournaments], indent=2, ensure_ascii=False
+        return [
+            TournamentSummary.from_dict(data)
+            for data in self.codec.load_file(self.TOURNAMENTS_DATA_FILE)
+        ]
+
+    def iter_match_records(self) -> Iterator[MatchRecord]:
+        """Yield the match records of all tournaments, reading the raw JSON data only."""
+        if not os.path.exists(self.TOURNAMENTS_DATA_FILE):
+            return
+
+        tournaments_data = self.codec.load_file(self.TOURNAMENTS_DATA_FILE)
+        yield from iter_match_records_from_dicts(tournaments_data)
+
+    def _write_tournaments(self, tournaments: List[Tournament]) -> None:
+        """Write all tournaments to the JSON file, atomically. The caller holds the lock."""
+        json_data = self.codec.dumps([tournament.to_dict() for tournament in tournaments])
+
+        atomic_write(self.TOURNAMENTS_DATA_FILE, json_data, backup_count=self.backup_count)
+
+    def save_tournaments(
+            self,
+            tournaments: List[Tournament],
+            expected_versions: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Save all tournaments to the JSON file, atomically.
+
+        Raises:
+            ConcurrentModificationError: If expected_versions is given and a
+                tournament was updated, created or deleted since it was read.
+        """
+        with FileLock(self.TOURNAMENTS_DATA_FILE):
+            if expected_versions is not None:
+                stored = []
+                if os.path.exists(self.TOURNAMENTS_DATA_FILE):
+                    stored = self.codec.load_file(self.TOURNAMENTS_DATA_FILE)
+                check_expected_versions(
+                    expected_versions,
+                    {record["tournament_id"]: record.get("version", 0) for record in stored}
+                )
+            self._write_tournaments(tournaments)
 
-        )
+    def add_tournament(self, tournament: Tournament) -> str:
+        """
+        Give a new tournament the next free ID and append it to the JSON file.
 
-        with open(self.TOURNAMENTS_DATA_FILE, "w", encoding="utf-8") as file:
-            file.write(json_data)
+        The ID is allocated while the file is locked, and the other
+        tournaments are written back as read, without being decoded.
+        """
+        with FileLock(self.TOURNAMENTS_DATA_FILE):
+            tournaments_data = []
+            if os.path.exists(self.TOURNAMENTS_DATA_FILE):
+                tournaments_data = self.codec.load_file(self.TOURNAMENTS_DATA_FILE)
+            tournament.tournament_id = next_tournament_id(
+                record.get("tournament_id", "") for record in tournaments_data
+            )
+            tournaments_data.append(tournament.to_dict())
+            atomic_write(
+                self.TOURNAMENTS_DATA_FILE,
+                self.codec.dumps(tournaments_data),
+                backup_count=self.backup_count
+            )
+        return tournament.tournament_id
 
     def update_tournament_by_id(
             self,
@@ -49,37 +143,88 @@ class JSONTournamentRepository(ITournamentRepository):
             players: Optional[List[Player]] = None,
             scores: Optional[Dict[str, float]] = None,
             description: Optional[str] = None,
-            status: Optional[str] = None
+            status: Optional[str] = None,
+            expected_version: Optional[int] = None
     ) -> bool:
-        tournaments = self.load_tournaments()
-        for tournament in tournaments:
-            if tournament.tournament_id == tournament_id:
-                if name:
-                    tournament.name = name
-                if location:
-                    tournament.location = location
-                if start_date:
-                    tournament.start_date = start_date
-                if end_date:
-                    tournament.end_date = end_date
-                if number_of_rounds:
-                    tournament.number_of_rounds = number_of_rounds
-                if current_round_number:
-                    tournament.current_round_number = current_round_number
-                if rounds:
-                    tournament.rounds = rounds
-                if players:
-                    tournament.players = players
-                if scores:
-                    tournament.scores = scores
-                if description:
-                    tournament.description = description
-                if status:
-                    tournament.status = status
-
-                self.save_tournaments(tournaments)
-                return True
-        return False
+        """
+        Update a tournament identified by its ID and increment its version.
+
+        The file is locked for the whole load-modify-save cycle, so that
+        concurrent writers cannot overwrite each other.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+        """
+        with FileLock(self.TOURNAMENTS_DATA_FILE):
+            tournaments = self.load_tournaments()
+            for tournament in tournaments:
+                if tournament.tournament_id == tournament_id:
+                    if expected_version is not None and tournament.version != expected_version:
+                        raise ConcurrentModificationError(
+                            tournament_id, expected_version, tournament.version
+                        )
+                    apply_tournament_updates(
+                        tournament,
+                        name=name,
+                        location=location,
+                        start_date=start_date,
+                        end_date=end_date,
+                        number_of_rounds=number_of_rounds,
+                        current_round_number=current_round_number,
+                        rounds=rounds,
+                        players=players,
+                        scores=scores,
+                        description=description,
+                        status=status
+                    )
+                    tournament.version += 1
+
+                    self._write_tournaments(tournaments)
+                    return True
+            return False
+
+    def patch_tournament(
+            self,
+            tournament_id: str,
+            patch: List[dict],
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Apply a JSON Patch to a tournament and increment its version.
+
+        The patch is applied to the raw data of the file: no other tournament
+        is decoded, and only the patched one is validated against the schema.
+        The file still has to be written as a whole.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+            SchemaError: If the patched tournament does not match the schema.
+        """
+        with FileLock(self.TOURNAMENTS_DATA_FILE):
+            if not os.path.exists(self.TOURNAMENTS_DATA_FILE):
+                return False
+
+            tournaments_data = self.codec.load_file(self.TOURNAMENTS_DATA_FILE)
+            for index, record in enumerate(tournaments_data):
+                if record.get("tournament_id") == tournament_id:
+                    version = record.get("version", 0)
+                    if expected_version is not None and version != expected_version:
+                        raise ConcurrentModificationError(tournament_id, expected_version, version)
+
+                    record = apply_patch(record, patch)
+                    record["version"] = version + 1
+                    tournament_from_record(record, path=("$", index))
+                    tournaments_data[index] = record
+
+                    atomic_write(
+                        self.TOURNAMENTS_DATA_FILE,
+                        self.codec.dumps(tournaments_data),
+                        backup_count=self.backup_count
+                    )
+                    return True
+            return False
 
     def get_by_id(self, tournament_id: str) -> Optional[Tournament]:
         """Return a tournament by ID or None if not found.
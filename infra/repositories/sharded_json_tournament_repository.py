@@ -0,0 +1,310 @@
+"""Implementation of ITournamentRepository storing one JSON file per tournament."""
+
+import os
+from contextlib import ExitStack
+from typing import List, Optional, Dict
+
+from domain.models.player import Player
+from domain.models.round import Round
+from domain.models.tournament import Tournament
+from domain.models.tournament_summary import TournamentSummary
+from domain.ports.tournament_repository import (
+    ConcurrentModificationError,
+    ITournamentRepository,
+    check_expected_versions,
+    next_tournament_id
+)
+from infra.utils.file_lock import FileLock
+from infra.utils.file_utils import atomic_write
+from infra.utils.json_codec import JSONCodec, get_default_codec
+from infra.utils.json_patch import apply_patch
+from infra.utils.schema import decode_tournament, decode_tournaments, tournament_from_record
+from infra.utils.tournament_utils import apply_tournament_updates
+
+# Fields of a tournament copied into the manifest, for list views.
+MANIFEST_FIELDS = (
+    "tournament_id", "name", "location", "start_date", "end_date", "description",
+    "status", "current_round_number", "number_of_rounds", "version"
+)
+
+
+def tournament_manifest_entry(tournament: Tournament) -> dict:
+    """Return the manifest entry (list-view fields) of a tournament."""
+    entry = {field: getattr(tournament, field) for field in MANIFEST_FIELDS}
+    entry["player_count"] = len(tournament.players)
+    return entry
+
+
+class ShardedJSONTournamentRepository(ITournamentRepository):
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    TOURNAMENTS_DATA_DIR = os.path.normpath(os.path.join(
+        BASE_DIR, "..", "..", "data", "tournaments"
+    ))
+    MANIFEST_FILE = os.path.join(TOURNAMENTS_DATA_DIR, "manifest.json")
+    LEGACY_DATA_FILE = os.path.join(TOURNAMENTS_DATA_DIR, "tournaments.json")
+
+    def __init__(
+            self,
+            backup_count: int = 0,
+            codec: Optional[JSONCodec] = None,
+            lazy_rounds: bool = True
+    ):
+        """
+        Initialize the repository.
+
+        Each tournament is stored in its own file (data/tournaments/T001.json),
+        and manifest.json holds the list-view fields of every tournament in
+        creation order. Reading or updating a tournament only touches its own
+        file and the small manifest.
+
+        On first use, an existing tournaments.json file is split into shards.
+
+        Args:
+            backup_count (int): Number of previous versions kept for each file.
+            codec (JSONCodec, optional): Codec used to read and write the
+                files. Defaults to the fastest one installed.
+            lazy_rounds (bool): If True, tournaments are loaded as
+                LazyTournament instances, whose rounds are only decoded when
+                accessed.
+        """
+        self.backup_count = backup_count
+        self.codec = codec or get_default_codec()
+        self.lazy_rounds = lazy_rounds
+
+    def shard_path(self, tournament_id: str) -> str:
+        """Return the path of the file holding the given tournament."""
+        return os.path.join(self.TOURNAMENTS_DATA_DIR, f"{tournament_id}.json")
+
+    def load_manifest(self) -> List[dict]:
+        """Return the manifest entries of all tournaments, without reading any shard."""
+        self._ensure_sharded()
+        return self._read_manifest()
+
+    def _read_manifest(self) -> List[dict]:
+        if not os.path.exists(self.MANIFEST_FILE):
+            return []
+
+        return self.codec.load_file(self.MANIFEST_FILE)
+
+    def _write_manifest(self, entries: List[dict]) -> None:
+        atomic_write(
+            self.MANIFEST_FILE,
+            self.codec.dumps(entries),
+            backup_count=self.backup_count
+        )
+
+    def _write_shard(self, tournament: Tournament) -> None:
+        atomic_write(
+            self.shard_path(tournament.tournament_id),
+            self.codec.dumps(tournament.to_dict()),
+            backup_count=self.backup_count
+        )
+
+    def _read_shard(self, tournament_id: str) -> Optional[Tournament]:
+        try:
+            with open(self.shard_path(tournament_id), "rb") as file:
+                return decode_tournament(file.read(), self.codec, lazy=self.lazy_rounds)
+        except FileNotFoundError:
+            return None
+
+    def _ensure_sharded(self) -> None:
+        """Split the single-file tournaments.json into one shard per tournament, once."""
+        if os.path.exists(self.MANIFEST_FILE) or not os.path.exists(self.LEGACY_DATA_FILE):
+            return
+
+        with FileLock(self.MANIFEST_FILE):
+            if os.path.exists(self.MANIFEST_FILE):
+                return
+            with open(self.LEGACY_DATA_FILE, "rb") as file:
+                tournaments = decode_tournaments(file.read(), self.codec)
+            for tournament in tournaments:
+                self._write_shard(tournament)
+            self._write_manifest([tournament_manifest_entry(t) for t in tournaments])
+
+    def load_tournaments(self) -> List[Tournament]:
+        """Load all tournaments, in manifest order."""
+        tournaments = [
+            self._read_shard(entry["tournament_id"]) for entry in self.load_manifest()
+        ]
+        return [tournament for tournament in tournaments if tournament is not None]
+
+    def list_tournament_summaries(self) -> List[TournamentSummary]:
+        """Return the summaries of all tournaments, reading the manifest only."""
+        return [TournamentSummary.from_dict(entry) for entry in self.load_manifest()]
+
+    def save_tournaments(
+            self,
+            tournaments: List[Tournament],
+            expected_versions: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Save all tournaments: one shard per tournament, plus the manifest.
+
+        Shards of tournaments that are no longer in the list are removed.
+        The manifest and every shard written or removed stay locked for the
+        whole save.
+
+        Raises:
+            ConcurrentModificationError: If expected_versions is given and a
+                tournament was updated, created or deleted since it was read.
+        """
+        self._ensure_sharded()
+        with FileLock(self.MANIFEST_FILE), ExitStack() as shard_locks:
+            previous_ids = {entry["tournament_id"] for entry in self._read_manifest()}
+            locked_ids = previous_ids | {tournament.tournament_id for tournament in tournaments}
+            for tournament_id in sorted(locked_ids):
+                shard_locks.enter_context(FileLock(self.shard_path(tournament_id)))
+
+            if expected_versions is not None:
+                stored_versions = {}
+                for tournament_id in previous_ids:
+                    try:
+                        stored_versions[tournament_id] = self.codec.load_file(
+                            self.shard_path(tournament_id)
+                        ).get("version", 0)
+                    except FileNotFoundError:
+                        pass
+                check_expected_versions(expected_versions, stored_versions)
+
+            for tournament in tournaments:
+                self._write_shard(tournament)
+            self._write_manifest([tournament_manifest_entry(t) for t in tournaments])
+
+            kept_ids = {tournament.tournament_id for tournament in tournaments}
+            for tournament_id in previous_ids - kept_ids:
+                if os.path.exists(self.shard_path(tournament_id)):
+                    os.remove(self.shard_path(tournament_id))
+
+    def add_tournament(self, tournament: Tournament) -> str:
+        """
+        Give a new tournament the next free ID, and write its shard and its
+        manifest entry only.
+
+        The manifest stays locked from the allocation of the ID to the
+        write of the new entry, so that concurrent creations get distinct
+        IDs and are all listed.
+        """
+        self._ensure_sharded()
+        with FileLock(self.MANIFEST_FILE):
+            entries = self._read_manifest()
+            tournament.tournament_id = next_tournament_id(entry["tournament_id"] for entry in entries)
+            with FileLock(self.shard_path(tournament.tournament_id)):
+                self._write_shard(tournament)
+            entries.append(tournament_manifest_entry(tournament))
+            self._write_manifest(entries)
+        return tournament.tournament_id
+
+    def update_tournament_by_id(
+            self,
+            tournament_id: str,
+            name: Optional[str] = None,
+            location: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            number_of_rounds: Optional[int] = None,
+            current_round_number: Optional[int] = None,
+            rounds: Optional[List[Round]] = None,
+            players: Optional[List[Player]] = None,
+            scores: Optional[Dict[str, float]] = None,
+            description: Optional[str] = None,
+            status: Optional[str] = None,
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Update a tournament identified by its ID and increment its version.
+
+        Only the shard of this tournament is read and rewritten, then its
+        entry of the manifest is refreshed.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+        """
+        self._ensure_sharded()
+        with FileLock(self.shard_path(tournament_id)):
+            tournament = self._read_shard(tournament_id)
+            if tournament is None:
+                return False
+            if expected_version is not None and tournament.version != expected_version:
+                raise ConcurrentModificationError(
+                    tournament_id, expected_version, tournament.version
+                )
+
+            apply_tournament_updates(
+                tournament,
+                name=name,
+                location=location,
+                start_date=start_date,
+                end_date=end_date,
+                number_of_rounds=number_of_rounds,
+                current_round_number=current_round_number,
+                rounds=rounds,
+                players=players,
+                scores=scores,
+                description=description,
+                status=status
+            )
+            tournament.version += 1
+            self._write_shard(tournament)
+
+        self._refresh_manifest_entry(tournament)
+        return True
+
+    def patch_tournament(
+            self,
+            tournament_id: str,
+            patch: List[dict],
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Apply a JSON Patch to a tournament and increment its version.
+
+        The patch is applied to the raw data of the shard, which is checked
+        against the schema, then written back; its entry of the manifest is
+        refreshed.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+            SchemaError: If the patched tournament does not match the schema.
+        """
+        self._ensure_sharded()
+        path = self.shard_path(tournament_id)
+        with FileLock(path):
+            try:
+                record = self.codec.load_file(path)
+            except FileNotFoundError:
+                return False
+            version = record.get("version", 0)
+            if expected_version is not None and version != expected_version:
+                raise ConcurrentModificationError(tournament_id, expected_version, version)
+
+            record = apply_patch(record, patch)
+            record["version"] = version + 1
+            tournament = tournament_from_record(record)
+            atomic_write(path, self.codec.dumps(record), backup_count=self.backup_count)
+
+        self._refresh_manifest_entry(tournament)
+        return True
+
+    def _refresh_manifest_entry(self, tournament: Tournament) -> None:
+        """Replace the manifest entry of a tournament, unless a newer version is already listed."""
+        with FileLock(self.MANIFEST_FILE):
+            entries = self._read_manifest()
+            for index, entry in enumerate(entries):
+                if entry["tournament_id"] == tournament.tournament_id and entry["version"] < tournament.version:
+                    entries[index] = tournament_manifest_entry(tournament)
+                    self._write_manifest(entries)
+                    break
+
+    def get_by_id(self, tournament_id: str) -> Optional[Tournament]:
+        """Return a tournament by ID or None if not found.
+
+        Args:
+            tournament_id (str): The ID of the tournament to return.
+
+        Returns:
+            Optional[Tournament]: The Tournament instance if found, None otherwise.
+        """
+        self._ensure_sharded()
+        return self._read_shard(tournament_id)
@@ -0,0 +1,103 @@
+"""SQLite connection and schema shared by the SQLite repositories."""
+
+import os
+import sqlite3
+from typing import Iterable, Iterator, List, Sequence
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    national_chess_id TEXT PRIMARY KEY,
+    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birth_date TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    tournament_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    number_of_rounds INTEGER NOT NULL,
+    current_round_number INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    description TEXT,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- A row per registered player (position set) and/or per score entry (score set).
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id TEXT NOT NULL,
+    national_chess_id TEXT NOT NULL,
+    position INTEGER,
+    score REAL,
+    PRIMARY KEY (tournament_id, national_chess_id)
+);
+CREATE INDEX IF NOT EXISTS idx_tournament_players_player
+    ON tournament_players (national_chess_id);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_id TEXT NOT NULL,
+    round_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    start_datetime TEXT,
+    end_datetime TEXT,
+    round_id TEXT,
+    PRIMARY KEY (tournament_id, round_index)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_id TEXT NOT NULL,
+    round_index INTEGER NOT NULL,
+    match_index INTEGER NOT NULL,
+    player1_id TEXT NOT NULL,
+    player2_id TEXT NOT NULL,
+    player1_score REAL NOT NULL DEFAULT 0,
+    player2_score REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (tournament_id, round_index, match_index)
+);
+CREATE INDEX IF NOT EXISTS idx_matches_player1 ON matches (player1_id);
+CREATE INDEX IF NOT EXISTS idx_matches_player2 ON matches (player2_id);
+"""
+
+# SQLite refuses statements with too many bound parameters: IN (...) lists are chunked.
+MAX_BOUND_PARAMETERS = 500
+
+
+def connect(database_path: str) -> sqlite3.Connection:
+    """
+    Open a connection to the database, creating the schema if needed.
+
+    The database uses write-ahead logging, so readers never block the writer.
+    """
+    os.makedirs(os.path.dirname(database_path), exist_ok=True)
+    connection = sqlite3.connect(database_path)
+    connection.row_factory = sqlite3.Row
+    # Case folding of Python, so that ORDER BY matches the order of load_players().
+    connection.create_function("lower_name", 1, str.lower, deterministic=True)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+
+    tournament_columns = {row["name"] for row in connection.execute("PRAGMA table_info(tournaments)")}
+    if "version" not in tournament_columns:
+        # Databases created before tournaments were versioned.
+        connection.execute("ALTER TABLE tournaments ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    return connection
+
+
+def chunked(values: Iterable[str], size: int = MAX_BOUND_PARAMETERS) -> Iterator[List[str]]:
+    """Split values into lists of at most `size` items."""
+    chunk: List[str] = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def placeholders(values: Sequence) -> str:
+    """Return the '?, ?, ...' placeholder list for the given values."""
+    return ", ".join("?" for _ in values)
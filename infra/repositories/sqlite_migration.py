@@ -0,0 +1,58 @@
+"""
+One-shot migration of the JSON data files into the SQLite database.
+
+Usage (from the project root):
+    python -m infra.repositories.sqlite_migration [--database PATH]
+"""
+
+import argparse
+
+from config import SQLITE_DATABASE_PATH
+from domain.ports.player_repository import new_players_only
+from infra.repositories.json_player_repository import JSONPlayerRepository
+from infra.repositories.json_tournament_repository import JSONTournamentRepository
+from infra.repositories.sqlite_player_repository import SQLitePlayerRepository
+from infra.repositories.sqlite_tournament_repository import SQLiteTournamentRepository
+
+
+def migrate_json_to_sqlite(database_path: str = SQLITE_DATABASE_PATH) -> tuple[int, int, list[str]]:
+    """
+    Copy every player and tournament from the JSON files into the SQLite database.
+
+    Existing rows of the database are replaced. The database holds one player
+    per ID: when players.json repeats an ID, the player found by get_by_id()
+    is kept, and the other rows are dropped.
+
+    Returns:
+        tuple[int, int, list[str]]: Number of players and tournaments
+        migrated, and the ID of each player row dropped as a duplicate.
+    """
+    all_players = JSONPlayerRepository().load_players()
+    players = new_players_only((), all_players)
+    kept = set(map(id, players))
+    dropped_ids = [player.national_chess_id for player in all_players if id(player) not in kept]
+    tournaments = JSONTournamentRepository().load_tournaments()
+
+    SQLitePlayerRepository(database_path).save_players(players)
+    SQLiteTournamentRepository(database_path).save_tournaments(tournaments)
+
+    return len(players), len(tournaments), dropped_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate the JSON data files to SQLite.")
+    parser.add_argument(
+        "--database",
+        default=SQLITE_DATABASE_PATH,
+        help="Path of the SQLite database to create or replace."
+    )
+    args = parser.parse_args()
+
+    player_count, tournament_count, dropped_ids = migrate_json_to_sqlite(args.database)
+    for player_id in dropped_ids:
+        print(f"Joueur {player_id} en double dans players.json : une ligne ignorée.")
+    print(f"{player_count} joueur(s) et {tournament_count} tournoi(s) migrés vers {args.database}")
+
+
+if __name__ == "__main__":
+    main()
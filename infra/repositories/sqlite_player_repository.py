@@ -0,0 +1,124 @@
+"""Implementation of IPlayerRepository using SQLite storage."""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from config import SQLITE_DATABASE_PATH
+from domain.models.player import Player
+from domain.ports.player_repository import IPlayerRepository
+from infra.repositories.sqlite_database import chunked, connect, placeholders
+
+SELECT_PLAYERS = "SELECT last_name, first_name, birth_date, national_chess_id FROM players"
+INSERT_PLAYER = (
+    "INSERT INTO players (national_chess_id, last_name, first_name, birth_date) "
+    "VALUES (:national_chess_id, :last_name, :first_name, :birth_date)"
+)
+INSERT_NEW_PLAYER = INSERT_PLAYER.replace("INSERT", "INSERT OR IGNORE", 1)
+UPDATE_PLAYER = (
+    "UPDATE players SET last_name = COALESCE(?, last_name), "
+    "first_name = COALESCE(?, first_name), birth_date = COALESCE(?, birth_date) "
+    "WHERE national_chess_id = ?"
+)
+
+
+class SQLitePlayerRepository(IPlayerRepository):
+    def __init__(self, database_path: str = SQLITE_DATABASE_PATH):
+        """Initialize the repository with the path of the SQLite database."""
+        self.connection = connect(database_path)
+
+    def load_players(self) -> List[Player]:
+        """Load all players from the database."""
+        players = [
+            Player.from_dict(dict(row))
+            for row in self.connection.execute(SELECT_PLAYERS)
+        ]
+        return sorted(players, key=lambda p: p.last_name.lower())
+
+    def iter_players(self) -> Iterator[Player]:
+        """Yield all players sorted by last name, one database row at a time."""
+        cursor = self.connection.execute(f"{SELECT_PLAYERS} ORDER BY lower_name(last_name)")
+        for row in cursor:
+            yield Player.from_dict(dict(row))
+
+    def save_players(self, players: List[Player]) -> None:
+        """Replace all players in the database."""
+        with self.connection:
+            self.connection.execute("DELETE FROM players")
+            self.connection.executemany(
+                INSERT_PLAYER, [player.to_dict() for player in players]
+            )
+
+    def add_players(self, players: List[Player]) -> int:
+        """Insert the players not stored yet, in a single transaction."""
+        changes = self.connection.total_changes
+        with self.connection:
+            self.connection.executemany(
+                INSERT_NEW_PLAYER, [player.to_dict() for player in players]
+            )
+        return self.connection.total_changes - changes
+
+    def update_player_by_id(
+            self,
+            national_chess_id: str,
+            last_name: Optional[str] = None,
+            first_name: Optional[str] = None,
+            birth_date: Optional[str] = None
+    ) -> bool:
+        """
+        Update a player identified by national_chess_id.
+
+        Args:
+            national_chess_id (str): ID of the player to update.
+            last_name (str, optional): New last name.
+            first_name (str, optional): New first name.
+            birth_date (str, optional): New date of birth.
+
+        Returns:
+            bool: True if the player was found and updated, False otherwise.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                UPDATE_PLAYER,
+                (last_name or None, first_name or None, birth_date or None, national_chess_id)
+            )
+        return cursor.rowcount > 0
+
+    def delete_player_by_id(self, national_chess_id: str) -> bool:
+        """
+        Delete a player identified by national_chess_id.
+
+        Args:
+            national_chess_id (str): ID of the player to delete.
+
+        Returns:
+            bool: True if the player was found and deleted, False otherwise.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM players WHERE national_chess_id = ?", (national_chess_id,)
+            )
+        return cursor.rowcount > 0
+
+    def get_by_id(self, player_id: str) -> Optional[Player]:
+        """Return a player by ID or None if not found.
+
+        Args:
+            player_id (str): The ID of the player to return.
+
+        Returns:
+            Optional[Player]: The Player instance if found, None otherwise.
+        """
+        row = self.connection.execute(
+            f"{SELECT_PLAYERS} WHERE national_chess_id = ?", (player_id,)
+        ).fetchone()
+        return Player.from_dict(dict(row)) if row else None
+
+    def get_many(self, player_ids: Iterable[str]) -> Dict[str, Player]:
+        """Return the players matching the given IDs, keyed by ID. Unknown IDs are omitted."""
+        players: Dict[str, Player] = {}
+        for chunk in chunked(set(player_ids)):
+            rows = self.connection.execute(
+                f"{SELECT_PLAYERS} WHERE national_chess_id IN ({placeholders(chunk)})", chunk
+            )
+            for row in rows:
+                players[row["national_chess_id"]] = Player.from_dict(dict(row))
+        return players
@@ -0,0 +1,521 @@
+"""Implementation of ITournamentRepository using SQLite storage."""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import SQLITE_DATABASE_PATH
+from domain.models.match import Match
+from domain.models.player import Player
+from domain.models.round import Round
+from domain.models.tournament import Tournament
+from domain.models.tournament_summary import TournamentSummary
+from domain.ports.tournament_repository import (
+    ConcurrentModificationError,
+    ITournamentRepository,
+    MatchRecord,
+    check_expected_versions,
+    next_tournament_id
+)
+from infra.repositories.sqlite_database import connect
+from infra.utils.json_patch import apply_patch, parse_pointer
+
+TOURNAMENT_COLUMNS = (
+    "tournament_id", "name", "location", "start_date", "end_date",
+    "number_of_rounds", "current_round_number", "status", "description", "version"
+)
+INSERT_TOURNAMENT = (
+    f"INSERT INTO tournaments ({', '.join(TOURNAMENT_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in TOURNAMENT_COLUMNS)})"
+)
+INSERT_TOURNAMENT_PLAYER = (
+    "INSERT INTO tournament_players (tournament_id, national_chess_id, position, score) "
+    "VALUES (?, ?, ?, ?)"
+)
+INSERT_ROUND = (
+    "INSERT INTO rounds (tournament_id, round_index, name, start_datetime, end_datetime, round_id) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+INSERT_MATCH = (
+    "INSERT INTO matches (tournament_id, round_index, match_index, "
+    "player1_id, player2_id, player1_score, player2_score) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+SELECT_SUMMARIES = (
+    "SELECT t.tournament_id, t.name, t.location, t.start_date, t.end_date, t.description, "
+    "t.status, t.current_round_number, t.number_of_rounds, t.version, "
+    "(SELECT COUNT(*) FROM tournament_players p "
+    "WHERE p.tournament_id = t.tournament_id AND p.position IS NOT NULL) AS player_count "
+    "FROM tournaments t ORDER BY t.rowid"
+)
+SELECT_MATCH_RECORDS = (
+    "SELECT m.tournament_id, m.round_index + 1, m.player1_id, m.player2_id, "
+    "m.player1_score, m.player2_score, r.end_datetime IS NOT NULL "
+    "FROM matches m JOIN tournaments t ON t.tournament_id = m.tournament_id "
+    "JOIN rounds r ON r.tournament_id = m.tournament_id AND r.round_index = m.round_index "
+    "ORDER BY t.rowid, m.round_index, m.match_index"
+)
+CHILD_TABLES = ("tournament_players", "rounds", "matches")
+# Columns a patch may set directly (tournament_id and version are not patchable).
+PATCHABLE_COLUMNS = TOURNAMENT_COLUMNS[1:-1]
+ROUND_COLUMNS = ("name", "start_datetime", "end_datetime", "round_id")
+MATCH_COLUMNS = ("player1_id", "player2_id", "player1_score", "player2_score")
+UPSERT_SCORE = (
+    "INSERT INTO tournament_players (tournament_id, national_chess_id, score) VALUES (?, ?, ?) "
+    "ON CONFLICT (tournament_id, national_chess_id) DO UPDATE SET score = excluded.score"
+)
+UPSERT_POSITION = (
+    "INSERT INTO tournament_players (tournament_id, national_chess_id, position) VALUES (?, ?, ?) "
+    "ON CONFLICT (tournament_id, national_chess_id) DO UPDATE SET position = excluded.position"
+)
+
+
+class SQLiteTournamentRepository(ITournamentRepository):
+    def __init__(self, database_path: str = SQLITE_DATABASE_PATH):
+        """Initialize the repository with the path of the SQLite database."""
+        self.connection = connect(database_path)
+
+    def _select(self, table: str, tournament_id: Optional[str], order_by: str):
+        """Select the rows of a table, for one tournament or for all of them."""
+        if tournament_id is None:
+            return self.connection.execute(f"SELECT * FROM {table} ORDER BY {order_by}")
+        return self.connection.execute(
+            f"SELECT * FROM {table} WHERE tournament_id = ? ORDER BY {order_by}",
+            (tournament_id,)
+        )
+
+    def _fetch(self, tournament_id: Optional[str] = None) -> List[Tournament]:
+        """
+        Build Tournament instances from the database, in insertion order.
+
+        A fixed number of queries is run, whatever the number of tournaments.
+        """
+        tournament_rows = self._select("tournaments", tournament_id, "rowid").fetchall()
+        if not tournament_rows:
+            return []
+
+        players = defaultdict(list)
+        scores = defaultdict(dict)
+        for row in self._select("tournament_players", tournament_id, "tournament_id, position"):
+            if row["position"] is not None:
+                players[row["tournament_id"]].append(row["national_chess_id"])
+            if row["score"] is not None:
+                scores[row["tournament_id"]][row["national_chess_id"]] = row["score"]
+
+        matches = defaultdict(list)
+        for row in self._select("matches", tournament_id, "tournament_id, round_index, match_index"):
+            matches[(row["tournament_id"], row["round_index"])].append(Match(
+                player1=row["player1_id"],
+                player2=row["player2_id"],
+                player1_score=row["player1_score"],
+                player2_score=row["player2_score"],
+            ))
+
+        rounds = defaultdict(list)
+        for row in self._select("rounds", tournament_id, "tournament_id, round_index"):
+            rounds[row["tournament_id"]].append(Round(
+                name=row["name"],
+                matches=matches[(row["tournament_id"], row["round_index"])],
+                start_datetime=_parse_datetime(row["start_datetime"]),
+                end_datetime=_parse_datetime(row["end_datetime"]),
+                round_id=row["round_id"],
+            ))
+
+        return [
+            Tournament(
+                name=row["name"],
+                location=row["location"],
+                start_date=row["start_date"],
+                end_date=row["end_date"],
+                number_of_rounds=row["number_of_rounds"],
+                current_round_number=row["current_round_number"],
+                status=row["status"],
+                rounds=rounds[row["tournament_id"]],
+                players=players[row["tournament_id"]],
+                scores=scores[row["tournament_id"]],
+                description=row["description"],
+                tournament_id=row["tournament_id"],
+                version=row["version"],
+            )
+            for row in tournament_rows
+        ]
+
+    def _insert_players(
+            self,
+            tournament_id: str,
+            players: List[Player | str],
+            scores: Dict[str, float]
+    ) -> None:
+        player_ids = [p.national_chess_id if isinstance(p, Player) else p for p in players]
+        rows = [
+            (tournament_id, player_id, position, scores.get(player_id))
+            for position, player_id in enumerate(player_ids)
+        ]
+        registered = set(player_ids)
+        rows.extend(
+            (tournament_id, player_id, None, score)
+            for player_id, score in scores.items() if player_id not in registered
+        )
+        self.connection.executemany(INSERT_TOURNAMENT_PLAYER, rows)
+
+    def _insert_rounds(self, tournament_id: str, rounds: List[Round]) -> None:
+        round_rows = []
+        match_rows = []
+        for round_index, round_ in enumerate(rounds):
+            round_row, round_match_rows = _round_rows(tournament_id, round_index, round_.to_dict())
+            round_rows.append(round_row)
+            match_rows.extend(round_match_rows)
+        self.connection.executemany(INSERT_ROUND, round_rows)
+        self.connection.executemany(INSERT_MATCH, match_rows)
+
+    def load_tournaments(self) -> List[Tournament]:
+        """Load all tournaments from the database."""
+        return self._fetch()
+
+    def list_tournament_summaries(self) -> List[TournamentSummary]:
+        """Return the summaries of all tournaments with a single query."""
+        return list(self.iter_tournament_summaries())
+
+    def iter_tournament_summaries(self) -> Iterator[TournamentSummary]:
+        """Yield the summaries of all tournaments, one database row at a time."""
+        for row in self.connection.execute(SELECT_SUMMARIES):
+            yield TournamentSummary(**dict(row))
+
+    def iter_match_records(self) -> Iterator[MatchRecord]:
+        """Yield the match records of all tournaments, one database row at a time."""
+        for *row, played in self.connection.execute(SELECT_MATCH_RECORDS):
+            yield (*row, bool(played))
+
+    def save_tournaments(
+            self,
+            tournaments: List[Tournament],
+            expected_versions: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Replace all tournaments in the database, in a single transaction.
+
+        Raises:
+            ConcurrentModificationError: If expected_versions is given and a
+                tournament was updated, created or deleted since it was read.
+        """
+        with self.connection:
+            if expected_versions is not None:
+                # Take the write lock before reading the versions checked.
+                self.connection.execute("BEGIN IMMEDIATE")
+                check_expected_versions(expected_versions, {
+                    row["tournament_id"]: row["version"]
+                    for row in self.connection.execute("SELECT tournament_id, version FROM tournaments")
+                })
+            for table in ("tournaments",) + CHILD_TABLES:
+                self.connection.execute(f"DELETE FROM {table}")
+            for tournament in tournaments:
+                data = tournament.to_dict()
+                self.connection.execute(
+                    INSERT_TOURNAMENT, {column: data[column] for column in TOURNAMENT_COLUMNS}
+                )
+                self._insert_players(tournament.tournament_id, tournament.players, tournament.scores)
+                self._insert_rounds(tournament.tournament_id, tournament.rounds)
+
+    def add_tournament(self, tournament: Tournament) -> str:
+        """
+        Give a new tournament the next free ID and insert it.
+
+        The write lock of the database is taken before the IDs are read, so
+        that concurrent creations are given distinct IDs.
+        """
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            tournament.tournament_id = next_tournament_id(
+                row[0] for row in self.connection.execute("SELECT tournament_id FROM tournaments")
+            )
+            data = tournament.to_dict()
+            self.connection.execute(
+                INSERT_TOURNAMENT, {column: data[column] for column in TOURNAMENT_COLUMNS}
+            )
+            self._insert_players(tournament.tournament_id, tournament.players, tournament.scores)
+            self._insert_rounds(tournament.tournament_id, tournament.rounds)
+        return tournament.tournament_id
+
+    def update_tournament_by_id(
+            self,
+            tournament_id: str,
+            name: Optional[str] = None,
+            location: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            number_of_rounds: Optional[int] = None,
+            current_round_number: Optional[int] = None,
+            rounds: Optional[List[Round]] = None,
+            players: Optional[List[Player]] = None,
+            scores: Optional[Dict[str, float]] = None,
+            description: Optional[str] = None,
+            status: Optional[str] = None,
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Update a tournament identified by its ID and increment its version.
+
+        Only the row of this tournament is updated, along with its players,
+        scores or rounds when they are given. The version check and the
+        update are a single compare-and-swap statement.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+        """
+        fields = {
+            "name": name,
+            "location": location,
+            "start_date": start_date,
+            "end_date": end_date,
+            "number_of_rounds": number_of_rounds,
+            "current_round_number": current_round_number,
+            "description": description,
+            "status": status,
+        }
+        fields = {column: value for column, value in fields.items() if value is not None}
+
+        with self.connection:
+            if not self._increment_version(tournament_id, expected_version, fields):
+                return False
+
+            if players is not None or scores is not None:
+                if players is None or scores is None:
+                    current = self._fetch(tournament_id)[0]
+                    players = current.players if players is None else players
+                    scores = current.scores if scores is None else scores
+                self._replace_players(tournament_id, players, scores)
+
+            if rounds is not None:
+                self._replace_rounds(tournament_id, rounds)
+        return True
+
+    def patch_tournament(
+            self,
+            tournament_id: str,
+            patch: List[dict],
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Apply a JSON Patch to a tournament and increment its version.
+
+        Each operation is translated into a targeted statement: a match
+        result updates its match row and the two score rows, a new round
+        inserts its round and match rows. A patch with operations that have
+        no such translation (e.g. removing a round) rewrites the tournament
+        instead. Everything runs in the transaction of the version check.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+        """
+        with self.connection:
+            if not self._increment_version(tournament_id, expected_version):
+                return False
+
+            statements = self._patch_statements(tournament_id, patch)
+            if statements is None:
+                self._rewrite(tournament_id, patch)
+                return True
+            for statement, parameters in statements:
+                self.connection.execute(statement, parameters)
+        return True
+
+    def _increment_version(
+            self,
+            tournament_id: str,
+            expected_version: Optional[int],
+            fields: Optional[dict] = None
+    ) -> bool:
+        """
+        Set the given columns and increment the version, in a single
+        compare-and-swap statement. The caller holds the transaction.
+
+        Returns:
+            bool: False if no tournament has this ID.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                stored tournament is at another version.
+        """
+        fields = fields or {}
+        assignments = "".join(f"{column} = :{column}, " for column in fields)
+        cursor = self.connection.execute(
+            f"UPDATE tournaments SET {assignments}version = version + 1 "
+            "WHERE tournament_id = :tournament_id "
+            "AND (:expected_version IS NULL OR version = :expected_version)",
+            {**fields, "tournament_id": tournament_id, "expected_version": expected_version}
+        )
+        if cursor.rowcount == 0:
+            row = self.connection.execute(
+                "SELECT version FROM tournaments WHERE tournament_id = ?", (tournament_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            raise ConcurrentModificationError(tournament_id, expected_version, row["version"])
+        return True
+
+    def _replace_players(
+            self,
+            tournament_id: str,
+            players: List[Player | str],
+            scores: Dict[str, float]
+    ) -> None:
+        self.connection.execute(
+            "DELETE FROM tournament_players WHERE tournament_id = ?", (tournament_id,)
+        )
+        self._insert_players(tournament_id, players, scores)
+
+    def _replace_rounds(self, tournament_id: str, rounds: List[Round]) -> None:
+        for table in ("rounds", "matches"):
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE tournament_id = ?", (tournament_id,)
+            )
+        self._insert_rounds(tournament_id, rounds)
+
+    def _count(self, table: str, tournament_id: str, condition: str = "", parameters: tuple = ()) -> int:
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE tournament_id = ?{condition}",
+            (tournament_id, *parameters)
+        ).fetchone()[0]
+
+    def _patch_statements(
+            self,
+            tournament_id: str,
+            patch: List[dict]
+    ) -> Optional[List[Tuple[str, tuple]]]:
+        """
+        Translate patch operations into (statement, parameters) pairs.
+
+        Values set in place and players, rounds or matches appended at the
+        end of their list are translated. None is returned as soon as an
+        operation is not (e.g. a removal, or an insertion in the middle).
+        """
+        statements = []
+        # Current length of the lists appended to, counted on first append.
+        lengths = {}
+
+        def append_index(key: tuple, token: str, count) -> Optional[int]:
+            if key not in lengths:
+                lengths[key] = count()
+            if token not in ("-", str(lengths[key])):
+                return None
+            lengths[key] += 1
+            return lengths[key] - 1
+
+        for operation in patch:
+            op = operation["op"]
+            tokens = parse_pointer(operation["path"])
+            value = operation.get("value")
+            if op == "remove" or not tokens:
+                return None
+            if tokens == ["version"]:
+                continue
+
+            if len(tokens) == 1 and tokens[0] in PATCHABLE_COLUMNS:
+                statements.append((
+                    f"UPDATE tournaments SET {tokens[0]} = ? WHERE tournament_id = ?",
+                    (value, tournament_id)
+                ))
+            elif len(tokens) == 2 and tokens[0] == "scores":
+                statements.append((UPSERT_SCORE, (tournament_id, tokens[1], value)))
+            elif len(tokens) == 2 and tokens[0] == "players" and op == "add":
+                position = append_index(("players",), tokens[1], lambda: self._count(
+                    "tournament_players", tournament_id, " AND position IS NOT NULL"
+                ))
+                if position is None:
+                    return None
+                statements.append((UPSERT_POSITION, (tournament_id, value, position)))
+            elif tokens[0] != "rounds" or not tokens[1].isdigit():
+                return None
+            elif len(tokens) == 2 and op == "add":
+                round_index = append_index(
+                    ("rounds",), tokens[1], lambda: self._count("rounds", tournament_id)
+                )
+                if round_index is None:
+                    return None
+                round_row, match_rows = _round_rows(tournament_id, round_index, value)
+                lengths[("matches", round_index)] = len(match_rows)
+                statements.append((INSERT_ROUND, round_row))
+                statements.extend((INSERT_MATCH, match_row) for match_row in match_rows)
+            elif len(tokens) == 3 and tokens[2] in ROUND_COLUMNS and op == "replace":
+                statements.append((
+                    f"UPDATE rounds SET {tokens[2]} = ? WHERE tournament_id = ? AND round_index = ?",
+                    (value, tournament_id, int(tokens[1]))
+                ))
+            elif len(tokens) == 4 and tokens[2] == "matches" and op == "add":
+                round_index = int(tokens[1])
+                match_index = append_index(("matches", round_index), tokens[3], lambda: self._count(
+                    "matches", tournament_id, " AND round_index = ?", (round_index,)
+                ))
+                if match_index is None:
+                    return None
+                statements.append((
+                    INSERT_MATCH, _match_row(tournament_id, round_index, match_index, value)
+                ))
+            elif (len(tokens) == 5 and tokens[2] == "matches" and tokens[3].isdigit()
+                    and tokens[4] in MATCH_COLUMNS and op == "replace"):
+                statements.append((
+                    f"UPDATE matches SET {tokens[4]} = ? "
+                    "WHERE tournament_id = ? AND round_index = ? AND match_index = ?",
+                    (value, tournament_id, int(tokens[1]), int(tokens[3]))
+                ))
+            else:
+                return None
+        return statements
+
+    def _rewrite(self, tournament_id: str, patch: List[dict]) -> None:
+        """Apply a patch to the stored tournament and write all its rows again."""
+        patched = apply_patch(self._fetch(tournament_id)[0].to_dict(), patch)
+        tournament = Tournament.from_dict(patched)
+        data = tournament.to_dict()
+        assignments = ", ".join(f"{column} = :{column}" for column in PATCHABLE_COLUMNS)
+        self.connection.execute(
+            f"UPDATE tournaments SET {assignments} WHERE tournament_id = :tournament_id",
+            {**{column: data[column] for column in PATCHABLE_COLUMNS}, "tournament_id": tournament_id}
+        )
+        self._replace_players(tournament_id, tournament.players, tournament.scores)
+        self._replace_rounds(tournament_id, tournament.rounds)
+
+    def get_by_id(self, tournament_id: str) -> Optional[Tournament]:
+        """Return a tournament by ID or None if not found.
+
+        Args:
+            tournament_id (str): The ID of the tournament to return.
+
+        Returns:
+            Optional[Tournament]: The Tournament instance if found, None otherwise.
+        """
+        tournaments = self._fetch(tournament_id)
+        return tournaments[0] if tournaments else None
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _match_row(tournament_id: str, round_index: int, match_index: int, match_data: dict) -> tuple:
+    """Return the row of a match dictionary, with the defaults of Match.from_dict."""
+    return (
+        tournament_id, round_index, match_index,
+        match_data["player1_id"], match_data["player2_id"],
+        match_data.get("player1_score", 0.0), match_data.get("player2_score", 0.0)
+    )
+
+
+def _round_rows(tournament_id: str, round_index: int, round_data: dict) -> Tuple[tuple, List[tuple]]:
+    """
+    Return the row of a round dictionary, and the rows of its matches.
+
+    Missing fields get the defaults of Round.from_dict, so that rounds
+    written before these fields existed can be inserted.
+    """
+    round_row = (
+        tournament_id, round_index, round_data["name"],
+        round_data.get("start_datetime"), round_data.get("end_datetime"), round_data.get("round_id")
+    )
+    match_rows = [
+        _match_row(tournament_id, round_index, match_index, match_data)
+        for match_index, match_data in enumerate(round_data.get("matches", []))
+    ]
+    return round_row, match_rows
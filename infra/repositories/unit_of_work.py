@@ -0,0 +1,502 @@
+"""
+Unit of work shared by the controllers for the duration of one user action.
+
+The session wraps the player and tournament repositories. Inside a
+`with session:` block, every object read is kept in an identity map, so
+reading the same tournament or player again returns the same instance
+without querying the repository, and every write is applied to those
+instances only. The changes are written once, when the session commits:
+explicitly with commit(), or when the block exits without an exception.
+
+Each tournament handed out by the session is snapshotted as a dictionary.
+On commit, it is compared with its snapshot, and only the differences, as a
+JSON Patch, are written: the changed fields, scores and match results, and
+the rounds or matches appended.
+
+Outside a session, the wrapped repositories are used directly.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from domain.models.player import Player
+from domain.models.round import Round
+from domain.models.tournament import Tournament
+from domain.models.tournament_summary import TournamentSummary
+from domain.ports.player_repository import IPlayerRepository, new_players_only
+from domain.ports.unit_of_work import IUnitOfWork
+from domain.ports.tournament_repository import (
+    ConcurrentModificationError,
+    ITournamentRepository,
+    MatchRecord
+)
+from infra.utils.json_patch import apply_patch, make_patch
+from infra.utils.tournament_utils import apply_tournament_updates
+
+
+class SessionPlayerRepository(IPlayerRepository):
+    def __init__(self, repository: IPlayerRepository):
+        """
+        Initialize the session view of a player repository.
+
+        Args:
+            repository (IPlayerRepository): Repository read on first access
+                and written on commit.
+        """
+        self.repository = repository
+        self.active = False
+        self._players_by_id: Dict[str, Player] = {}
+        self._players: Optional[List[Player]] = None
+        self._pending: List[Tuple[str, tuple]] = []
+
+    def clear(self) -> None:
+        """Forget every loaded player and every pending change."""
+        self._players_by_id = {}
+        self._players = None
+        self._pending = []
+
+    def _register(self, player: Player) -> Player:
+        """Add a player to the identity map, keeping the instance already mapped if any."""
+        return self._players_by_id.setdefault(player.national_chess_id, player)
+
+    def load_players(self) -> List[Player]:
+        """Load all players, from the repository on first call only."""
+        if not self.active:
+            return self.repository.load_players()
+
+        if self._players is None:
+            self._players = [self._register(player) for player in self.repository.load_players()]
+        return list(self._players)
+
+    def save_players(self, players: List[Player]) -> None:
+        """Replace the list of players; it is saved when the session commits."""
+        if not self.active:
+            self.repository.save_players(players)
+            return
+
+        self._players = list(players)
+        self._players_by_id = {player.national_chess_id: player for player in self._players}
+        self._pending.append(("save", (self._players,)))
+
+    def add_players(self, players: List[Player]) -> int:
+        """Add the players not known yet; they are added when the session commits."""
+        if not self.active:
+            return self.repository.add_players(players)
+
+        self.load_players()
+        new_players = new_players_only(self._players_by_id, players)
+        self._players.extend(new_players)
+        for player in new_players:
+            self._register(player)
+        if new_players:
+            self._pending.append(("add", (new_players,)))
+        return len(new_players)
+
+    def update_player_by_id(
+            self,
+            national_chess_id: str,
+            last_name: Optional[str] = None,
+            first_name: Optional[str] = None,
+            birth_date: Optional[str] = None
+    ) -> bool:
+        """Update a loaded player; the update is written when the session commits."""
+        if not self.active:
+            return self.repository.update_player_by_id(national_chess_id, last_name, first_name, birth_date)
+
+        player = self.get_by_id(national_chess_id)
+        if player is None:
+            return False
+        if last_name:
+            player.last_name = last_name
+        if first_name:
+            player.first_name = first_name
+        if birth_date:
+            player.birth_date = birth_date
+        self._pending.append(("update", (national_chess_id, last_name, first_name, birth_date)))
+        return True
+
+    def delete_player_by_id(self, national_chess_id: str) -> bool:
+        """Delete a player; the deletion is written when the session commits."""
+        if not self.active:
+            return self.repository.delete_player_by_id(national_chess_id)
+
+        player = self.get_by_id(national_chess_id)
+        if player is None:
+            return False
+        del self._players_by_id[national_chess_id]
+        if self._players is not None:
+            self._players.remove(player)
+        self._pending.append(("delete", (national_chess_id,)))
+        return True
+
+    def get_by_id(self, player_id: str) -> Optional[Player]:
+        """Return a player by ID, from the identity map when already loaded."""
+        if not self.active:
+            return self.repository.get_by_id(player_id)
+        return self.get_many([player_id]).get(player_id)
+
+    def get_many(self, player_ids: Iterable[str]) -> Dict[str, Player]:
+        """
+        Return the players matching the given IDs. Only the IDs not loaded
+        yet in the session are queried from the repository, in a single call.
+        """
+        if not self.active:
+            return self.repository.get_many(player_ids)
+
+        player_ids = list(player_ids)
+        if self._players is None:
+            missing = [player_id for player_id in player_ids if player_id not in self._players_by_id]
+            if missing:
+                for player in self.repository.get_many(missing).values():
+                    self._register(player)
+
+        players_by_id = self._players_by_id
+        return {
+            player_id: players_by_id[player_id]
+            for player_id in player_ids
+            if player_id in players_by_id
+        }
+
+    def flush(self) -> None:
+        """Write the pending changes to the repository."""
+        pending = self._pending
+        # A save writes the whole list, which already holds the earlier changes.
+        saves = [index for index, (operation, _) in enumerate(pending) if operation == "save"]
+        if saves:
+            pending = pending[saves[-1]:]
+
+        for operation, arguments in pending:
+            if operation == "save":
+                self.repository.save_players(*arguments)
+            elif operation == "add":
+                self.repository.add_players(*arguments)
+            elif operation == "update":
+                self.repository.update_player_by_id(*arguments)
+            else:
+                self.repository.delete_player_by_id(*arguments)
+        self._pending = []
+
+
+class SessionTournamentRepository(ITournamentRepository):
+    def __init__(self, repository: ITournamentRepository):
+        """
+        Initialize the session view of a tournament repository.
+
+        When the repository decodes every tournament on each read
+        (reads_all_tournaments), the first read of the session loads them
+        all, and every later read is served from the identity map.
+
+        Args:
+            repository (ITournamentRepository): Repository read on first
+                access and written on commit.
+        """
+        self.repository = repository
+        self.active = False
+        self._tournaments_by_id: Dict[str, Tournament] = {}
+        self._tournaments: Optional[List[Tournament]] = None
+        # Version of each tournament as read from the repository, checked on commit.
+        self._loaded_versions: Dict[str, int] = {}
+        # Dictionary of each tournament handed out, as it was when handed out.
+        self._snapshots: Dict[str, dict] = {}
+        self._save_all = False
+
+    def clear(self) -> None:
+        """Forget every loaded tournament and every pending change."""
+        self._tournaments_by_id = {}
+        self._tournaments = None
+        self._loaded_versions = {}
+        self._snapshots = {}
+        self._save_all = False
+
+    def _register(self, tournament: Tournament) -> Tournament:
+        """Add a tournament to the identity map, keeping the instance already mapped if any."""
+        mapped = self._tournaments_by_id.get(tournament.tournament_id)
+        if mapped is not None:
+            return mapped
+        self._tournaments_by_id[tournament.tournament_id] = tournament
+        self._loaded_versions[tournament.tournament_id] = tournament.version
+        return tournament
+
+    def _track(self, tournament: Tournament) -> Tournament:
+        """Snapshot a tournament about to be handed out, unless it already is."""
+        if tournament.tournament_id not in self._snapshots:
+            self._snapshots[tournament.tournament_id] = _snapshot(tournament)
+        return tournament
+
+    def _changes(self, tournament_id: str) -> List[dict]:
+        """Return the JSON Patch from the snapshot of a tournament to its current state."""
+        tournament = self._tournaments_by_id[tournament_id]
+        return make_patch(self._snapshots[tournament_id], tournament.to_dict())
+
+    def _load_all(self) -> List[Tournament]:
+        if self._tournaments is None:
+            self._tournaments = [
+                self._register(tournament) for tournament in self.repository.load_tournaments()
+            ]
+        return self._tournaments
+
+    def load_tournaments(self) -> List[Tournament]:
+        """Load all tournaments, from the repository on first call only."""
+        if not self.active:
+            return self.repository.load_tournaments()
+        return [self._track(tournament) for tournament in self._load_all()]
+
+    def list_tournament_summaries(self) -> List[TournamentSummary]:
+        """Return the summaries of all tournaments, from the identity map once it is loaded."""
+        if not self.active:
+            return self.repository.list_tournament_summaries()
+
+        if self._tournaments is None and not self.repository.reads_all_tournaments:
+            return self.repository.list_tournament_summaries()
+        return [TournamentSummary.from_tournament(tournament) for tournament in self._load_all()]
+
+    def iter_match_records(self) -> Iterator[MatchRecord]:
+        """Yield the match records of all tournaments, including the changes not committed yet."""
+        if self.active and (self._save_all or any(map(self._changes, self._snapshots))):
+            yield from super().iter_match_records()
+        else:
+            yield from self.repository.iter_match_records()
+
+    def save_tournaments(
+            self,
+            tournaments: List[Tournament],
+            expected_versions: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Replace the list of tournaments; it is saved when the session commits,
+        provided that the stored tournaments are still those the session read.
+        """
+        if not self.active:
+            self.repository.save_tournaments(tournaments, expected_versions)
+            return
+
+        # Read every stored tournament first, so that the commit can check
+        # that none was updated, created or deleted meanwhile.
+        self._load_all()
+        self._tournaments = list(tournaments)
+        self._tournaments_by_id = {
+            tournament.tournament_id: tournament for tournament in self._tournaments
+        }
+        self._save_all = True
+
+    def add_tournament(self, tournament: Tournament) -> str:
+        """
+        Store a new tournament at once, as its ID is allocated by the
+        repository, then keep it in the identity map of the session.
+        """
+        tournament_id = self.repository.add_tournament(tournament)
+        if self.active:
+            self._register(tournament)
+            self._track(tournament)
+            if self._tournaments is not None:
+                self._tournaments.append(tournament)
+        return tournament_id
+
+    def update_tournament_by_id(
+            self,
+            tournament_id: str,
+            name: Optional[str] = None,
+            location: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            number_of_rounds: Optional[int] = None,
+            current_round_number: Optional[int] = None,
+            rounds: Optional[List[Round]] = None,
+            players: Optional[List[Player]] = None,
+            scores: Optional[Dict[str, float]] = None,
+            description: Optional[str] = None,
+            status: Optional[str] = None,
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Update a loaded tournament. The changes are written when the session
+        commits, in a single repository patch per tournament. Fields left to
+        None are unchanged.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                tournament is at another version.
+        """
+        fields = {
+            "name": name,
+            "location": location,
+            "start_date": start_date,
+            "end_date": end_date,
+            "number_of_rounds": number_of_rounds,
+            "current_round_number": current_round_number,
+            "rounds": rounds,
+            "players": players,
+            "scores": scores,
+            "description": description,
+            "status": status,
+        }
+        if not self.active:
+            return self.repository.update_tournament_by_id(
+                tournament_id, expected_version=expected_version, **fields
+            )
+
+        tournament = self.get_by_id(tournament_id)
+        if tournament is None:
+            return False
+        if expected_version is not None and tournament.version != expected_version:
+            raise ConcurrentModificationError(tournament_id, expected_version, tournament.version)
+
+        apply_tournament_updates(tournament, **fields)
+        return True
+
+    def patch_tournament(
+            self,
+            tournament_id: str,
+            patch: List[dict],
+            expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        Apply a JSON Patch to a loaded tournament. Like any other change, it
+        is written when the session commits.
+
+        Raises:
+            ConcurrentModificationError: If expected_version is given and the
+                tournament is at another version.
+        """
+        if not self.active:
+            return self.repository.patch_tournament(tournament_id, patch, expected_version)
+
+        tournament = self.get_by_id(tournament_id)
+        if tournament is None:
+            return False
+        patched = Tournament.from_dict(apply_patch(tournament.to_dict(), patch))
+        return self.update_tournament_by_id(
+            tournament_id,
+            name=patched.name,
+            location=patched.location,
+            start_date=patched.start_date,
+            end_date=patched.end_date,
+            number_of_rounds=patched.number_of_rounds,
+            current_round_number=patched.current_round_number,
+            rounds=patched.rounds,
+            players=patched.players,
+            scores=patched.scores,
+            description=patched.description,
+            status=patched.status,
+            expected_version=expected_version
+        )
+
+    def get_by_id(self, tournament_id: str) -> Optional[Tournament]:
+        """Return a tournament by ID, from the identity map when already loaded."""
+        if not self.active:
+            return self.repository.get_by_id(tournament_id)
+
+        tournament = self._tournaments_by_id.get(tournament_id)
+        if tournament is None and self._tournaments is None:
+            if self.repository.reads_all_tournaments:
+                self._load_all()
+                tournament = self._tournaments_by_id.get(tournament_id)
+            else:
+                tournament = self.repository.get_by_id(tournament_id)
+                if tournament is not None:
+                    tournament = self._register(tournament)
+        return self._track(tournament) if tournament is not None else None
+
+    def flush(self) -> None:
+        """
+        Write the pending changes to the repository.
+
+        Each changed tournament is written as a patch, with the version it was
+        read at as expected version, so that changes made meanwhile by
+        another process are detected. The patches are committed one
+        tournament at a time: if a tournament conflicts, the tournaments
+        written before it stay written. The user actions change a single
+        tournament, so this only matters for callers changing several.
+
+        After save_tournaments(), the whole list is saved at once instead,
+        with the versions of all the tournaments read as expected versions:
+        nothing is written if any of them changed.
+
+        Raises:
+            ConcurrentModificationError: If a tournament was modified since
+                it was read, or no longer exists.
+        """
+        if self._save_all:
+            for tournament_id in self._snapshots:
+                if tournament_id in self._tournaments_by_id and self._changes(tournament_id):
+                    self._tournaments_by_id[tournament_id].version += 1
+            self.repository.save_tournaments(self._tournaments, expected_versions=dict(self._loaded_versions))
+        else:
+            for tournament_id in self._snapshots:
+                patch = self._changes(tournament_id)
+                if not patch:
+                    continue
+                loaded_version = self._loaded_versions[tournament_id]
+                if not self.repository.patch_tournament(tournament_id, patch, expected_version=loaded_version):
+                    raise ConcurrentModificationError(tournament_id, loaded_version, None)
+                self._tournaments_by_id[tournament_id].version = loaded_version + 1
+
+        for tournament_id, tournament in self._tournaments_by_id.items():
+            self._loaded_versions[tournament_id] = tournament.version
+        self._snapshots = {
+            tournament_id: _snapshot(self._tournaments_by_id[tournament_id])
+            for tournament_id in self._snapshots if tournament_id in self._tournaments_by_id
+        }
+        self._save_all = False
+
+
+def _snapshot(tournament: Tournament) -> dict:
+    """Return the dictionary of a tournament, sharing no mutable value with it."""
+    data = tournament.to_dict()
+    data["scores"] = dict(data["scores"])
+    return data
+
+
+class UnitOfWork(IUnitOfWork):
+    def __init__(self, player_repository: IPlayerRepository, tournament_repository: ITournamentRepository):
+        """
+        Initialize a unit of work over the player and tournament repositories.
+
+        Controllers are given `players` and `tournaments` instead of the
+        repositories themselves. A user action is then run inside
+        `with unit_of_work:`, so that every controller shares the same
+        loaded objects, and the changes are written once on commit.
+        Nested `with` blocks join the outermost one.
+        """
+        self.players = SessionPlayerRepository(player_repository)
+        self.tournaments = SessionTournamentRepository(tournament_repository)
+        self._depth = 0
+
+    def __enter__(self) -> "UnitOfWork":
+        if self._depth == 0:
+            self.players.clear()
+            self.tournaments.clear()
+            self.players.active = self.tournaments.active = True
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.players.active = self.tournaments.active = False
+            self.rollback()
+
+    def commit(self) -> None:
+        """
+        Write every pending change: players first, then tournaments.
+
+        On failure, the pending changes are discarded and the error is raised.
+
+        Raises:
+            ConcurrentModificationError: If a tournament was modified since it was read.
+        """
+        try:
+            self.players.flush()
+            self.tournaments.flush()
+        except Exception:
+            self.rollback()
+            raise
+
+    def rollback(self) -> None:
+        """Discard the loaded objects and the pending changes."""
+        self.players.clear()
+        self.tournaments.clear()
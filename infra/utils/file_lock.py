@@ -0,0 +1,38 @@
+"""Advisory file locks, shared between processes working on the same data directory."""
+
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are not serialized.
+    fcntl = None
+
+
+class FileLock:
+    def __init__(self, path: str, shared: bool = False):
+        """
+        Initialize a lock guarding `path`.
+
+        The lock is taken on a sidecar `<path>.lock` file, so that the data
+        file itself can be atomically replaced while the lock is held.
+
+        Args:
+            path (str): The data file to guard.
+            shared (bool): Take a shared (read) lock instead of an exclusive one.
+        """
+        self.lock_path = f"{path}.lock"
+        self.shared = shared
+        self._file = None
+
+    def __enter__(self) -> "FileLock":
+        os.makedirs(os.path.dirname(os.path.abspath(self.lock_path)), exist_ok=True)
+        self._file = open(self.lock_path, "a")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
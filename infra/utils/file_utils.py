@@ -0,0 +1,80 @@
+"""File helpers for crash-safe writes of the data files."""
+
+import os
+import shutil
+import tempfile
+
+
+def rotate_backups(path: str, backup_count: int) -> None:
+    """
+    Keep the current version of `path` as `path.1`, shifting older backups
+    up to `path.<backup_count>`.
+
+    The current file is hard-linked rather than copied when the filesystem
+    allows it, so a backup costs no data copy.
+    """
+    if backup_count <= 0 or not os.path.exists(path):
+        return
+
+    for index in range(backup_count - 1, 0, -1):
+        older = f"{path}.{index}"
+        if os.path.exists(older):
+            os.replace(older, f"{path}.{index + 1}")
+
+    newest = f"{path}.1"
+    if os.path.exists(newest):
+        os.remove(newest)
+    try:
+        os.link(path, newest)
+    except OSError:
+        shutil.copy2(path, newest)
+
+
+def atomic_write(path: str, data: str | bytes, backup_count: int = 0) -> None:
+    """
+    Write data to `path` atomically.
+
+    The data is written to a temporary file in the same directory, flushed to
+    disk, then moved over the target with os.replace. A crash at any point
+    leaves either the old or the new file, never a truncated one.
+
+    Args:
+        path (str): Target file.
+        data (str | bytes): Content to write (str is encoded in UTF-8).
+        backup_count (int): Number of previous versions to keep as
+            `path.1` ... `path.<backup_count>`.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        rotate_backups(path, backup_count)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flush the directory entry so the rename itself survives a power loss (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    directory_descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(directory_descriptor)
+    finally:
+        os.close(directory_descriptor)
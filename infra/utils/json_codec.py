@@ -0,0 +1,56 @@
+"""
+JSON codecs used by the JSON repositories.
+
+orjson is used when it is installed, the standard json module otherwise.
+Both produce compact output by default, which is what the repositories
+write on every mutation; the indented form is only meant for humans
+(see infra.repositories.json_export).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+class JSONCodec:
+    """Codec based on the standard json module."""
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, value: Any, pretty: bool = False) -> bytes:
+        """Encode a value as UTF-8 JSON, compact unless pretty is True."""
+        if pretty:
+            return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def load_file(self, path: str) -> Any:
+        """Read and decode a JSON file."""
+        with open(path, "rb") as file:
+            return self.loads(file.read())
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec based on orjson, several times faster than the json module."""
+
+    name = "orjson"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+    def dumps(self, value: Any, pretty: bool = False) -> bytes:
+        """Encode a value as UTF-8 JSON, compact unless pretty is True."""
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+def get_default_codec() -> JSONCodec:
+    """Return the fastest codec available."""
+    return OrjsonCodec() if orjson is not None else JSONCodec()
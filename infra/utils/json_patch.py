@@ -0,0 +1,141 @@
+"""
+JSON Patch (RFC 6902) documents between two versions of a record.
+
+Only the "add", "remove" and "replace" operations are produced and applied.
+Dicts are compared key by key and lists item by item, so that a single
+match result becomes a couple of small "replace" operations, and a new round
+a single "add" operation, whatever the size of the rest of the record.
+"""
+
+from typing import Any, List
+
+
+def escape_token(token: Any) -> str:
+    """Escape a key or an index as a JSON Pointer reference token."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Return the unescaped reference tokens of a JSON Pointer ("" is the whole document)."""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON Pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[dict]:
+    """
+    Return the JSON Patch operations turning `old` into `new`.
+
+    Args:
+        old (Any): Previous version of the JSON value.
+        new (Any): New version of the JSON value.
+        path (str): JSON Pointer of the value, prefixed to every operation path.
+
+    Returns:
+        List[dict]: The operations, empty if both values are equal.
+    """
+    if old is new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations = []
+        for key, value in new.items():
+            key_path = f"{path}/{escape_token(key)}"
+            if key not in old:
+                operations.append({"op": "add", "path": key_path, "value": value})
+            else:
+                operations.extend(make_patch(old[key], value, key_path))
+        operations.extend(
+            {"op": "remove", "path": f"{path}/{escape_token(key)}"}
+            for key in old if key not in new
+        )
+        return operations
+
+    if isinstance(old, list) and isinstance(new, list):
+        operations = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            operations.extend(make_patch(old[index], new[index], f"{path}/{index}"))
+        operations.extend(
+            {"op": "add", "path": f"{path}/{index}", "value": new[index]}
+            for index in range(common, len(new))
+        )
+        # Removed from the end, so that the remaining indices stay valid.
+        operations.extend(
+            {"op": "remove", "path": f"{path}/{index}"}
+            for index in range(len(old) - 1, common - 1, -1)
+        )
+        return operations
+
+    # bool is a subclass of int: True == 1, but they are different JSON values.
+    if old == new and type(old) is not bool and type(new) is not bool:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _patched(container: Any, tokens: List[str], operation: dict) -> Any:
+    """Return a copy of `container` with the operation applied at the given tokens."""
+    token = tokens[0]
+    if isinstance(container, list):
+        patched = list(container)
+        key = len(patched) if token == "-" else int(token)
+        if not 0 <= key <= len(patched) or (key == len(patched) and operation["op"] != "add"):
+            raise IndexError(f"list index {token} out of range")
+    elif isinstance(container, dict):
+        patched = dict(container)
+        key = token
+    else:
+        raise TypeError(f"cannot index a {type(container).__name__}")
+
+    op = operation["op"]
+    if len(tokens) > 1:
+        patched[key] = _patched(patched[key], tokens[1:], operation)
+    elif op == "remove":
+        del patched[key]
+    elif op == "replace":
+        if isinstance(patched, dict) and key not in patched:
+            raise KeyError(key)
+        patched[key] = operation["value"]
+    elif isinstance(patched, list):
+        patched.insert(key, operation["value"])
+    else:
+        patched[key] = operation["value"]
+    return patched
+
+
+def apply_patch(document: Any, operations: List[dict]) -> Any:
+    """
+    Return the document with the JSON Patch operations applied.
+
+    The document is not modified: the dicts and lists along the path of each
+    operation are copied, and everything else is shared with the original.
+
+    Args:
+        document (Any): The JSON value to patch.
+        operations (List[dict]): "add", "remove" and "replace" operations.
+
+    Returns:
+        Any: The patched document.
+
+    Raises:
+        ValueError: If an operation is not supported or its path does not exist.
+    """
+    for operation in operations:
+        op = operation["op"]
+        if op not in ("add", "remove", "replace"):
+            raise ValueError(f"Unsupported JSON Patch operation: {op}")
+
+        tokens = parse_pointer(operation["path"])
+        if not tokens:
+            if op == "remove":
+                raise ValueError("Cannot remove the whole document")
+            document = operation["value"]
+            continue
+
+        try:
+            document = _patched(document, tokens, operation)
+        except (KeyError, IndexError, TypeError, ValueError) as error:
+            raise ValueError(f"Invalid JSON Patch path {operation['path']!r}: {error}") from None
+    return document
@@ -0,0 +1,242 @@
+"""
+Columnar table of every match played, for statistics across tournaments.
+
+Each match is a row of six typed columns stored in compact arrays:
+player indices and tournament indices as unsigned 32-bit integers, round
+numbers as unsigned 32-bit integers and scores as 32-bit floats. Player and
+tournament IDs are interned once, so a match costs 24 bytes whatever the
+size of the archive.
+
+When NumPy is installed, the columns are exposed as NumPy arrays without
+copy and queries are vectorized. Otherwise, the same queries run as plain
+Python loops over the arrays.
+"""
+
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from domain.ports.tournament_repository import ITournamentRepository, MatchRecord
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional
+    numpy = None
+
+INDEX_TYPECODE = "I"
+SCORE_TYPECODE = "f"
+
+
+class PlayerRecord:
+    def __init__(self, player_id: str, games: int, wins: int, draws: int, losses: int, points: float):
+        """Initialize the overall record of a player across the archive."""
+        self.player_id = player_id
+        self.games = games
+        self.wins = wins
+        self.draws = draws
+        self.losses = losses
+        self.points = points
+
+    @property
+    def win_rate(self) -> float:
+        """Return the share of games won, between 0 and 1."""
+        return self.wins / self.games if self.games else 0.0
+
+
+class MatchTable:
+    def __init__(self):
+        """Initialize an empty table. Use from_repository() or from_records() to fill it."""
+        self.player_ids: List[str] = []
+        self.tournament_ids: List[str] = []
+        self._player_index: Dict[str, int] = {}
+        self._tournament_index: Dict[str, int] = {}
+
+        self.tournament = array(INDEX_TYPECODE)
+        self.round_number = array(INDEX_TYPECODE)
+        self.player1 = array(INDEX_TYPECODE)
+        self.player2 = array(INDEX_TYPECODE)
+        self.score1 = array(SCORE_TYPECODE)
+        self.score2 = array(SCORE_TYPECODE)
+
+    @classmethod
+    def from_repository(
+            cls,
+            tournament_repository: ITournamentRepository,
+            played_only: bool = True
+    ) -> "MatchTable":
+        """Build the table of every match stored in a tournament repository."""
+        return cls.from_records(tournament_repository.iter_match_records(), played_only)
+
+    @classmethod
+    def from_records(cls, records: Iterable[MatchRecord], played_only: bool = True) -> "MatchTable":
+        """
+        Build the table from match records (see ITournamentRepository.iter_match_records).
+
+        Args:
+            records (Iterable[MatchRecord]): Records of the matches.
+            played_only (bool): Skip matches whose result was not entered yet,
+                i.e. whose round has not ended. A 0-0 result entered is kept.
+        """
+        table = cls()
+        for record in records:
+            if played_only and not record[6]:
+                continue
+            table.append(*record[:6])
+        return table
+
+    def __len__(self) -> int:
+        return len(self.player1)
+
+    @staticmethod
+    def _intern(value: str, index: Dict[str, int], values: List[str]) -> int:
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(values)
+            values.append(value)
+        return position
+
+    def append(
+            self,
+            tournament_id: str,
+            round_number: int,
+            player1_id: str,
+            player2_id: str,
+            player1_score: float,
+            player2_score: float
+    ) -> None:
+        """Append a match to the table."""
+        self.tournament.append(self._intern(tournament_id, self._tournament_index, self.tournament_ids))
+        self.round_number.append(round_number)
+        self.player1.append(self._intern(player1_id, self._player_index, self.player_ids))
+        self.player2.append(self._intern(player2_id, self._player_index, self.player_ids))
+        self.score1.append(player1_score)
+        self.score2.append(player2_score)
+
+    def player_index(self, player_id: str) -> Optional[int]:
+        """Return the interned index of a player, or None if they never played."""
+        return self._player_index.get(player_id)
+
+    def columns(self) -> Dict[str, object]:
+        """
+        Return the columns of the table, as NumPy arrays sharing the memory
+        of the underlying arrays when NumPy is installed, as arrays otherwise.
+        """
+        columns = {
+            "tournament": self.tournament,
+            "round_number": self.round_number,
+            "player1": self.player1,
+            "player2": self.player2,
+            "score1": self.score1,
+            "score2": self.score2,
+        }
+        if numpy is None:
+            return columns
+        return {
+            name: numpy.frombuffer(column, dtype=numpy.uint32 if column.typecode == INDEX_TYPECODE
+                                   else numpy.float32)
+            for name, column in columns.items()
+        }
+
+    def head_to_head(self, player_a: str, player_b: str) -> Tuple[int, int, int]:
+        """
+        Return the record of player_a against player_b, over every tournament.
+
+        Returns:
+            Tuple[int, int, int]: (wins of player_a, draws, wins of player_b).
+        """
+        index_a = self.player_index(player_a)
+        index_b = self.player_index(player_b)
+        if index_a is None or index_b is None:
+            return 0, 0, 0
+
+        if numpy is not None:
+            columns = self.columns()
+            player1, player2 = columns["player1"], columns["player2"]
+            as_player1 = (player1 == index_a) & (player2 == index_b)
+            as_player2 = (player1 == index_b) & (player2 == index_a)
+            scores_a = numpy.concatenate((columns["score1"][as_player1], columns["score2"][as_player2]))
+            scores_b = numpy.concatenate((columns["score2"][as_player1], columns["score1"][as_player2]))
+            return (
+                int(numpy.count_nonzero(scores_a > scores_b)),
+                int(numpy.count_nonzero(scores_a == scores_b)),
+                int(numpy.count_nonzero(scores_a < scores_b)),
+            )
+
+        wins_a = draws = wins_b = 0
+        for player1, player2, score1, score2 in zip(self.player1, self.player2, self.score1, self.score2):
+            if player1 == index_a and player2 == index_b:
+                score_a, score_b = score1, score2
+            elif player1 == index_b and player2 == index_a:
+                score_a, score_b = score2, score1
+            else:
+                continue
+            if score_a > score_b:
+                wins_a += 1
+            elif score_a < score_b:
+                wins_b += 1
+            else:
+                draws += 1
+        return wins_a, draws, wins_b
+
+    def player_records(self) -> Dict[str, PlayerRecord]:
+        """Return the games, wins, draws, losses and points of every player, by ID."""
+        size = len(self.player_ids)
+
+        if numpy is not None:
+            columns = self.columns()
+            player1, player2 = columns["player1"], columns["player2"]
+            score1, score2 = columns["score1"], columns["score2"]
+            games = numpy.bincount(player1, minlength=size) + numpy.bincount(player2, minlength=size)
+            wins = (numpy.bincount(player1[score1 > score2], minlength=size)
+                    + numpy.bincount(player2[score2 > score1], minlength=size))
+            draws = (numpy.bincount(player1[score1 == score2], minlength=size)
+                     + numpy.bincount(player2[score1 == score2], minlength=size))
+            points = (numpy.bincount(player1, weights=score1, minlength=size)
+                      + numpy.bincount(player2, weights=score2, minlength=size))
+            games, wins, draws, points = games.tolist(), wins.tolist(), draws.tolist(), points.tolist()
+        else:
+            games, wins, draws, points = [0] * size, [0] * size, [0] * size, [0.0] * size
+            for player1, player2, score1, score2 in zip(self.player1, self.player2, self.score1, self.score2):
+                games[player1] += 1
+                games[player2] += 1
+                points[player1] += score1
+                points[player2] += score2
+                if score1 > score2:
+                    wins[player1] += 1
+                elif score2 > score1:
+                    wins[player2] += 1
+                else:
+                    draws[player1] += 1
+                    draws[player2] += 1
+
+        return {
+            player_id: PlayerRecord(
+                player_id=player_id,
+                games=games[index],
+                wins=wins[index],
+                draws=draws[index],
+                losses=games[index] - wins[index] - draws[index],
+                points=points[index]
+            )
+            for index, player_id in enumerate(self.player_ids)
+        }
+
+    def win_rates(self) -> Dict[str, float]:
+        """Return the share of games won by every player, by ID."""
+        return {player_id: record.win_rate for player_id, record in self.player_records().items()}
+
+    def score_distribution(self) -> Dict[Tuple[float, float], int]:
+        """Return the number of matches of each (player1 score, player2 score) result."""
+        if numpy is not None and len(self):
+            columns = self.columns()
+            # Both float32 scores packed, bit for bit, into a single 64-bit key.
+            keys = ((columns["score1"].view(numpy.uint32).astype(numpy.uint64) << numpy.uint64(32))
+                    | columns["score2"].view(numpy.uint32))
+            results, counts = numpy.unique(keys, return_counts=True)
+            scores1 = (results >> numpy.uint64(32)).astype(numpy.uint32).view(numpy.float32)
+            scores2 = (results & numpy.uint64(0xFFFFFFFF)).astype(numpy.uint32).view(numpy.float32)
+            return {
+                (float(score1), float(score2)): int(count)
+                for score1, score2, count in zip(scores1, scores2, counts)
+            }
+        return dict(Counter(zip(self.score1, self.score2)))
@@ -1,20 +1,42 @@
 """Match-related utilities for handling player references."""
 
+from typing import Dict, List, Optional
+
 from domain.models.match import Match
+from domain.models.player import Player
 from domain.ports.player_repository import IPlayerRepository
 
 
+def get_player_id(player: Player | str) -> str:
+    """Return the national chess ID of a player reference (Player instance or ID string)."""
+    return player.national_chess_id if isinstance(player, Player) else player
+
+
+def get_match_player_ids(match: Match) -> List[str]:
+    """Return the IDs of both players of a match."""
+    return [get_player_id(player) for player in match.get_players()]
+
+
 def match_with_loaded_players(
         match: Match,
-        player_repository: IPlayerRepository
+        player_repository: IPlayerRepository,
+        players_by_id: Optional[Dict[str, Player]] = None
 ) -> Match:
-    """Return a new Match instance with full Player objects loaded from their IDs."""
-    p1, p1_score = match.data[0]
-    p2, p2_score = match.data[1]
+    """
+    Return a new Match instance with full Player objects loaded from their IDs.
+
+    Args:
+        match (Match): The match to resolve.
+        player_repository (IPlayerRepository): Repository used to resolve the players.
+        players_by_id (Dict[str, Player], optional): Players already resolved by
+            the caller. When given, the repository is not queried.
+    """
+    if players_by_id is None:
+        players_by_id = player_repository.get_many(get_match_player_ids(match))
 
     return Match(
-        player1=player_repository.get_by_id(p1),
-        player2=player_repository.get_by_id(p2),
-        player1_score=p1_score,
-        player2_score=p2_score,
+        player1=players_by_id.get(get_player_id(match.player1)),
+        player2=players_by_id.get(get_player_id(match.player2)),
+        player1_score=match.player1_score,
+        player2_score=match.player2_score,
     )
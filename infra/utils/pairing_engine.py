@@ -0,0 +1,267 @@
+"""
+Swiss pairing engine (Dutch system, score-group based).
+
+Players are split into score groups, processed from the highest score down.
+Inside a group the Dutch fold (top half against bottom half) is used whenever
+it produces no rematch and no absolute color conflict. Otherwise, the group is
+paired as a minimum-cost perfect matching (blossom algorithm), where costs
+penalize rematches, score differences and color conflicts. When the last group
+cannot be paired without a rematch, it is merged with the group above it and
+paired again, until the whole field is considered.
+
+By convention, player1 of a match plays white.
+"""
+
+from itertools import groupby
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from infra.utils.match_utils import get_match_player_ids
+from infra.utils.weighted_matching import max_weight_matching
+
+REMATCH_PENALTY = 1_000_000
+SCORE_DIFFERENCE_PENALTY = 1_000  # Per squared half-point of score difference
+ABSOLUTE_COLOR_PENALTY = 100
+COLOR_PENALTY = 10
+FLOAT_PENALTY = 1  # Per rank, favours the lowest ranked player as down-floater
+
+# Above this size, a score group is matched on a sparse graph linking each
+# player to its nearest neighbours only, which keeps the matching fast.
+DENSE_GROUP_SIZE = 64
+SPARSE_NEIGHBOURHOOD = 24
+
+Pair = Tuple[str, str]
+
+
+def get_color_history(rounds: Sequence) -> Dict[str, List[int]]:
+    """
+    Return the colors played by each player, in round order.
+
+    Colors are +1 for white (player1 of a match) and -1 for black (player2).
+    """
+    history: Dict[str, List[int]] = {}
+    for round_instance in rounds:
+        for match in round_instance.matches:
+            white_id, black_id = get_match_player_ids(match)
+            history.setdefault(white_id, []).append(1)
+            history.setdefault(black_id, []).append(-1)
+    return history
+
+
+def get_color_preference(colors: List[int]) -> Tuple[int, bool]:
+    """
+    Return the (color, is_absolute) preference of a player given their history.
+
+    The color is +1 (white), -1 (black) or 0 (no preference). A preference is
+    absolute when the color balance is off by more than one, or when the same
+    color was played in the last two rounds.
+    """
+    if not colors:
+        return 0, False
+
+    balance = sum(colors)
+    if abs(balance) > 1 or (len(colors) >= 2 and colors[-1] == colors[-2]):
+        return (-1 if balance > 0 or (balance == 0 and colors[-1] > 0) else 1), True
+    if balance != 0:
+        return (-1 if balance > 0 else 1), False
+    return -colors[-1], False
+
+
+class SwissPairingEngine:
+    def __init__(
+            self,
+            scores: Dict[str, float],
+            played_pairs: Set[FrozenSet[str]],
+            color_history: Optional[Dict[str, List[int]]] = None
+    ):
+        """
+        Initialize the engine with the state of the tournament.
+
+        Args:
+            scores (Dict[str, float]): Current score of each player ID.
+            played_pairs (Set[FrozenSet[str]]): Pairs of player IDs who already met.
+            color_history (Dict[str, List[int]], optional): Colors played by each player.
+        """
+        self.scores = scores
+        self.played_pairs = played_pairs
+        color_history = color_history or {}
+        self.color_preferences = {
+            player_id: get_color_preference(colors)
+            for player_id, colors in color_history.items()
+        }
+
+    def pair(self, ranked_ids: List[str]) -> List[Pair]:
+        """
+        Pair the players for the next round.
+
+        Args:
+            ranked_ids (List[str]): Player IDs ordered by rank (best first).
+
+        Returns:
+            List[Tuple[str, str]]: (white, black) pairs of player IDs. With an
+            odd number of players, the lowest ranked unpaired player is left out.
+        """
+        self._ranks = {player_id: rank for rank, player_id in enumerate(ranked_ids)}
+        score_groups = [
+            list(group)
+            for _, group in groupby(ranked_ids, key=self._half_points)
+        ]
+
+        brackets: List[Tuple[List[str], List[Pair]]] = []
+        floaters: List[str] = []
+        for index, group in enumerate(score_groups):
+            candidates = floaters + group
+            pairs, floaters = self._pair_bracket(candidates, is_last=index == len(score_groups) - 1)
+            brackets.append((candidates, pairs))
+
+        # Collapse the last bracket into the previous one while it contains rematches.
+        while len(brackets) > 1 and self._has_rematch(brackets[-1][1]):
+            last_candidates, _ = brackets.pop()
+            previous_candidates, _ = brackets.pop()
+            already_included = set(previous_candidates)
+            merged = previous_candidates + [
+                player_id for player_id in last_candidates
+                if player_id not in already_included
+            ]
+            pairs, floaters = self._pair_bracket(merged, is_last=True)
+            brackets.append((merged, pairs))
+
+        return [
+            self._orient(player1, player2)
+            for _, pairs in brackets
+            for player1, player2 in pairs
+        ]
+
+    def _half_points(self, player_id: str) -> int:
+        return round(self.scores.get(player_id, 0.0) * 2)
+
+    def _has_played(self, player1: str, player2: str) -> bool:
+        return frozenset((player1, player2)) in self.played_pairs
+
+    def _has_rematch(self, pairs: List[Pair]) -> bool:
+        return any(self._has_played(player1, player2) for player1, player2 in pairs)
+
+    def _color_cost(self, player1: str, player2: str) -> int:
+        color1, absolute1 = self.color_preferences.get(player1, (0, False))
+        color2, absolute2 = self.color_preferences.get(player2, (0, False))
+        if color1 == 0 or color1 != color2:
+            return 0
+        if absolute1 and absolute2:
+            return ABSOLUTE_COLOR_PENALTY
+        return COLOR_PENALTY
+
+    def _pair_cost(self, player1: str, player2: str) -> int:
+        score_difference = self._half_points(player1) - self._half_points(player2)
+        cost = SCORE_DIFFERENCE_PENALTY * score_difference * score_difference
+        cost += self._color_cost(player1, player2)
+        if self._has_played(player1, player2):
+            cost += REMATCH_PENALTY
+        return cost
+
+    def _pair_bracket(
+            self,
+            candidates: List[str],
+            is_last: bool
+    ) -> Tuple[List[Pair], List[str]]:
+        """
+        Pair a bracket, returning its pairs and the players floating down.
+
+        Outside the last bracket, players who could only be paired with a
+        previous opponent float down to the next bracket instead.
+        """
+        pairs = self._fold(candidates)
+        if pairs is not None:
+            return pairs, candidates[2 * len(pairs):]
+
+        pairs, floaters = self._match(candidates)
+        if not is_last:
+            rematches = [pair for pair in pairs if self._has_played(*pair)]
+            if rematches:
+                pairs = [pair for pair in pairs if not self._has_played(*pair)]
+                floaters = sorted(
+                    floaters + [player_id for pair in rematches for player_id in pair],
+                    key=self._ranks.__getitem__
+                )
+        return pairs, floaters
+
+    def _fold(self, candidates: List[str]) -> Optional[List[Pair]]:
+        """
+        Dutch fold (S1 against S2), with transpositions inside S2 to fix any
+        rematch or absolute color conflict. Returns None if some conflict
+        cannot be fixed that way.
+        """
+        paired_count = len(candidates) - len(candidates) % 2
+        half = paired_count // 2
+        top_half = candidates[:half]
+        bottom_half = candidates[half:paired_count]
+
+        for i, player in enumerate(top_half):
+            if self._is_acceptable(player, bottom_half[i]):
+                continue
+            # Swap with the nearest opponent of S2 that suits both players.
+            for j in sorted(range(half), key=lambda index: abs(index - i)):
+                if (j != i and self._is_acceptable(player, bottom_half[j])
+                        and (j > i or self._is_acceptable(top_half[j], bottom_half[i]))):
+                    bottom_half[i], bottom_half[j] = bottom_half[j], bottom_half[i]
+                    break
+            else:
+                return None
+
+        return list(zip(top_half, bottom_half))
+
+    def _is_acceptable(self, player1: str, player2: str) -> bool:
+        """Return True if two players may meet: no rematch and no absolute color conflict."""
+        return (not self._has_played(player1, player2)
+                and self._color_cost(player1, player2) < ABSOLUTE_COLOR_PENALTY)
+
+    def _match(self, candidates: List[str]) -> Tuple[List[Pair], List[str]]:
+        """Pair a bracket as a minimum-cost maximum matching."""
+        size = len(candidates)
+        dense = size <= DENSE_GROUP_SIZE
+        mate = self._solve(candidates, dense=dense)
+        pairs = self._mate_to_pairs(candidates, mate)
+
+        if not dense and (len(pairs) < size // 2 or self._has_rematch(pairs)):
+            # The sparse graph was too restrictive: use every possible pair.
+            mate = self._solve(candidates, dense=True)
+            pairs = self._mate_to_pairs(candidates, mate)
+
+        floaters = [
+            candidates[vertex] for vertex in range(size)
+            if vertex >= len(mate) or mate[vertex] < 0
+        ]
+        return pairs, floaters
+
+    @staticmethod
+    def _mate_to_pairs(candidates: List[str], mate: List[int]) -> List[Pair]:
+        return [
+            (candidates[vertex], candidates[mate[vertex]])
+            for vertex in range(len(mate))
+            if vertex < mate[vertex]
+        ]
+
+    def _solve(self, candidates: List[str], dense: bool) -> List[int]:
+        size = len(candidates)
+        costs = {}
+        for i in range(size):
+            upper = size if dense else min(size, i + SPARSE_NEIGHBOURHOOD + 1)
+            for j in range(i + 1, upper):
+                # Matched players earn a bonus decreasing with their rank, so the
+                # lowest ranked player is the one left out of an odd bracket.
+                cost = self._pair_cost(candidates[i], candidates[j])
+                costs[(i, j)] = cost - FLOAT_PENALTY * (2 * size - i - j)
+
+        ceiling = max(costs.values(), default=0) + 1
+        edges = [(i, j, ceiling - cost) for (i, j), cost in costs.items()]
+        return max_weight_matching(edges, max_cardinality=True)
+
+    def _orient(self, player1: str, player2: str) -> Pair:
+        """Return the pair as (white, black), following color preferences."""
+        color1, absolute1 = self.color_preferences.get(player1, (0, False))
+        color2, absolute2 = self.color_preferences.get(player2, (0, False))
+        if color1 == color2:
+            if absolute2 and not absolute1:
+                return (player2, player1) if color2 > 0 else (player1, player2)
+            return (player1, player2) if color1 >= 0 else (player2, player1)
+        if color1 > 0 or color2 < 0:
+            return player1, player2
+        return player2, player1
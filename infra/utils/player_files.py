@@ -0,0 +1,116 @@
+"""
+Streaming readers and writers of player files, for bulk imports and exports.
+
+Three formats are supported:
+- csv: a header line naming the player fields, then one player per line;
+- jsonl: one JSON object per line, with the fields of players.json;
+- json: a JSON array, in the format of players.json.
+
+CSV and JSON Lines files are read and written one line at a time, so a file
+is never held in memory as a whole. A JSON array can only be decoded at once.
+"""
+
+import csv
+import os
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple
+
+from domain.models.player import Player
+from infra.utils.json_codec import JSONCodec, get_default_codec
+from infra.utils.validators import PLAYER_FIELDS
+
+PLAYER_FILE_FORMATS = ("csv", "jsonl", "json")
+
+# A record read from a player file, with its line number (its index in a JSON array).
+PlayerRow = Tuple[int, Any]
+
+
+def guess_player_file_format(path: str, default: str = "csv") -> str:
+    """Return the format of a player file from its extension, or default if unknown."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "ndjson":
+        return "jsonl"
+    return extension if extension in PLAYER_FILE_FORMATS else default
+
+
+def iter_player_rows(
+        file: TextIO,
+        file_format: str,
+        codec: Optional[JSONCodec] = None
+) -> Iterator[PlayerRow]:
+    """
+    Yield the records of a player file, one at a time.
+
+    Records are not checked: a JSON Lines record that cannot be decoded is
+    yielded as its raw text, so that it is rejected with the others by
+    validate_player_rows() instead of interrupting the import.
+
+    Args:
+        file (TextIO): File opened in text mode (with newline="" for CSV).
+        file_format (str): One of PLAYER_FILE_FORMATS.
+        codec (JSONCodec, optional): JSON codec, the fastest one installed by default.
+
+    Raises:
+        ValueError: If the format is unknown, or a JSON array cannot be decoded.
+    """
+    codec = codec or get_default_codec()
+    if file_format == "csv":
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+    elif file_format == "jsonl":
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = codec.loads(line)
+            except ValueError:
+                record = line
+            yield line_number, record
+    elif file_format == "json":
+        records = codec.loads(file.read())
+        if not isinstance(records, list):
+            raise ValueError("Un tableau JSON de joueurs est attendu.")
+        for index, record in enumerate(records):
+            yield index + 1, record
+    else:
+        raise ValueError(f"Format de fichier inconnu : {file_format}.")
+
+
+def write_players(
+        players: Iterable[Player],
+        file: TextIO,
+        file_format: str,
+        codec: Optional[JSONCodec] = None
+) -> int:
+    """
+    Write players to a file as they are consumed from the iterable.
+
+    Args:
+        players (Iterable[Player]): Players to write, e.g. IPlayerRepository.iter_players().
+        file (TextIO): File opened in text mode (with newline="" for CSV).
+        file_format (str): "csv" or "jsonl".
+        codec (JSONCodec, optional): JSON codec, the fastest one installed by default.
+
+    Returns:
+        int: The number of players written.
+
+    Raises:
+        ValueError: If the format cannot be written as a stream.
+    """
+    count = 0
+    if file_format == "csv":
+        writer = csv.DictWriter(file, fieldnames=PLAYER_FIELDS)
+        writer.writeheader()
+        for player in players:
+            writer.writerow(player.to_dict())
+            count += 1
+    elif file_format == "jsonl":
+        codec = codec or get_default_codec()
+        for player in players:
+            file.write(codec.dumps(player.to_dict()).decode("utf-8"))
+            file.write("\n")
+            count += 1
+    else:
+        raise ValueError(f"Format d'export non géré : {file_format} (csv ou jsonl).")
+    return count
@@ -0,0 +1,73 @@
+"""Manifest of generated reports, used to skip reports whose inputs did not change."""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from jinja2 import Template
+
+from infra.utils.file_utils import atomic_write
+
+
+def compute_report_fingerprint(template: Template, *inputs) -> str:
+    """
+    Return a fingerprint of everything a report is rendered from.
+
+    Args:
+        template (Template): Template of the report; its file modification
+            time is part of the fingerprint.
+        *inputs: JSON-serializable data rendered by the template
+            (e.g. Tournament.to_dict()).
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    if template.filename and os.path.exists(template.filename):
+        digest.update(str(os.stat(template.filename).st_mtime_ns).encode("ascii"))
+    for data in inputs:
+        digest.update(
+            json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+class ReportManifest:
+    def __init__(self, manifest_path: str):
+        """
+        Initialize the manifest stored at manifest_path.
+
+        The manifest maps the path of each generated report to the
+        fingerprint of the inputs it was rendered from.
+        """
+        self.manifest_path = manifest_path
+        self._fingerprints: Optional[Dict[str, str]] = None
+        self._changed = False
+
+    def _load(self) -> Dict[str, str]:
+        if self._fingerprints is None:
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as file:
+                    self._fingerprints = json.load(file)
+            except (FileNotFoundError, ValueError):
+                self._fingerprints = {}
+        return self._fingerprints
+
+    def is_up_to_date(self, output_path: str, fingerprint: str) -> bool:
+        """Return True if the report exists and was rendered from the same inputs."""
+        return (self._load().get(os.path.normpath(output_path)) == fingerprint
+                and os.path.exists(output_path))
+
+    def record(self, output_path: str, fingerprint: str) -> None:
+        """Record the fingerprint of a report that was just written."""
+        self._load()[os.path.normpath(output_path)] = fingerprint
+        self._changed = True
+
+    def save(self) -> None:
+        """Write the manifest if some report was recorded since the last save."""
+        if not self._changed:
+            return
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        atomic_write(self.manifest_path, json.dumps(self._fingerprints, indent=2))
+        self._changed = False
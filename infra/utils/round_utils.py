@@ -1,22 +1,41 @@
 """Round-related utilities for handling player references."""
 
+from typing import Dict, List, Optional
+
+from domain.models.player import Player
 from domain.models.round import Round
 from domain.ports.player_repository import IPlayerRepository
-from infra.utils.match_utils import match_with_loaded_players
+from infra.utils.match_utils import get_match_player_ids, match_with_loaded_players
+
+
+def get_round_player_ids(round_instance: Round) -> List[str]:
+    """Return the IDs of every player involved in the matches of a round."""
+    return [
+        player_id
+        for match in round_instance.matches
+        for player_id in get_match_player_ids(match)
+    ]
 
 
 def round_with_loaded_players(
         round_instance: Round,
-        player_repository: IPlayerRepository
+        player_repository: IPlayerRepository,
+        players_by_id: Optional[Dict[str, Player]] = None
 ) -> Round:
     """
     Return a new Round instance with matches containing full Player objects
     loaded from their IDs.
+
+    All the players of the round are resolved with a single repository call,
+    unless players_by_id is already provided by the caller.
     """
+    if players_by_id is None:
+        players_by_id = player_repository.get_many(get_round_player_ids(round_instance))
+
     loaded_matches = []
 
     for match in round_instance.matches:
-        loaded_match = match_with_loaded_players(match, player_repository)
+        loaded_match = match_with_loaded_players(match, player_repository, players_by_id)
         loaded_matches.append(loaded_match)
 
     return Round(
@@ -0,0 +1,405 @@
+"""
+Schema-driven decoding of the players and tournaments data.
+
+The data files are decoded straight into the domain models, with every
+field checked against the schema of the models, so that a malformed file
+raises SchemaError when it is loaded rather than a KeyError or TypeError
+deep inside a CLI flow.
+
+When msgspec is installed, the JSON documents are parsed and validated in
+a single pass by Struct definitions mirroring the models. Otherwise, they
+are parsed by the JSON codec and validated in Python. Both paths report
+errors the same way, e.g. "Expected `float`, got `str` - at
+`$[0].rounds[1].matches[2].player1_score`".
+
+Tournaments can also be decoded lazily, as LazyTournament instances: their
+rounds are then only decoded, and checked, when they are first accessed.
+"""
+
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
+
+from domain.models.lazy_tournament import DeferredRounds, LazyTournament, RoundDecoder
+from domain.models.match import Match
+from domain.models.player import Player
+from domain.models.round import Round
+from domain.models.tournament import Tournament
+from infra.utils.json_codec import JSONCodec, get_default_codec
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional
+    msgspec = None
+
+
+class SchemaError(ValueError):
+    """Raised when a data file does not match the schema of the models."""
+
+
+if msgspec is not None:
+    class PlayerStruct(msgspec.Struct):
+        last_name: str
+        first_name: str
+        birth_date: str
+        national_chess_id: str
+
+    class MatchStruct(msgspec.Struct):
+        player1_id: str
+        player2_id: str
+        player1_score: float = 0.0
+        player2_score: float = 0.0
+
+    class RoundStruct(msgspec.Struct):
+        name: str
+        matches: List[MatchStruct] = []
+        start_datetime: Optional[datetime] = None
+        end_datetime: Optional[datetime] = None
+        round_id: Optional[str] = None
+
+    class TournamentStruct(msgspec.Struct):
+        name: str
+        location: str
+        start_date: str
+        end_date: str
+        number_of_rounds: int = 4
+        current_round_number: int = 1
+        status: str = "Non démarré"
+        rounds: List[RoundStruct] = []
+        players: List[str] = []
+        scores: Optional[Dict[str, float]] = None
+        description: Optional[str] = None
+        tournament_id: Optional[str] = None
+        version: int = 0
+
+    _players_decoder = msgspec.json.Decoder(List[PlayerStruct])
+    _tournaments_decoder = msgspec.json.Decoder(List[TournamentStruct])
+    _tournament_decoder = msgspec.json.Decoder(TournamentStruct)
+
+
+def _player_from_struct(player: "PlayerStruct") -> Player:
+    return Player(player.last_name, player.first_name, player.birth_date, player.national_chess_id)
+
+
+def _round_from_struct(chess_round: "RoundStruct") -> Round:
+    return Round(
+        name=chess_round.name,
+        matches=[
+            Match(match.player1_id, match.player2_id, match.player1_score, match.player2_score)
+            for match in chess_round.matches
+        ],
+        start_datetime=chess_round.start_datetime,
+        end_datetime=chess_round.end_datetime,
+        round_id=chess_round.round_id
+    )
+
+
+def _tournament_from_struct(tournament: "TournamentStruct", cls: type = Tournament) -> Tournament:
+    return cls(
+        name=tournament.name,
+        location=tournament.location,
+        start_date=tournament.start_date,
+        end_date=tournament.end_date,
+        number_of_rounds=tournament.number_of_rounds,
+        current_round_number=tournament.current_round_number,
+        status=tournament.status,
+        rounds=[_round_from_struct(chess_round) for chess_round in tournament.rounds],
+        players=tournament.players,
+        scores=tournament.scores,
+        description=tournament.description,
+        tournament_id=tournament.tournament_id,
+        version=tournament.version
+    )
+
+
+_TYPE_NAMES = {
+    str: "str", int: "int", float: "float", bool: "bool",
+    list: "array", dict: "object", type(None): "null"
+}
+
+# Paths are built as nested (parent, key) tuples and only formatted into
+# "$.rounds[1].name" strings when an error is reported.
+Path = Union[str, Tuple["Path", Union[str, int]]]
+
+
+def _format_path(path: Path) -> str:
+    keys = []
+    while isinstance(path, tuple):
+        path, key = path
+        keys.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return path + "".join(reversed(keys))
+
+
+def _invalid(expected: str, value, path: Path) -> SchemaError:
+    actual = _TYPE_NAMES.get(type(value), type(value).__name__)
+    return SchemaError(f"Expected `{expected}`, got `{actual}` - at `{_format_path(path)}`")
+
+
+def _missing(key: str, path: Path) -> SchemaError:
+    return SchemaError(f"Object missing required field `{key}` - at `{_format_path(path)}`")
+
+
+def _check_object(value, path: Path) -> dict:
+    if type(value) is not dict:
+        raise _invalid("object", value, path)
+    return value
+
+
+def _check_array(value, path: Path) -> list:
+    if type(value) is not list:
+        raise _invalid("array", value, path)
+    return value
+
+
+def _required_str(record: dict, key: str, path: Path) -> str:
+    value = record.get(key)
+    if type(value) is not str:
+        if key not in record:
+            raise _missing(key, path)
+        raise _invalid("str", value, (path, key))
+    return value
+
+
+def _optional_str(record: dict, key: str, path: Path) -> Optional[str]:
+    value = record.get(key)
+    if value is not None and type(value) is not str:
+        raise _invalid("str | null", value, (path, key))
+    return value
+
+
+def _int(record: dict, key: str, default: int, path: Path) -> int:
+    value = record.get(key, default)
+    if type(value) is not int:
+        raise _invalid("int", value, (path, key))
+    return value
+
+
+def _float(value, path: Path) -> float:
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    raise _invalid("float", value, path)
+
+
+def _datetime(record: dict, key: str, path: Path) -> Optional[datetime]:
+    value = record.get(key)
+    if value is None:
+        return None
+    if type(value) is not str:
+        raise _invalid("datetime | null", value, (path, key))
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise SchemaError(
+            f"Invalid RFC3339 encoded datetime - at `{_format_path((path, key))}`"
+        ) from None
+
+
+def player_from_record(record, path: Path = "$") -> Player:
+    """
+    Create a Player from a dictionary, checking it against the schema.
+
+    Raises:
+        SchemaError: If a field is missing or has the wrong type.
+    """
+    _check_object(record, path)
+    return Player(
+        last_name=_required_str(record, "last_name", path),
+        first_name=_required_str(record, "first_name", path),
+        birth_date=_required_str(record, "birth_date", path),
+        national_chess_id=_required_str(record, "national_chess_id", path)
+    )
+
+
+def _match_from_record(record, path: Path) -> Match:
+    _check_object(record, path)
+    return Match(
+        _required_str(record, "player1_id", path),
+        _required_str(record, "player2_id", path),
+        _float(record.get("player1_score", 0.0), (path, "player1_score")),
+        _float(record.get("player2_score", 0.0), (path, "player2_score"))
+    )
+
+
+def _round_from_record(record, path: Path) -> Round:
+    _check_object(record, path)
+    matches_path = (path, "matches")
+    return Round(
+        name=_required_str(record, "name", path),
+        matches=[
+            _match_from_record(match, (matches_path, index))
+            for index, match in enumerate(_check_array(record.get("matches", []), matches_path))
+        ],
+        start_datetime=_datetime(record, "start_datetime", path),
+        end_datetime=_datetime(record, "end_datetime", path),
+        round_id=_optional_str(record, "round_id", path)
+    )
+
+
+def _convert(record, struct_type: type, path: Path):
+    try:
+        return msgspec.convert(record, struct_type)
+    except msgspec.ValidationError as error:
+        raise SchemaError(str(error).replace("`$", f"`{_format_path(path)}", 1)) from None
+
+
+def _decode_round(rounds_path: Path, record, index: int) -> Round:
+    if msgspec is not None:
+        return _round_from_struct(_convert(record, RoundStruct, (rounds_path, index)))
+    return _round_from_record(record, (rounds_path, index))
+
+
+def _round_decoder(rounds_path: Path) -> RoundDecoder:
+    """
+    Return the function decoding the rounds of a lazy tournament, on first access.
+
+    It is a partial of a module-level function, not a closure, so that lazy
+    tournaments can be pickled, e.g. to be sent to the report workers.
+    """
+    return partial(_decode_round, rounds_path)
+
+
+def tournament_from_record(record, path: Path = "$", lazy: bool = False) -> Tournament:
+    """
+    Create a Tournament from a dictionary, checking it against the schema.
+
+    The record is not shared with the tournament: its lists and dicts are
+    copied, so it can be kept as is by the caller.
+
+    Args:
+        record (dict): Dictionary containing tournament data.
+        path (Path): Location of the record, used in error messages.
+        lazy (bool): If True, return a LazyTournament whose rounds are only
+            decoded, and checked, when they are first accessed.
+
+    Raises:
+        SchemaError: If a field is missing or has the wrong type.
+    """
+    cls = LazyTournament if lazy else Tournament
+    rounds_path = (path, "rounds")
+    if lazy:
+        _check_object(record, path)
+        rounds_data = _check_array(record.get("rounds", []), rounds_path)
+        record = {**record, "rounds": []}
+
+    if msgspec is not None:
+        tournament = _tournament_from_struct(_convert(record, TournamentStruct, path), cls)
+    else:
+        tournament = _tournament_from_record(record, path, cls)
+
+    if lazy:
+        tournament.rounds = DeferredRounds(rounds_data, _round_decoder(rounds_path))
+    return tournament
+
+
+def _tournament_from_record(record, path: Path, cls: type) -> Tournament:
+    _check_object(record, path)
+    rounds_path, players_path, scores_path = (path, "rounds"), (path, "players"), (path, "scores")
+
+    players = list(_check_array(record.get("players", []), players_path))
+    for index, player_id in enumerate(players):
+        if type(player_id) is not str:
+            raise _invalid("str", player_id, (players_path, index))
+
+    scores = record.get("scores")
+    if scores is not None:
+        scores = {
+            player_id: _float(score, (scores_path, player_id))
+            for player_id, score in _check_object(scores, scores_path).items()
+        }
+
+    return cls(
+        name=_required_str(record, "name", path),
+        location=_required_str(record, "location", path),
+        start_date=_required_str(record, "start_date", path),
+        end_date=_required_str(record, "end_date", path),
+        number_of_rounds=_int(record, "number_of_rounds", 4, path),
+        current_round_number=_int(record, "current_round_number", 1, path),
+        status=_required_str(record, "status", path) if "status" in record else "Non démarré",
+        rounds=[
+            _round_from_record(chess_round, (rounds_path, index))
+            for index, chess_round in enumerate(_check_array(record.get("rounds", []), rounds_path))
+        ],
+        players=players,
+        scores=scores,
+        description=_optional_str(record, "description", path),
+        tournament_id=_optional_str(record, "tournament_id", path),
+        version=_int(record, "version", 0, path)
+    )
+
+
+def _decode(decoder: "msgspec.json.Decoder", data: bytes):
+    try:
+        return decoder.decode(data)
+    except msgspec.ValidationError as error:
+        raise SchemaError(str(error)) from None
+    except msgspec.DecodeError as error:
+        raise SchemaError(f"Invalid JSON: {error}") from None
+
+
+def _load(data: bytes, codec: Optional[JSONCodec]):
+    try:
+        return (codec or get_default_codec()).loads(data)
+    except ValueError as error:
+        raise SchemaError(f"Invalid JSON: {error}") from None
+
+
+def decode_players(data: bytes, codec: Optional[JSONCodec] = None) -> List[Player]:
+    """
+    Decode and validate a JSON array of players (players.json).
+
+    Args:
+        data (bytes): Content of the file.
+        codec (JSONCodec, optional): Codec used when msgspec is not installed.
+
+    Raises:
+        SchemaError: If the document is not valid JSON or does not match the schema.
+    """
+    if msgspec is not None:
+        return [_player_from_struct(player) for player in _decode(_players_decoder, data)]
+
+    players = _check_array(_load(data, codec), "$")
+    return [player_from_record(player, ("$", index)) for index, player in enumerate(players)]
+
+
+def decode_tournaments(
+        data: bytes,
+        codec: Optional[JSONCodec] = None,
+        lazy: bool = False
+) -> List[Tournament]:
+    """
+    Decode and validate a JSON array of tournaments (tournaments.json).
+
+    Args:
+        data (bytes): Content of the file.
+        codec (JSONCodec, optional): Codec used when msgspec is not installed,
+            or when lazy is True.
+        lazy (bool): If True, return LazyTournament instances whose rounds
+            are only decoded, and checked, when they are first accessed.
+
+    Raises:
+        SchemaError: If the document is not valid JSON or does not match the schema.
+    """
+    if msgspec is not None and not lazy:
+        return [_tournament_from_struct(tournament) for tournament in _decode(_tournaments_decoder, data)]
+
+    tournaments = _check_array(_load(data, codec), "$")
+    return [
+        tournament_from_record(tournament, ("$", index), lazy)
+        for index, tournament in enumerate(tournaments)
+    ]
+
+
+def decode_tournament(data: bytes, codec: Optional[JSONCodec] = None, lazy: bool = False) -> Tournament:
+    """
+    Decode and validate a single JSON tournament (a shard of the sharded repository).
+
+    Raises:
+        SchemaError: If the document is not valid JSON or does not match the schema.
+    """
+    if msgspec is not None and not lazy:
+        return _tournament_from_struct(_decode(_tournament_decoder, data))
+
+    return tournament_from_record(_load(data, codec), lazy=lazy)
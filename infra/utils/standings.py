@@ -0,0 +1,302 @@
+"""
+Standings of a tournament: points and tie-breaks of each player.
+
+Standings are maintained incrementally: recording a result only updates the
+two players of the match and their previous opponents. A StandingsCache keeps
+the standings of each tournament between user actions and, when the
+tournament is read again, only applies the rounds ended since, so the round
+history is replayed once per tournament and process, when the tournament is
+first seen (or when it was changed elsewhere in a way that does not extend
+what was applied). Tie-breaks are, in order:
+
+- Buchholz: sum of the points of the player's opponents.
+- Sonneborn-Berger: sum of the points of the opponents the player beat,
+  plus half the points of those they drew with.
+- Progressive score: sum of the player's running score after each round.
+
+A performance rating is also computed when opponent ratings are provided.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from domain.models.match import Match
+from domain.models.player import Player
+from domain.models.round import Round
+from domain.models.tournament import Tournament
+from infra.utils.match_utils import get_match_player_ids, get_player_id
+
+
+class Standing:
+    def __init__(
+            self,
+            player_id: str,
+            player: Optional[Player],
+            points: float,
+            buchholz: float = 0.0,
+            sonneborn_berger: float = 0.0,
+            progressive_score: float = 0.0,
+            performance_rating: Optional[float] = None
+    ):
+        """
+        Initialize the standing of a player.
+
+        Args:
+            player_id (str): National chess ID of the player.
+            player (Player, optional): The player, if it could be resolved.
+            points (float): Total score of the player.
+            buchholz (float): Buchholz tie-break.
+            sonneborn_berger (float): Sonneborn-Berger tie-break.
+            progressive_score (float): Progressive score tie-break.
+            performance_rating (float, optional): Performance rating, when
+                the ratings of the opponents are known.
+        """
+        self.player_id = player_id
+        self.player = player
+        self.points = points
+        self.buchholz = buchholz
+        self.sonneborn_berger = sonneborn_berger
+        self.progressive_score = progressive_score
+        self.performance_rating = performance_rating
+
+    def sort_key(self) -> Tuple[float, float, float, float]:
+        """Return the key ranking standings: points, then each tie-break, higher first."""
+        return -self.points, -self.buchholz, -self.sonneborn_berger, -self.progressive_score
+
+
+class Standings:
+    def __init__(
+            self,
+            player_ids: Iterable[str] = (),
+            ratings: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize empty standings.
+
+        Args:
+            player_ids (Iterable[str]): IDs of the registered players.
+            ratings (Dict[str, float], optional): Rating of each player, used
+                to compute performance ratings.
+        """
+        self.ratings = ratings or {}
+        self.points: Dict[str, float] = {}
+        # (opponent ID, result of the player, result of the opponent) of every game.
+        self.games: Dict[str, List[Tuple[str, float, float]]] = {}
+        self.buchholz: Dict[str, float] = {}
+        self.sonneborn_berger: Dict[str, float] = {}
+        self.progressive_score: Dict[str, float] = {}
+        # Sum of the ratings of rated opponents, and the number of such games.
+        self._opponent_ratings: Dict[str, float] = {}
+        self._rated_games: Dict[str, int] = {}
+        self._rated_points: Dict[str, float] = {}
+        # Number of leading rounds of the tournament applied, and the key of
+        # the last one, checked before applying the rounds ended since.
+        self.rounds_applied = 0
+        self._last_round_key: Optional[tuple] = None
+
+        for player_id in player_ids:
+            self.add_player(player_id)
+
+    @classmethod
+    def from_tournament(
+            cls,
+            tournament: Tournament,
+            ratings: Optional[Dict[str, float]] = None
+    ) -> "Standings":
+        """
+        Build the standings of a tournament by replaying its ended rounds.
+
+        This is the only operation scanning the round history; a StandingsCache
+        then keeps the standings up to date with update().
+        """
+        standings = cls(ratings=ratings)
+        standings.update(tournament)
+        return standings
+
+    def update(self, tournament: Tournament) -> bool:
+        """
+        Apply the rounds of the tournament ended since the last update.
+
+        Ended rounds are applied in order, up to the first round still in
+        progress. Only the last round already applied and the new ones are
+        read, so a lazily decoded tournament does not decode its history.
+
+        Returns:
+            bool: False, leaving the standings untouched, if the last round
+            applied no longer matches the tournament (e.g. it was modified
+            elsewhere); the standings must then be built again.
+        """
+        rounds = tournament.rounds
+        if self.rounds_applied:
+            if len(rounds) < self.rounds_applied:
+                return False
+            if _round_key(rounds[self.rounds_applied - 1]) != self._last_round_key:
+                return False
+
+        for player in tournament.players:
+            self.add_player(get_player_id(player))
+        for player_id in tournament.scores:
+            self.add_player(player_id)
+
+        for index in range(self.rounds_applied, len(rounds)):
+            chess_round = rounds[index]
+            if chess_round.end_datetime is None:
+                break
+            self.record_round(chess_round)
+        return True
+
+    def record_round(self, chess_round: Round) -> None:
+        """Record every match of an ended round, then close the round."""
+        for match in chess_round.matches:
+            self.record_match(match)
+        self.end_round()
+        self.rounds_applied += 1
+        self._last_round_key = _round_key(chess_round)
+
+    def add_player(self, player_id: str) -> None:
+        """Register a player with no game played yet. Known players are left untouched."""
+        if player_id in self.points:
+            return
+        self.points[player_id] = 0.0
+        self.games[player_id] = []
+        self.buchholz[player_id] = 0.0
+        self.sonneborn_berger[player_id] = 0.0
+        self.progressive_score[player_id] = 0.0
+        self._opponent_ratings[player_id] = 0.0
+        self._rated_games[player_id] = 0
+        self._rated_points[player_id] = 0.0
+
+    def record_match(self, match: Match) -> None:
+        """Record the result of a match whose scores were set."""
+        player1_id, player2_id = get_match_player_ids(match)
+        score1, score2 = match.get_scores()
+        self.record_result(player1_id, player2_id, score1, score2)
+
+    def record_result(self, player1_id: str, player2_id: str, score1: float, score2: float) -> None:
+        """
+        Record the result of a game between two players.
+
+        Only the two players and their opponents are updated, so the cost
+        is proportional to the number of games of these two players.
+        """
+        self.add_player(player1_id)
+        self.add_player(player2_id)
+
+        self._add_game(player1_id, player2_id, score1, score2)
+        self._add_game(player2_id, player1_id, score2, score1)
+        self._add_points(player1_id, score1)
+        self._add_points(player2_id, score2)
+
+    def _add_game(
+            self,
+            player_id: str,
+            opponent_id: str,
+            result: float,
+            opponent_result: float
+    ) -> None:
+        self.games[player_id].append((opponent_id, result, opponent_result))
+        opponent_points = self.points[opponent_id]
+        self.buchholz[player_id] += opponent_points
+        self.sonneborn_berger[player_id] += result * opponent_points
+
+        opponent_rating = self.ratings.get(opponent_id)
+        if opponent_rating is not None:
+            self._opponent_ratings[player_id] += opponent_rating
+            self._rated_games[player_id] += 1
+            self._rated_points[player_id] += result
+
+    def _add_points(self, player_id: str, points: float) -> None:
+        """Add points to a player, and propagate them to the tie-breaks of their opponents."""
+        if not points:
+            return
+        self.points[player_id] += points
+        for opponent_id, _, opponent_result in self.games[player_id]:
+            self.buchholz[opponent_id] += points
+            self.sonneborn_berger[opponent_id] += opponent_result * points
+
+    def end_round(self) -> None:
+        """Close the current round: add each player's running score to their progressive score."""
+        for player_id, points in self.points.items():
+            self.progressive_score[player_id] += points
+
+    def performance_rating(self, player_id: str) -> Optional[float]:
+        """
+        Return the performance rating of a player (algorithm of 400), or None
+        if they did not play any rated opponent.
+        """
+        rated_games = self._rated_games.get(player_id, 0)
+        if not rated_games:
+            return None
+        wins_minus_losses = 2 * self._rated_points[player_id] - rated_games
+        return (self._opponent_ratings[player_id] + 400 * wins_minus_losses) / rated_games
+
+    def scores(self) -> Dict[str, float]:
+        """Return the points of each player, as stored in Tournament.scores."""
+        return dict(self.points)
+
+    def ranking(self, players_by_id: Optional[Dict[str, Player]] = None) -> List[Standing]:
+        """
+        Return the standing of every player, best first, in O(P log P).
+
+        Args:
+            players_by_id (Dict[str, Player], optional): Players used to fill
+                Standing.player.
+        """
+        players_by_id = players_by_id or {}
+        standings = [
+            Standing(
+                player_id=player_id,
+                player=players_by_id.get(player_id),
+                points=points,
+                buchholz=self.buchholz[player_id],
+                sonneborn_berger=self.sonneborn_berger[player_id],
+                progressive_score=self.progressive_score[player_id],
+                performance_rating=self.performance_rating(player_id)
+            )
+            for player_id, points in self.points.items()
+        ]
+        standings.sort(key=Standing.sort_key)
+        return standings
+
+
+class StandingsCache:
+    def __init__(self, max_size: int = 64):
+        """
+        Initialize an empty cache of the standings of tournaments, by ID.
+
+        Args:
+            max_size (int): Number of tournaments kept; the least recently
+                used one is forgotten beyond.
+        """
+        self.max_size = max_size
+        self._standings: OrderedDict[str, Standings] = OrderedDict()
+
+    def get(self, tournament: Tournament) -> Standings:
+        """
+        Return the standings of a tournament, applying only the rounds ended
+        since they were last returned. They are built from the whole round
+        history the first time, or if the tournament was changed otherwise.
+
+        The standings are shared with the next callers: they must be updated
+        through the tournament (by ending its rounds), not recorded directly.
+        """
+        tournament_id = tournament.tournament_id
+        standings = self._standings.get(tournament_id) if tournament_id else None
+        if standings is None or not standings.update(tournament):
+            standings = Standings.from_tournament(tournament)
+
+        if tournament_id:
+            self._standings[tournament_id] = standings
+            self._standings.move_to_end(tournament_id)
+            if len(self._standings) > self.max_size:
+                self._standings.popitem(last=False)
+        return standings
+
+
+def _round_key(chess_round: Round) -> tuple:
+    """Return what identifies an ended round and its results, to check it was not changed."""
+    return (
+        chess_round.round_id or chess_round.name,
+        chess_round.end_datetime,
+        tuple((*get_match_player_ids(match), *match.get_scores()) for match in chess_round.matches)
+    )
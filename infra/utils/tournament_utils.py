@@ -1,32 +1,66 @@
 """Tournament utilities for resolving players and generating pairings."""
 
 from random import shuffle
-from typing import List, Tuple
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 from domain.models.player import Player
 from domain.models.round import Round
 from domain.models.tournament import Tournament
 from domain.ports.player_repository import IPlayerRepository
-from infra.utils.round_utils import round_with_loaded_players
+from domain.ports.tournament_repository import MatchRecord
+from infra.utils.match_utils import get_match_player_ids, get_player_id
+from infra.utils.pairing_engine import SwissPairingEngine, get_color_history
+from infra.utils.round_utils import get_round_player_ids, round_with_loaded_players
+from infra.utils.standings import Standings
+
+
+def get_tournament_player_ids(tournament: Tournament) -> Set[str]:
+    """Return the IDs of every player registered in the tournament or involved in its rounds."""
+    player_ids = {get_player_id(player) for player in tournament.players}
+    for chess_round in tournament.rounds:
+        player_ids.update(get_round_player_ids(chess_round))
+    return player_ids
+
+
+def iter_match_records_from_dicts(tournaments_data: Iterable[dict]) -> Iterator[MatchRecord]:
+    """Yield the match records of raw tournament dictionaries, without building any model."""
+    for tournament_data in tournaments_data:
+        tournament_id = tournament_data.get("tournament_id")
+        for round_number, round_data in enumerate(tournament_data.get("rounds", []), 1):
+            for match_data in round_data.get("matches", []):
+                yield (
+                    tournament_id, round_number,
+                    match_data["player1_id"], match_data["player2_id"],
+                    match_data.get("player1_score", 0.0), match_data.get("player2_score", 0.0),
+                    round_data.get("end_datetime") is not None
+                )
 
 
 def tournament_with_loaded_players(
         tournament: Tournament,
-        player_repository: IPlayerRepository
+        player_repository: IPlayerRepository,
+        players_by_id: Optional[Dict[str, Player]] = None
 ) -> Tournament:
     """
     Return a new Tournament instance with players and rounds fully resolved from their IDs.
+
+    Every player ID of the tournament is gathered first, then resolved with a
+    single repository call, unless players_by_id is already provided by the caller.
     """
+    if players_by_id is None:
+        players_by_id = player_repository.get_many(get_tournament_player_ids(tournament))
+
     loaded_players: List[Player] = []
     for player_id in tournament.players:
-        player = player_repository.get_by_id(player_id)
+        player = players_by_id.get(get_player_id(player_id))
         if player:
             loaded_players.append(player)
     loaded_rounds: List[Round] = []
     for chess_round in tournament.rounds:
-        loaded_rounds. append(round_with_loaded_players(
+        loaded_rounds.append(round_with_loaded_players(
             chess_round,
-            player_repository
+            player_repository,
+            players_by_id
         ))
     return Tournament(
         name=tournament.name,
@@ -40,78 +74,134 @@ def tournament_with_loaded_players(
         players=loaded_players,
         scores=tournament.scores,
         description=tournament.description,
-        tournament_id=tournament.tournament_id
+        tournament_id=tournament.tournament_id,
+        version=tournament.version
     )
 
 
+def apply_tournament_updates(
+        tournament: Tournament,
+        name: Optional[str] = None,
+        location: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        number_of_rounds: Optional[int] = None,
+        current_round_number: Optional[int] = None,
+        rounds: Optional[List[Round]] = None,
+        players: Optional[List[Player]] = None,
+        scores: Optional[Dict[str, float]] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None
+) -> None:
+    """Apply the given field updates to a tournament, in place. Fields left to None are unchanged."""
+    if name is not None:
+        tournament.name = name
+    if location is not None:
+        tournament.location = location
+    if start_date is not None:
+        tournament.start_date = start_date
+    if end_date is not None:
+        tournament.end_date = end_date
+    if number_of_rounds is not None:
+        tournament.number_of_rounds = number_of_rounds
+    if current_round_number is not None:
+        tournament.current_round_number = current_round_number
+    if rounds is not None:
+        tournament.rounds = rounds
+    if players is not None:
+        tournament.players = players
+    if scores is not None:
+        tournament.scores = scores
+    if description is not None:
+        tournament.description = description
+    if status is not None:
+        tournament.status = status
+
+
+def get_played_pairs(tournament: Tournament) -> Set[FrozenSet[str]]:
+    """
+    Build the index of player pairs that have already met in this tournament.
+
+    Each pair is stored as a frozenset of the two national chess IDs, so a
+    rematch check is a single set lookup. Matches may hold either Player
+    instances or ID strings; both are normalized to IDs.
+    """
+    return {
+        frozenset(get_match_player_ids(match))
+        for round_instance in tournament.rounds
+        for match in round_instance.matches
+    }
+
+
 def have_played_before(
         player1: Player,
         player2: Player,
-        tournament: Tournament
+        tournament: Tournament,
+        played_pairs: Optional[Set[FrozenSet[str]]] = None
 ) -> bool:
     """
     Check whether two players have already played against each other in
     this tournament, based on their national chess id.
+
+    Args:
+        player1 (Player): First player.
+        player2 (Player): Second player.
+        tournament (Tournament): The tournament whose rounds are checked.
+        played_pairs (Set[FrozenSet[str]], optional): Index built by
+            get_played_pairs. Built on the fly when not provided.
     """
-    id1 = player1.national_chess_id
-    id2 = player2.national_chess_id
+    if played_pairs is None:
+        played_pairs = get_played_pairs(tournament)
 
-    for round_instance in tournament.rounds:
-        for match in round_instance.matches:
-            p1_id, p2_id = match.get_players()
-            if {p1_id, p2_id} == {id1, id2}:
-                return True
-    return False
+    return frozenset((player1.national_chess_id, player2.national_chess_id)) in played_pairs
 
 
 def create_pairs_for_next_round(
         tournament: Tournament,
-        player_repository: IPlayerRepository
+        player_repository: IPlayerRepository,
+        standings: Optional[Standings] = None
 ) -> List[Tuple[Player, Player]]:
     """
     Creates pairs for the next round of the tournament.
-    Returns a list of (Player, Player) tuples.
+    Returns a list of (Player, Player) tuples, the first player playing white.
+
+    Pairing is delegated to the Swiss pairing engine, which avoids rematches
+    and balances colors (see infra.utils.pairing_engine). Players are ranked
+    by points, then tie-breaks, from the given standings; they are built from
+    the rounds of the tournament when not provided.
     """
 
     # Ensure all players are full Player objects
+    players_by_id = player_repository.get_many(
+        p for p in tournament.players if not isinstance(p, Player)
+    )
     players: List[Player] = [
-        p if isinstance(p, Player) else player_repository.get_by_id(p)
+        p if isinstance(p, Player) else players_by_id.get(p)
         for p in tournament.players
     ]
+    players_by_id.update({player.national_chess_id: player for player in players})
+
+    if standings is None:
+        standings = Standings.from_tournament(tournament)
 
-    # Sort players by descending score
     if tournament.current_round_number == 1:
         # First round: pair players randomly
         shuffle(players)
     else:
-        # Other rounds: sort players by descending score
-        players.sort(key=lambda p: tournament.scores[p.national_chess_id], reverse=True)
-
-    pairs: List[Tuple[Player, Player]] = []
-    paired: set[str] = set()  # Track already paired player IDs
-
-    for i, player in enumerate(players):
-        if player.national_chess_id in paired:
-            continue
-
-        # Search for an opponent who has not yet been paired nor played against.
-        for opponent in players[i+1:]:
-            if opponent.national_chess_id in paired:
-                continue
-            if not have_played_before(player, opponent, tournament):
-                pairs.append((player, opponent))
-                paired.add(player.national_chess_id)
-                paired.add(opponent.national_chess_id)
-                break
-        else:
-            # If no suitable new opponent found, pair with any available player
-            for opponent in players[i+1:]:
-                if opponent.national_chess_id not in paired:
-                    pairs.append((player, opponent))
-                    paired.update(
-                        {player.national_chess_id,
-                         opponent.national_chess_id}
-                    )
-                    break
-
-    return pairs
+        # Other rounds: sort players by standings (points, then tie-breaks)
+        ranks = {
+            standing.player_id: rank for rank, standing in enumerate(standings.ranking())
+        }
+        players.sort(key=lambda p: ranks.get(p.national_chess_id, len(ranks)))
+
+    engine = SwissPairingEngine(
+        scores=standings.scores(),
+        played_pairs=get_played_pairs(tournament),
+        color_history=get_color_history(tournament.rounds)
+    )
+    id_pairs = engine.pair([player.national_chess_id for player in players])
+
+    return [
+        (players_by_id[white_id], players_by_id[black_id])
+        for white_id, black_id in id_pairs
+    ]
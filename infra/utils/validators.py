@@ -5,13 +5,17 @@ Used across CLI views to ensure clean and consistent data entry.
 
 import re
 from datetime import datetime
+from typing import Any, List, Optional
+
+_NAME_PATTERN = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ0-9\- ]+")
+_NATIONAL_CHESS_ID_PATTERN = re.compile(r"[A-Z]{2}\d{5}")
 
 
 def is_valid_name(name: str) -> bool:
     """
     Check if the name contains only letters, spaces, or hyphens.
     """
-    return bool(re.fullmatch(r"[A-Za-zÀ-ÖØ-öø-ÿ0-9\- ]+", name))
+    return bool(_NAME_PATTERN.fullmatch(name))
 
 
 def is_valid_date(date_str: str) -> bool:
@@ -33,9 +37,55 @@ def is_valid_number(value: str, min_value: int = 1, max_value: int = 10) -> bool
 
 def is_valid_national_chess_id(national_chess_id: str) -> bool:
     """Check if the national chess ID matches format: 2 uppercase letters + 5 digits."""
-    return bool(re.fullmatch(r"[A-Z]{2}\d{5}", national_chess_id))
+    return bool(_NATIONAL_CHESS_ID_PATTERN.fullmatch(national_chess_id))
 
 
 def is_valid_tournament_id(tournament_id: str) -> bool:
     """Check if the tournament ID matches the format: 'T' followed by 3 digits."""
     return bool(re.fullmatch(r"T\d{3}", tournament_id))
+
+
+PLAYER_FIELDS = ("last_name", "first_name", "birth_date", "national_chess_id")
+
+
+def validate_player_rows(rows: List[Any]) -> List[Optional[str]]:
+    """
+    Check a batch of player records, as read from an import file.
+
+    The patterns are compiled once, and each distinct birth date of the
+    batch is parsed only once: large files repeat the same dates a lot.
+
+    Args:
+        rows (List[Any]): Records to check, expected to be dictionaries
+            holding the four player fields as strings.
+
+    Returns:
+        List[Optional[str]]: For each row, the reason why it is rejected,
+            or None if it is valid.
+    """
+    valid_dates = {}
+    errors = []
+    for row in rows:
+        if not isinstance(row, dict):
+            errors.append("Enregistrement illisible.")
+            continue
+        missing = [field for field in PLAYER_FIELDS if not isinstance(row.get(field), str) or not row[field]]
+        if missing:
+            errors.append(f"Champ manquant ou vide : {', '.join(missing)}.")
+            continue
+
+        birth_date = row["birth_date"]
+        if birth_date not in valid_dates:
+            valid_dates[birth_date] = is_valid_date(birth_date)
+
+        if not _NAME_PATTERN.fullmatch(row["last_name"]):
+            errors.append(f"Nom invalide : {row['last_name']!r}.")
+        elif not _NAME_PATTERN.fullmatch(row["first_name"]):
+            errors.append(f"Prénom invalide : {row['first_name']!r}.")
+        elif not valid_dates[birth_date]:
+            errors.append(f"Date de naissance invalide : {birth_date!r} (format JJ-MM-AAAA).")
+        elif not _NATIONAL_CHESS_ID_PATTERN.fullmatch(row["national_chess_id"]):
+            errors.append(f"Identifiant national invalide : {row['national_chess_id']!r} (format AB12345).")
+        else:
+            errors.append(None)
+    return errors
@@ -1,17 +1,38 @@
 """Entry point."""
+import sys
+
 from domain.views.main_menu_view import MainMenuView
 from infra.repositories.json_player_repository import JSONPlayerRepository
 from infra.repositories.json_tournament_repository import JSONTournamentRepository
+from infra.repositories.unit_of_work import UnitOfWork
+from infra.utils.schema import SchemaError
 
 
 def main():
     # Repositories are instantiated here to allow easy replacement of the
     # persistence layer in the future (e.g. switch from JSON to SQLite)
 
-    MainMenuView(
-        player_repository=JSONPlayerRepository(),
-        tournament_repository=JSONTournamentRepository()
-    ).run()
+    player_repository = JSONPlayerRepository(cached=True)
+    tournament_repository = JSONTournamentRepository()
+
+    try:
+        # Check the players and the fields of each tournament up front, so that
+        # a malformed file is reported here rather than in the middle of a menu.
+        # Rounds are only decoded, and checked, when first accessed: a malformed
+        # round is then reported by the same handler.
+        player_repository.load_players()
+        tournament_repository.load_tournaments()
+
+        MainMenuView(
+            player_repository=player_repository,
+            tournament_repository=tournament_repository,
+            unit_of_work=UnitOfWork(
+                player_repository=player_repository,
+                tournament_repository=tournament_repository
+            )
+        ).run()
+    except SchemaError as error:
+        sys.exit(f"Fichier de données invalide : {error}")
 
 
 if __name__ == "__main__":